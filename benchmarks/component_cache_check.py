@@ -0,0 +1,139 @@
+# benchmarks/component_cache_check.py
+"""
+Kiểm tra đường cài component từ cache (`shacnify cache warm` rồi `add`) với registry fixture.
+
+Chạy: python benchmarks/component_cache_check.py
+Registry là thư mục benchmarks/fixtures/registry (styles/default/<tên>.json), HOME riêng, npm/npx/node giả lập.
+Kiểm tra: warm kéo theo registryDependencies, file được ghi đúng thư mục theo compilerOptions.paths
+của dự án, import của registry được đổi sang alias, dependency được gom vào một lần cài,
+và alias không phân giải được thì component được giao cho shadcn thay vì ghi bừa.
+Thoát với mã lỗi 1 nếu có kiểm tra thất bại.
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+SRC_DIR = ROOT.parent / "src"
+STUB_SCRIPT = ROOT / "stubs" / "toolchain.py"
+FIXTURES = ROOT / "fixtures"
+
+# tsconfig có chú thích và dấu phẩy thừa, như file do các template sinh ra
+TSCONFIG = """{
+  // alias của shadcn
+  "compilerOptions": {
+    "baseUrl": ".",
+    "paths": { %s },
+  },
+}
+"""
+
+def _sandbox(root):
+    """HOME riêng và npm/npx/node giả lập; phải được thiết lập trước khi import shacnify."""
+    home, bin_dir = root / "home", root / "bin"
+    home.mkdir()
+    bin_dir.mkdir()
+    STUB_SCRIPT.chmod(0o755)
+    for tool in ("npm", "npx", "node"):
+        (bin_dir / tool).symlink_to(STUB_SCRIPT)
+    os.environ.update(
+        HOME=str(home),
+        USERPROFILE=str(home),
+        PATH=f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+        STUB_FIXTURES=str(FIXTURES),
+        STUB_CALL_LOG=str(root / "calls.log"),
+        SHACNIFY_NO_DAEMON="1",
+    )
+    sys.path.insert(0, str(SRC_DIR))
+
+def _project(root, name, paths, aliases=None, config="tsconfig.json"):
+    """Một dự án Vite với components.json và file cấu hình chứa `paths`; trả về đường dẫn dự án."""
+    project = root / name
+    shutil.copytree(FIXTURES / "vite", project)
+    components_json = {"style": "default", "tsx": True, "aliases": aliases or {"components": "@/components", "utils": "@/lib/utils"}}
+    (project / "components.json").write_text(json.dumps(components_json), encoding="utf-8")
+    (project / config).write_text(TSCONFIG % paths, encoding="utf-8")
+    return project
+
+def main():
+    if sys.platform == "win32":
+        print("npm/npx/node giả lập dùng symlink, chỉ chạy trên Linux/macOS.")
+        return 1
+
+    root = Path(tempfile.mkdtemp(prefix="shacnify-cache-"))
+    failures = []
+
+    def check(label, ok):
+        print(f"{'OK  ' if ok else 'FAIL'} {label}")
+        if not ok:
+            failures.append(label)
+
+    cwd = os.getcwd()
+    try:
+        _sandbox(root)
+        from shacnify.core import component_cache
+        from shacnify.core.component_installer import install_components
+        from shacnify.core.config_manager import set_config_value
+
+        set_config_value("registry_url", str(FIXTURES / "registry"))
+        calls = root / "calls.log"
+
+        # 1. '@/*' -> './src/*': warm, ghi file, đổi import, gom dependency
+        os.chdir(_project(root, "src-alias", '"@/*": ["./src/*"]'))
+        warmed = component_cache.warm(["form", "use-mobile"])
+        check("warm kéo theo registryDependencies",
+              warmed == {"form": True, "use-mobile": True, "button": True, "label": True, "utils": True})
+        check("installable", component_cache.installable(["form", "use-mobile"]) == ["form", "use-mobile"])
+        calls.write_text("", encoding="utf-8")
+        check("install_from_cache", component_cache.install_from_cache(["form", "use-mobile"]))
+        written = ["src/components/ui/form.tsx", "src/components/ui/button.tsx", "src/components/ui/label.tsx",
+                   "src/lib/utils.ts", "src/hooks/use-mobile.ts"]
+        check("file được ghi theo compilerOptions.paths", all(Path(path).is_file() for path in written))
+        form = Path("src/components/ui/form.tsx").read_text(encoding="utf-8")
+        check("import của registry được đổi sang alias",
+              "@/registry" not in form and '"@/components/ui/label"' in form and '"@/lib/utils"' in form)
+        installs = [line for line in calls.read_text(encoding="utf-8").splitlines() if line.startswith("npm install")]
+        check("dependency được gom vào một lần cài",
+              len(installs) == 1 and all(pkg in installs[0] for pkg in
+                                         ("react-hook-form", "@radix-ui/react-slot", "@radix-ui/react-label", "clsx")))
+
+        # 2. '@/*' -> './*' (dự án không có thư mục src cho component)
+        os.chdir(_project(root, "root-alias", '"@/*": ["./*"]'))
+        component_cache.install_from_cache(["button"])
+        check("'@/*' -> './*' ghi vào components/ui", Path("components/ui/button.tsx").is_file()
+              and not Path("src/components/ui/button.tsx").exists())
+
+        # 3. paths nằm trong tsconfig.app.json (template Vite mới)
+        os.chdir(_project(root, "app-config", '"@/*": ["./src/*"]', config="tsconfig.app.json"))
+        component_cache.install_from_cache(["button"])
+        check("đọc paths từ tsconfig.app.json", Path("src/components/ui/button.tsx").is_file())
+
+        # 4. alias '~/' có khai báo trong paths
+        tilde = {"components": "~/components", "utils": "~/lib/utils"}
+        os.chdir(_project(root, "tilde-mapped", '"~/*": ["./src/*"]', aliases=tilde))
+        component_cache.install_from_cache(["button"])
+        check("'~/*' -> './src/*'", Path("src/components/ui/button.tsx").is_file() and not Path("~").exists())
+
+        # 5. alias '~/' không phân giải được: không ghi gì, giao cho shadcn
+        os.chdir(_project(root, "tilde-unmapped", '"@/*": ["./src/*"]', aliases=tilde))
+        check("alias không phân giải được thì không installable", component_cache.installable(["button"]) == [])
+        check("install_from_cache không ghi gì", not component_cache.install_from_cache(["button"]) and not Path("~").exists())
+        calls.write_text("", encoding="utf-8")
+        install_components(["button"])
+        check("component được giao cho shadcn add",
+              any(" add " in line and "button" in line.split() for line in calls.read_text(encoding="utf-8").splitlines())
+              and not Path("~").exists())
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(root, ignore_errors=True)
+
+    if failures:
+        print(f"FAIL: {len(failures)} kiểm tra thất bại")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
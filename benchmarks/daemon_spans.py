@@ -0,0 +1,95 @@
+# benchmarks/daemon_spans.py
+"""
+Kiểm tra rằng daemon `shacnify serve` không giữ lại span của các yêu cầu đã xong.
+
+Chạy: python benchmarks/daemon_spans.py [--requests N]
+Daemon chạy trong cùng tiến trình (HOME riêng, npm/npx/node giả lập), nhận một yêu cầu `init --yes`
+rồi N yêu cầu `add` (mỗi lần cài lại một component).
+Thoát với mã lỗi 1 nếu số span còn trong bộ nhớ tăng theo số yêu cầu.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+SRC_DIR = ROOT.parent / "src"
+STUB_SCRIPT = ROOT / "stubs" / "toolchain.py"
+FIXTURES = ROOT / "fixtures"
+
+def _sandbox(root):
+    """HOME riêng và npm/npx/node giả lập; phải được thiết lập trước khi import shacnify."""
+    home, bin_dir = root / "home", root / "bin"
+    home.mkdir()
+    bin_dir.mkdir()
+    STUB_SCRIPT.chmod(0o755)
+    for tool in ("npm", "npx", "node"):
+        (bin_dir / tool).symlink_to(STUB_SCRIPT)
+    os.environ.update(
+        HOME=str(home),
+        USERPROFILE=str(home),
+        PATH=f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+        STUB_FIXTURES=str(FIXTURES),
+        SHACNIFY_NO_DAEMON="1",
+    )
+    sys.path.insert(0, str(SRC_DIR))
+
+def main():
+    parser = argparse.ArgumentParser(description="Kiểm tra span bị giữ lại trong daemon.")
+    parser.add_argument("--requests", type=int, default=50, help="Số yêu cầu `add` gửi tới daemon.")
+    args = parser.parse_args()
+
+    if sys.platform == "win32":
+        print("Daemon dùng Unix socket, chỉ chạy trên Linux/macOS.")
+        return 1
+
+    root = Path(tempfile.mkdtemp(prefix="shacnify-spans-"))
+    try:
+        _sandbox(root)
+        from shacnify import client, tracing
+        from shacnify.core import daemon
+
+        socket_path = root / "daemon.sock"
+        server = threading.Thread(target=daemon.serve, args=(socket_path,), daemon=True)
+        server.start()
+        for _ in range(100):
+            if daemon.is_running(socket_path):
+                break
+            time.sleep(0.05)
+
+        project = root / "app"
+        shutil.copytree(FIXTURES / "vite", project)
+
+        def send(command, arguments):
+            message = {"command": command, "args": arguments, "cwd": str(project), "env": dict(os.environ), "tty": False}
+            result = client.request(message, path=str(socket_path))
+            if not result or not result.get("success"):
+                raise RuntimeError(f"{command} thất bại: {result}")
+            return tracing.span_count()
+
+        counts = [send("init", {"recipe": "auth"})]
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            # Xóa component để mỗi yêu cầu thực sự cài lại nó (có bước, lệnh con và span)
+            for path in (project / "src" / "components" / "ui").glob("button.*"):
+                path.unlink()
+            counts.append(send("add", {"components": ["button"]}))
+        elapsed = time.perf_counter() - start
+        client.request({"command": "shutdown"}, path=str(socket_path))
+        server.join(timeout=5)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print(f"{len(counts)} yêu cầu, {elapsed / args.requests * 1000:.1f}ms/yêu cầu add, "
+          f"span còn lại: đầu {counts[0]}, cao nhất {max(counts)}, cuối {counts[-1]}")
+    if max(counts) > counts[0] or tracing.is_enabled():
+        print("FAIL: daemon giữ lại span giữa các yêu cầu")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+function App() {
+  return <div className="App">Hello</div>;
+}
+
+export default App;
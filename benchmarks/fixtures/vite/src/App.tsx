@@ -0,0 +1,8 @@
+import reactLogo from './assets/react.svg'
+import './App.css'
+
+function App() {
+  return <img src={reactLogo} className="logo react" alt="React logo" />
+}
+
+export default App
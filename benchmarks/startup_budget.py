@@ -0,0 +1,92 @@
+# benchmarks/startup_budget.py
+"""
+Kiểm tra ngân sách khởi động của các lệnh nhẹ bằng `python -X importtime`.
+
+Chạy: python benchmarks/startup_budget.py
+Thoát với mã lỗi 1 nếu một lệnh vượt ngân sách hoặc import các module nặng.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+# `list` và `search` đọc chỉ mục registry từ fixture, không cần mạng
+REGISTRY_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "registry"
+
+# Tổng thời gian import (self time, micro giây) cho phép với mỗi lệnh nhẹ.
+# Thời gian đo được dao động theo máy, nên số lượng module là chỉ số ổn định hơn.
+IMPORT_BUDGET_US = 200_000
+MODULE_BUDGET = 250
+
+CHEAP_COMMANDS = [
+    ["--help"],
+    ["config", "path"],
+    ["config", "view"],
+    ["lang", "get"],
+    ["stats"],
+    ["list"],
+    ["search", "dailog"],
+]
+
+# Các module không bao giờ được import bởi một lệnh nhẹ
+FORBIDDEN_MODULES = [
+    "InquirerPy",
+    "shacnify.core.installer",
+    "shacnify.core.steps",
+    "shacnify.core.planner",
+]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+def measure(args, home):
+    """Chạy một lệnh với -X importtime, trả về (tổng self time, danh sách module)."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), HOME=home, USERPROFILE=home)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "shacnify.cli", *args],
+        env=env, capture_output=True, text=True, encoding="utf-8",
+    )
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            total += int(match.group(1))
+            modules.append(match.group(4))
+    return total, modules
+
+def main():
+    failures = []
+    with tempfile.TemporaryDirectory() as home:
+        config_dir = Path(home) / ".shacnify"
+        config_dir.mkdir()
+        (config_dir / "config.json").write_text(json.dumps({"registry_url": str(REGISTRY_FIXTURE)}), encoding="utf-8")
+        for args in CHEAP_COMMANDS:
+            total, modules = measure(args, home)
+            label = " ".join(args)
+            heavy = {f for f in FORBIDDEN_MODULES for m in modules if m == f or m.startswith(f + ".")}
+            status = "OK"
+            if total > IMPORT_BUDGET_US:
+                failures.append(f"'{label}' import mất {total / 1000:.1f}ms (ngân sách {IMPORT_BUDGET_US / 1000:.0f}ms)")
+                status = "OVER BUDGET"
+            if len(modules) > MODULE_BUDGET:
+                failures.append(f"'{label}' import {len(modules)} module (ngân sách {MODULE_BUDGET})")
+                status = "OVER BUDGET"
+            if heavy:
+                failures.append(f"'{label}' import các module nặng: {', '.join(sorted(heavy))}")
+                status = "HEAVY IMPORTS"
+            print(f"{label:<15} {total / 1000:8.1f}ms  {len(modules):4d} modules  {status}")
+
+        logs_dir = Path(home) / ".shacnify" / "logs"
+        if logs_dir.exists():
+            failures.append("Các lệnh nhẹ không được tạo thư mục log")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
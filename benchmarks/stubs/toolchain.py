@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# benchmarks/stubs/toolchain.py
+"""
+Bộ công cụ giả lập npm, npx, node và shadcn cho benchmark chạy không cần mạng.
+
+Script được gọi qua các symlink tên `npm`, `npx`, `node`, `shadcn` và chọn hành vi theo tên đó.
+Các biến môi trường điều chỉnh hành vi:
+  STUB_LATENCY_MS     độ trễ (ms) thêm vào mỗi lần gọi, giả lập mạng/đĩa chậm
+  STUB_OUTPUT_LINES   số dòng log in ra stdout mỗi lần gọi, giả lập npm nhiều output
+  STUB_FIXTURES       thư mục chứa dự án mẫu (mặc định: benchmarks/fixtures)
+  STUB_CALL_LOG       nếu có, mỗi lần gọi được ghi thêm một dòng vào file này
+  STUB_FAIL_COMPONENTS  các component (ngăn cách bởi dấu phẩy) mà `shadcn add` không cài được;
+                        các component khác trong cùng lệnh vẫn được ghi ra trước khi lệnh thất bại
+"""
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+FIXTURES = Path(os.environ.get("STUB_FIXTURES", Path(__file__).resolve().parent.parent / "fixtures"))
+STUB_VERSION = "2.3.0"
+
+def _simulate_work(tool, args):
+    log = os.environ.get("STUB_CALL_LOG")
+    if log:
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(f"{tool} {' '.join(args)}\n")
+    latency = int(os.environ.get("STUB_LATENCY_MS", "0"))
+    if latency:
+        time.sleep(latency / 1000)
+    lines = int(os.environ.get("STUB_OUTPUT_LINES", "0"))
+    if lines:
+        out = sys.stdout
+        for i in range(lines):
+            out.write(f"npm http fetch GET 200 https://registry.npmjs.org/package-{i} {i % 97}ms (cache miss)\n")
+        out.flush()
+
+def _split_spec(spec):
+    """'@scope/name@1.2' -> ('@scope/name', '1.2'); 'name' -> ('name', None)."""
+    head, sep, version = spec[1:].partition("@") if spec.startswith("@") else spec.partition("@")
+    name = ("@" + head) if spec.startswith("@") else head
+    return name, (version if sep else None)
+
+def _read_json(path):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _write_json(path, data):
+    Path(path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+def _install_package(root, name, version):
+    package_dir = root / "node_modules" / name
+    package_dir.mkdir(parents=True, exist_ok=True)
+    _write_json(package_dir / "package.json", {"name": name, "version": version or "1.0.0"})
+    if name == "shadcn":
+        bin_dir = root / "node_modules" / ".bin"
+        bin_dir.mkdir(parents=True, exist_ok=True)
+        link = bin_dir / "shadcn"
+        if not link.exists():
+            link.symlink_to(Path(__file__).resolve())
+
+def npm_install(args):
+    root = Path.cwd()
+    dev = False
+    packages = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--prefix":
+            root = Path(args[i + 1])
+            i += 2
+            continue
+        if arg in ("-D", "--save-dev", "-d"):
+            dev = True
+        elif not arg.startswith("-"):
+            packages.append(arg)
+        i += 1
+
+    root.mkdir(parents=True, exist_ok=True)
+    manifest_path = root / "package.json"
+    manifest = _read_json(manifest_path)
+
+    if not packages:
+        # `npm install` không tham số: cài toàn bộ dependency trong package.json
+        for section in ("dependencies", "devDependencies"):
+            for name, version in manifest.get(section, {}).items():
+                _install_package(root, name, version.lstrip("^~"))
+    else:
+        section = manifest.setdefault("devDependencies" if dev else "dependencies", {})
+        for spec in packages:
+            name, version = _split_spec(spec)
+            _install_package(root, name, version)
+            section[name] = f"^{version or '1.0.0'}"
+        _write_json(manifest_path, manifest)
+
+    lock = {"name": manifest.get("name", root.name), "lockfileVersion": 3, "packages": {"": {"name": manifest.get("name", root.name)}}}
+    modules = root / "node_modules"
+    for manifest_file in sorted(modules.glob("*/package.json")) + sorted(modules.glob("@*/*/package.json")):
+        installed = _read_json(manifest_file)
+        lock["packages"][f"node_modules/{installed['name']}"] = {"version": installed["version"]}
+    _write_json(root / "package-lock.json", lock)
+    return 0
+
+def scaffold(framework, target):
+    """Sao chép dự án mẫu, giống như create-vite / create-next-app / create-react-app."""
+    target = Path(target)
+    if target.exists():
+        print(f"Target directory {target} is not empty", file=sys.stderr)
+        return 1
+    shutil.copytree(FIXTURES / framework, target)
+    manifest = _read_json(target / "package.json")
+    manifest["name"] = target.name
+    _write_json(target / "package.json", manifest)
+    return 0
+
+def shadcn(args):
+    if not args or args[0] != "add":
+        print(f"shadcn {STUB_VERSION}")
+        return 0
+    ui_dir = Path("src") / "components" / "ui"
+    ui_dir.mkdir(parents=True, exist_ok=True)
+    failing = set(filter(None, os.environ.get("STUB_FAIL_COMPONENTS", "").split(",")))
+    failed = False
+    for name in args[1:]:
+        if name.startswith("-"):
+            continue
+        if name in failing:
+            print(f"Failed to add {name}", file=sys.stderr)
+            failed = True
+            continue
+        (ui_dir / f"{name}.tsx").write_text(f"export function {name.title().replace('-', '')}() {{ return null }}\n", encoding="utf-8")
+    return 1 if failed else 0
+
+def npm(args):
+    command = args[0] if args else ""
+    if command == "view":
+        print(STUB_VERSION)
+        return 0
+    if command in ("install", "i", "add"):
+        return npm_install(args[1:])
+    if command == "create" and len(args) >= 3 and args[1].startswith("vite"):
+        return scaffold("vite", args[2])
+    if command in ("--version", "-v"):
+        print("10.8.2")
+        return 0
+    return 0
+
+def npx(args):
+    if not args:
+        return 1
+    package, rest = args[0], args[1:]
+    name, _ = _split_spec(package)
+    if name == "create-next-app":
+        return scaffold("nextjs", rest[0])
+    if name == "create-react-app":
+        return scaffold("cra", rest[0])
+    if name == "shadcn":
+        return shadcn(rest)
+    return 0
+
+def node(args):
+    if args and args[0] in ("-v", "--version"):
+        print("v20.11.0")
+    return 0
+
+def main():
+    tool = Path(sys.argv[0]).name
+    args = sys.argv[1:]
+    _simulate_work(tool, args)
+    handler = {"npm": npm, "npx": npx, "node": node, "shadcn": shadcn}.get(tool)
+    if handler is None:
+        print(f"unknown stub tool: {tool}", file=sys.stderr)
+        return 127
+    return handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
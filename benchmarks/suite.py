@@ -0,0 +1,292 @@
+# benchmarks/suite.py
+"""
+Bộ benchmark chạy hoàn toàn offline với npm/npx/node giả lập (benchmarks/stubs).
+
+Đo:
+  - thời gian end-to-end của `create` và `init` cho Vite, Next.js và CRA
+    (kể cả init lặp lại không có gì để làm và create từ snapshot)
+  - thời gian khởi động CLI của từng lệnh con
+  - thông lượng của t(), get_config_value() và tìm kiếm trong chỉ mục registry
+  - bộ nhớ đỉnh của run_command khi lệnh in ra rất nhiều output
+
+Chạy:
+  python benchmarks/suite.py                          # ghi benchmarks/results/<commit>.json
+  python benchmarks/suite.py --quick                  # ít lần lặp hơn
+  python benchmarks/suite.py --latency-ms 200 --output-lines 5000
+  python benchmarks/suite.py --compare benchmarks/results/<commit cũ>.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+STUB_SCRIPT = Path(__file__).resolve().parent / "stubs" / "toolchain.py"
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+FRAMEWORKS = ["vite", "nextjs", "cra"]
+SUBCOMMANDS = ["create", "init", "add", "config", "lang", "cache", "tools", "stats", "list", "search"]
+RECIPE = "auth"
+
+# Số dòng output cho phép đo bộ nhớ của run_command
+RUN_COMMAND_LINES = 200_000
+RUN_COMMAND_LINES_QUICK = 20_000
+
+class Sandbox:
+    """HOME riêng và thư mục bin chứa npm/npx/node giả lập, để benchmark không chạm vào máy thật."""
+    def __init__(self, latency_ms, output_lines):
+        self.root = Path(tempfile.mkdtemp(prefix="shacnify-bench-"))
+        self.home = self.root / "home"
+        self.bin = self.root / "bin"
+        self.work = self.root / "work"
+        for directory in (self.home, self.bin, self.work):
+            directory.mkdir()
+        STUB_SCRIPT.chmod(0o755)
+        for tool in ("npm", "npx", "node"):
+            (self.bin / tool).symlink_to(STUB_SCRIPT)
+        # Chỉ mục registry được đọc từ fixture thay vì tải từ ui.shadcn.com
+        (self.home / ".shacnify").mkdir()
+        (self.home / ".shacnify" / "config.json").write_text(
+            json.dumps({"registry_url": str(FIXTURES / "registry")}), encoding="utf-8")
+        self.env = dict(
+            os.environ,
+            HOME=str(self.home),
+            USERPROFILE=str(self.home),
+            PATH=f"{self.bin}{os.pathsep}{os.environ.get('PATH', '')}",
+            PYTHONPATH=str(SRC_DIR),
+            STUB_LATENCY_MS=str(latency_ms),
+            STUB_OUTPUT_LINES=str(output_lines),
+            STUB_FIXTURES=str(FIXTURES),
+            COLUMNS="120",
+        )
+
+    def shacnify(self, *args, cwd=None, check=True):
+        """Chạy CLI trong sandbox. Trả về thời gian thực (giây)."""
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "shacnify.cli", *args],
+            cwd=cwd or self.work, env=self.env, stdin=subprocess.DEVNULL,
+            capture_output=True, text=True, encoding="utf-8", errors="replace",
+        )
+        elapsed = time.perf_counter() - start
+        if check and result.returncode != 0:
+            raise RuntimeError(f"shacnify {' '.join(args)} thất bại:\n{result.stdout}\n{result.stderr}")
+        return elapsed
+
+    def python(self, code):
+        """Chạy một đoạn Python trong sandbox và trả về stdout đã parse JSON."""
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=self.work, env=self.env,
+            capture_output=True, text=True, encoding="utf-8", check=True,
+        )
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def cleanup(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+def _summary(samples):
+    return {
+        "median_s": round(statistics.median(samples), 4),
+        "min_s": round(min(samples), 4),
+        "max_s": round(max(samples), 4),
+        "samples": len(samples),
+    }
+
+# --- Các phép đo ---
+
+def bench_create(sandbox, repeats):
+    results = {}
+    for framework in FRAMEWORKS:
+        cold = []
+        for i in range(repeats):
+            name = f"create-{framework}-{i}"
+            cold.append(sandbox.shacnify("create", name, "--framework", framework, "--recipe", RECIPE, "--yes", "--no-snapshot"))
+            shutil.rmtree(sandbox.work / name)
+
+        # Lần đầu lưu snapshot, các lần sau được sao chép từ snapshot
+        sandbox.shacnify("create", f"seed-{framework}", "--framework", framework, "--recipe", RECIPE, "--yes")
+        warm = []
+        for i in range(repeats):
+            name = f"snapshot-{framework}-{i}"
+            warm.append(sandbox.shacnify("create", name, "--framework", framework, "--recipe", RECIPE, "--yes"))
+            shutil.rmtree(sandbox.work / name)
+        shutil.rmtree(sandbox.work / f"seed-{framework}")
+        results[framework] = {"cold": _summary(cold), "from_snapshot": _summary(warm)}
+    return results
+
+def bench_init(sandbox, repeats):
+    results = {}
+    for framework in FRAMEWORKS:
+        first, noop = [], []
+        for i in range(repeats):
+            project = sandbox.work / f"init-{framework}-{i}"
+            shutil.copytree(FIXTURES / framework, project)
+            first.append(sandbox.shacnify("init", "--recipe", RECIPE, "--yes", cwd=project))
+            noop.append(sandbox.shacnify("init", "--yes", cwd=project))
+            shutil.rmtree(project)
+        results[framework] = {"first": _summary(first), "noop": _summary(noop)}
+    return results
+
+def bench_startup(sandbox, repeats):
+    results = {}
+    for command in [None, *SUBCOMMANDS]:
+        args = [command, "--help"] if command else ["--help"]
+        samples = [sandbox.shacnify(*args) for _ in range(repeats)]
+        results[command or "shacnify"] = _summary(samples)
+    return results
+
+_THROUGHPUT_CODE = """
+import json, time
+from shacnify.i18n.translator import t
+from shacnify.core.config_manager import get_config_value
+from shacnify.core.registry_index import RegistryIndex
+
+def rate(func, n):
+    func()
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return n / (time.perf_counter() - start)
+
+n = {n}
+index = RegistryIndex.from_file({registry_index!r})
+print(json.dumps({{
+    "t_plain_ops_per_s": round(rate(lambda: t('init_done'), n)),
+    "t_format_ops_per_s": round(rate(lambda: t('component_added', component='button'), n)),
+    "get_config_ops_per_s": round(rate(lambda: get_config_value('language', 'en'), n)),
+    "registry_search_ops_per_s": round(rate(lambda: index.search('dailog'), n // 10)),
+}}))
+"""
+
+def bench_throughput(sandbox, iterations):
+    return sandbox.python(_THROUGHPUT_CODE.format(n=iterations, registry_index=str(FIXTURES / "registry" / "index.json")))
+
+_MEMORY_CODE = """
+import json, resource, sys, time
+from shacnify.utils import run_command
+from shacnify import logger
+
+def rss_mb():
+    value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (value / 1024 / 1024) if sys.platform == "darwin" else value / 1024
+
+before = rss_mb()
+producer = "import sys\\nw = sys.stdout.write\\nfor i in range({lines}):\\n    w('line %d: ' % i + 'x' * 100 + '\\\\n')"
+start = time.perf_counter()
+ok = run_command([sys.executable, "-c", producer])
+elapsed = time.perf_counter() - start
+logger.shutdown()
+print(json.dumps({{
+    "lines": {lines},
+    "success": ok,
+    "duration_s": round(elapsed, 3),
+    "baseline_rss_mb": round(before, 1),
+    "peak_rss_mb": round(rss_mb(), 1),
+}}))
+"""
+
+def bench_run_command_memory(sandbox, lines):
+    return sandbox.python(_MEMORY_CODE.format(lines=lines))
+
+# --- Kết quả ---
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def _flatten(data, prefix=""):
+    """{'a': {'b': 1}} -> {'a.b': 1}, để so sánh hai file kết quả."""
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+def compare(old_path, new_results):
+    """In chênh lệch giữa hai lần chạy benchmark (chỉ các chỉ số thời gian, thông lượng và bộ nhớ)."""
+    old = _flatten(json.loads(Path(old_path).read_text(encoding="utf-8"))["results"])
+    new = _flatten(new_results)
+    print(f"\n{'metric':<55} {'old':>12} {'new':>12} {'change':>8}")
+    for key in sorted(old.keys() & new.keys()):
+        if not key.endswith(("median_s", "ops_per_s", "peak_rss_mb")):
+            continue
+        before, after = old[key], new[key]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{key:<55} {before:>12} {after:>12} {change:>+7.1f}%")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline cho shacnify.")
+    parser.add_argument("--quick", action="store_true", help="Ít lần lặp hơn, dùng khi kiểm tra nhanh.")
+    parser.add_argument("--latency-ms", type=int, default=0, help="Độ trễ của mỗi lần gọi npm/npx giả lập.")
+    parser.add_argument("--output-lines", type=int, default=200, help="Số dòng log mỗi lần gọi npm/npx giả lập in ra.")
+    parser.add_argument("--only", choices=["create", "init", "startup", "throughput", "memory"], action="append",
+                        help="Chỉ chạy một số phép đo (có thể lặp lại).")
+    parser.add_argument("--output", help="Đường dẫn file JSON kết quả.")
+    parser.add_argument("--compare", help="File kết quả cũ để so sánh.")
+    args = parser.parse_args()
+
+    if sys.platform == "win32":
+        print("Bộ benchmark cần symlink và module resource, chỉ chạy trên Linux/macOS.")
+        return 1
+
+    repeats = 1 if args.quick else 3
+    selected = set(args.only or ["create", "init", "startup", "throughput", "memory"])
+    sandbox = Sandbox(args.latency_ms, args.output_lines)
+    results = {}
+    try:
+        if "startup" in selected:
+            print("• CLI startup...")
+            results["startup"] = bench_startup(sandbox, repeats * 2)
+        if "throughput" in selected:
+            print("• t() / get_config / registry search throughput...")
+            results["throughput"] = bench_throughput(sandbox, 20_000 if args.quick else 200_000)
+        if "memory" in selected:
+            print("• run_command peak memory...")
+            results["run_command_memory"] = bench_run_command_memory(
+                sandbox, RUN_COMMAND_LINES_QUICK if args.quick else RUN_COMMAND_LINES)
+        if "init" in selected:
+            print("• init end-to-end...")
+            results["init"] = bench_init(sandbox, repeats)
+        if "create" in selected:
+            print("• create end-to-end...")
+            results["create"] = bench_create(sandbox, repeats)
+    finally:
+        sandbox.cleanup()
+
+    commit = _git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {"repeats": repeats, "latency_ms": args.latency_ms, "output_lines": args.output_lines},
+        "results": results,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(json.dumps(results, indent=2))
+    print(f"\nKết quả đã được ghi vào {output}")
+
+    if args.compare:
+        compare(args.compare, results)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
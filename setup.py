@@ -1,5 +1,22 @@
-# setup.py
+import importlib.util
+from pathlib import Path
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+
+class build_py_with_catalogs(build_py):
+    """Biên dịch locales/*.json thành các module catalog lúc build package."""
+
+    def run(self):
+        super().run()
+        # Nạp trực tiếp catalog.py để không phải import cả package khi build
+        spec = importlib.util.spec_from_file_location(
+            "shacnify_catalog", Path("src") / "shacnify" / "i18n" / "catalog.py"
+        )
+        catalog = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(catalog)
+        catalog.compile_catalogs(out_dir=Path(self.build_lib) / "shacnify" / "i18n" / "catalogs")
+
 
 setup(
     name="shacnify",
@@ -7,11 +24,13 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     include_package_data=True,
+    package_data={"shacnify": ["i18n/locales/*.json"]},
     install_requires=[
         "click",
         "rich",
         "inquirerpy",
     ],
+    cmdclass={"build_py": build_py_with_catalogs},
     entry_points={
         "console_scripts": [
             "shacnify=shacnify.cli:main_cli"
@@ -20,4 +39,4 @@ setup(
     author="Hoang Hong Huy",
     author_email="huy.hoanghong.work@gmail.com",
     description="Một tool CLI để tự động hóa cài đặt Shadcn/UI và Tailwind CSS cho dự án React.",
-)
\ No newline at end of file
+)
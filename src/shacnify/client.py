@@ -0,0 +1,132 @@
+# src/shacnify/client.py
+import json
+import os
+import re
+import sys
+
+# Module này được import ở mọi lần chạy CLI, nên chỉ dùng thư viện chuẩn nhẹ;
+# socket chỉ được import khi daemon có vẻ đang chạy.
+SOCKET_PATH = os.environ.get("SHACNIFY_SOCKET") or os.path.join(os.path.expanduser("~"), ".shacnify", "daemon.sock")
+
+_ANSI = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]|\r")
+
+def send(sock, message):
+    """Gửi một thông điệp JSON trên một dòng."""
+    sock.sendall((json.dumps(message, ensure_ascii=False) + "\n").encode('utf-8'))
+
+def connect(path=SOCKET_PATH, timeout=0.5):
+    """Kết nối tới daemon. Trả về socket, hoặc None nếu không có daemon nào đang lắng nghe."""
+    if not hasattr(os, "fork") or not os.path.exists(path):
+        return None
+    import socket
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(os.fspath(path))
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+def _option_value(args, i, name):
+    """Đọc giá trị của '--name value' hoặc '--name=value'. Trả về (giá trị, vị trí tiếp theo)."""
+    arg = args[i]
+    if arg.startswith(f"{name}="):
+        return arg.split("=", 1)[1], i + 1
+    if i + 1 < len(args):
+        return args[i + 1], i + 2
+    return None, i + 1
+
+def to_request(argv):
+    """
+    Đổi dòng lệnh thành yêu cầu cho daemon, hoặc None nếu lệnh phải chạy tại chỗ:
+    lệnh cần hỏi người dùng, dùng tùy chọn mà daemon không hỗ trợ, hoặc xin trợ giúp.
+    """
+    if not argv or argv[0] not in ("add", "init"):
+        return None
+    command, args = argv[0], argv[1:]
+
+    if command == "add":
+        if not args or any(arg.startswith("-") for arg in args):
+            return None
+        return {"command": "add", "args": {"components": args}}
+
+    options = {"recipe": None, "safe": False, "resume": False}
+    assume_yes = dry_run = False
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("--yes", "-y"):
+            assume_yes, i = True, i + 1
+        elif arg == "--dry-run":
+            dry_run, i = True, i + 1
+        elif arg in ("--safe", "--resume"):
+            options[arg[2:]], i = True, i + 1
+        elif arg == "--recipe" or arg.startswith("--recipe="):
+            options["recipe"], i = _option_value(args, i, "--recipe")
+            if options["recipe"] is None:
+                return None
+        else:
+            return None
+
+    if dry_run:
+        return {"command": "plan", "args": options}
+    if not (assume_yes or options["resume"]):
+        # Cần hỏi chọn component và xác nhận kế hoạch: chạy tại chỗ
+        return None
+    return {"command": "init", "args": options}
+
+def request(message, path=SOCKET_PATH, on_event=None):
+    """
+    Gửi một yêu cầu tới daemon và đọc các sự kiện trả về cho đến sự kiện kết quả.
+    Trả về sự kiện kết quả, hoặc None nếu không kết nối được daemon.
+    """
+    sock = connect(path)
+    if sock is None:
+        return None
+    try:
+        send(sock, message)
+        with sock.makefile("r", encoding="utf-8") as events:
+            for line in events:
+                event = json.loads(line)
+                if event.get("event") == "result":
+                    return event
+                if on_event:
+                    on_event(event)
+    finally:
+        sock.close()
+    return {"event": "result", "success": False, "exit_code": 1, "error": "connection closed"}
+
+def _print_output(event):
+    if event.get("event") != "output":
+        return
+    stream = sys.stderr if event.get("stream") == "stderr" else sys.stdout
+    text = event.get("text", "")
+    stream.write(text if stream.isatty() else _ANSI.sub("", text))
+    stream.flush()
+
+def forward(argv):
+    """
+    Chuyển lệnh cho daemon `shacnify serve` nếu có daemon đang chạy và lệnh không cần tương tác.
+    Trả về mã thoát, hoặc None nếu lệnh cần chạy tại chỗ.
+    """
+    if os.environ.get("SHACNIFY_NO_DAEMON"):
+        return None
+    message = to_request(argv)
+    if message is None:
+        return None
+    message.update(cwd=os.getcwd(), env=dict(os.environ), tty=sys.stdout.isatty())
+    try:
+        result = request(message, on_event=_print_output)
+    except KeyboardInterrupt:
+        return 130
+    except (OSError, ValueError) as e:
+        # Yêu cầu đã được gửi đi nên không chạy lại tại chỗ, tránh làm hai lần
+        sys.stderr.write(f"shacnify serve: {e}\n")
+        return 1
+    if result is None:
+        return None
+    if result.get("error"):
+        sys.stderr.write(f"shacnify serve: {result['error']}\n")
+    return result.get("exit_code", 0 if result.get("success") else 1)
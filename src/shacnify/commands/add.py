@@ -0,0 +1,20 @@
+# src/shacnify/commands/add.py
+import click
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..core.installer import add_specific_components
+from ..core import stats
+from .environment import check_environment
+
+console = Console()
+
+@click.command(help=t('cmd_add'))
+@click.argument("components", nargs=-1)
+def add(components):
+    """Thêm một hoặc nhiều component vào dự án đã khởi tạo."""
+    if not check_environment(): return
+    if not components:
+        console.print(f"[cyan]{t('interactive_mode')}[/cyan]")
+    with stats.recording("add") as run:
+        run.success = add_specific_components(components)
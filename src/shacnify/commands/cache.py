@@ -0,0 +1,55 @@
+# src/shacnify/commands/cache.py
+import click
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..core.recipes import RECIPES
+from ..core import component_cache, snapshots
+
+console = Console()
+
+@click.group(help=t('cmd_cache'))
+def cache():
+    """Quản lý cache cục bộ của shacnify."""
+    pass
+
+@cache.command("warm", help=t('cmd_cache_warm'))
+@click.argument("components", nargs=-1)
+@click.option(
+    "--recipe",
+    type=click.Choice(list(RECIPES.keys()), case_sensitive=False),
+    help=t('help_cache_warm_recipe')
+)
+def warm_cache(components, recipe):
+    """Tải trước component vào cache để cài đặt không cần mạng và không cần Node."""
+    selected = list(components)
+    if recipe:
+        selected.extend(RECIPES[recipe])
+    if not selected:
+        console.print(f"[yellow]{t('cache_nothing_to_warm')}[/yellow]")
+        return
+
+    console.print(f"[cyan]{t('cache_warm_start', count=len(selected), registry=component_cache.registry_url())}[/cyan]")
+    results = component_cache.warm(selected)
+    cached = [name for name, success in results.items() if success]
+    console.print(f"[green]✅ {t('cache_warm_done', count=len(cached))}[/green]")
+
+@cache.command("clear", help=t('cmd_cache_clear'))
+def clear_cache():
+    """Xóa cache component."""
+    component_cache.clear()
+    console.print(f"[green]✅ {t('cache_cleared')}[/green]")
+
+@cache.command("prune", help=t('cmd_cache_prune'))
+@click.option(
+    "--older-than",
+    type=int,
+    default=snapshots.DEFAULT_PRUNE_DAYS,
+    show_default=True,
+    help=t('help_cache_prune_older_than')
+)
+@click.option("--all", "remove_all", is_flag=True, help=t('help_cache_prune_all'))
+def prune_cache(older_than, remove_all):
+    """Xóa các snapshot dự án cũ do `shacnify create` tạo ra."""
+    removed = snapshots.prune(older_than_days=older_than, remove_all=remove_all)
+    console.print(f"[green]✅ {t('cache_pruned', count=removed)}[/green]")
@@ -0,0 +1,50 @@
+# src/shacnify/commands/config.py
+import click
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..core.config_manager import get_config, set_config_value, CONFIG_PATH, ConfigValueError
+
+console = Console()
+
+@click.group(help=t('cmd_config'))
+def config():
+    """Xem và quản lý cấu hình của shacnify."""
+    pass
+
+@config.command("view", help=t('cmd_config_view'))
+def view_config():
+    """Xem tất cả các cấu hình hiện tại."""
+    from rich.table import Table
+
+    config_data = get_config()
+    if not config_data:
+        console.print(f"[yellow]{t('config_empty')}[/yellow]")
+        return
+    
+    table = Table(title=t('config_title'))
+    table.add_column("Key", style="cyan")
+    table.add_column("Value", style="magenta")
+
+    for key, value in config_data.items():
+        table.add_row(key, str(value))
+    
+    console.print(table)
+
+@config.command("set", help=t('cmd_config_set'))
+@click.argument("key")
+@click.argument("value")
+def set_config(key, value):
+    """Thiết lập một giá trị cấu hình. Vd: set default_components button,card,input"""
+    try:
+        saved_value = set_config_value(key, value)
+    except ConfigValueError as e:
+        error = t(e.message_key, **e.kwargs)
+        console.print(f"[bold red]❌ {t('config_invalid_value', name=key, error=error)}[/bold red]")
+        return
+    console.print(f"[green]✅ {t('config_saved')} [cyan]{key}[/cyan] = [magenta]{saved_value}[/magenta][/green]")
+
+@config.command("path", help=t('cmd_config_path'))
+def config_path():
+    """Hiển thị đường dẫn đến file config.json."""
+    console.print(f"📄 {t('config_path')} [green]{CONFIG_PATH}[/green]")
@@ -0,0 +1,98 @@
+# src/shacnify/commands/create.py
+import click
+from pathlib import Path
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..core.recipes import RECIPES
+from ..core.installer import create_new_project
+from ..core import stats
+from .environment import check_environment
+
+console = Console()
+
+@click.command(help=t('cmd_create'))
+@click.argument("project_name", required=False)
+@click.option(
+    "--recipe",
+    type=click.Choice(list(RECIPES.keys()), case_sensitive=False),
+    help=t('help_recipe')
+)
+@click.option(
+    "--no-snapshot",
+    is_flag=True,
+    help=t('help_create_no_snapshot')
+)
+@click.option(
+    "--framework",
+    type=click.Choice(["vite", "nextjs", "cra"], case_sensitive=False),
+    help=t('help_create_framework')
+)
+@click.option(
+    "--yes", "-y", "assume_yes",
+    is_flag=True,
+    help=t('help_assume_yes')
+)
+@click.option(
+    "--components",
+    help=t('help_create_components')
+)
+@click.option(
+    "--manifest",
+    type=click.Path(exists=True, dir_okay=False),
+    help=t('help_create_manifest')
+)
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    help=t('help_create_jobs')
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help=t('help_create_cache_dir')
+)
+@click.option(
+    "--report",
+    type=click.Path(dir_okay=False),
+    help=t('help_create_report')
+)
+@click.pass_context
+def create(ctx, project_name, recipe, no_snapshot, framework, assume_yes, components, manifest, jobs, cache_dir, report):
+    """Tạo một dự án React mới từ đầu và cài đặt Shadcn/UI."""
+    if manifest:
+        return _create_from_manifest(ctx, manifest, jobs, cache_dir, report, not no_snapshot)
+    if not project_name:
+        raise click.UsageError(t('create_name_or_manifest'))
+
+    if not check_environment(): return
+    console.print(f"[bold green]🚀 {t('create_start', project_name=project_name)}[/bold green]")
+    if components is not None:
+        components = [c.strip() for c in components.split(",") if c.strip()]
+    with stats.recording("create") as run:
+        run.success = create_new_project(
+            project_name, recipe, use_snapshot=not no_snapshot,
+            framework=framework or ("vite" if assume_yes else None), assume_yes=assume_yes,
+            components=components,
+        )
+    if not run.success:
+        ctx.exit(1)
+
+def _create_from_manifest(ctx, manifest, jobs, cache_dir, report_path, use_snapshot):
+    from ..core import batch
+
+    if not check_environment(): return
+    try:
+        report = batch.create_from_manifest(manifest, jobs=jobs, cache_dir=cache_dir, use_snapshot=use_snapshot)
+    except batch.ManifestError as e:
+        console.print(f"[bold red]❌ {t('manifest_invalid', error=e)}[/bold red]")
+        ctx.exit(2)
+
+    report_path = report_path or Path(manifest).with_suffix(".report.json")
+    batch.write_report(report, report_path)
+    console.print(f"[dim]{t('batch_report_written', path=report_path)}[/dim]")
+
+    style = "bold green" if not report["failed"] else "bold yellow"
+    console.print(f"[{style}]{t('batch_summary', succeeded=report['succeeded'], failed=report['failed'], duration=report['duration_s'])}[/{style}]")
+    if report["failed"]:
+        ctx.exit(1)
@@ -0,0 +1,26 @@
+# src/shacnify/commands/environment.py
+import shutil
+from rich.console import Console
+
+from ..logger import get_logger
+from ..i18n.translator import t
+from ..core.package_manager import detect_package_manager
+
+console = Console()
+
+def check_environment():
+    """Kiểm tra xem Node.js và package manager của dự án có trong PATH không."""
+    package_manager = detect_package_manager()
+    missing = next((cmd for cmd in ("node", package_manager.executable) if not shutil.which(cmd)), None)
+    if missing:
+        error_message = t('env_command_missing', command=missing)
+        
+        logger = get_logger()
+        logger.error(f"--- PRE-FLIGHT CHECK FAILED ---")
+        logger.error(error_message)
+
+        console.print(f"[bold red]{t('env_error_title')}[/bold red]")
+        console.print(error_message)
+        console.print(t('env_npm_hint'))
+        return False
+    return True
@@ -0,0 +1,49 @@
+# src/shacnify/commands/init.py
+import click
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..core.recipes import RECIPES
+from ..core.installer import setup_project
+from ..core import stats
+from .environment import check_environment
+
+console = Console()
+
+@click.command(help=t('cmd_init'))
+@click.option(
+    "--recipe",
+    type=click.Choice(list(RECIPES.keys()), case_sensitive=False),
+    help=t('help_recipe')
+)
+@click.option(
+    "--safe",
+    is_flag=True,
+    help=t('help_init_safe')
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help=t('help_init_resume')
+)
+@click.option(
+    "--yes", "-y", "assume_yes",
+    is_flag=True,
+    help=t('help_assume_yes')
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help=t('help_init_dry_run')
+)
+def init(recipe, safe, resume, assume_yes, dry_run):
+    """Khởi tạo Shadcn/UI và Tailwind CSS cho dự án hiện tại."""
+    if dry_run:
+        setup_project(recipe, safe, resume=resume, assume_yes=True, dry_run=True)
+        return
+    if not check_environment(): return
+    console.print(f"[bold cyan]{t('init_start')}[/bold cyan]")
+    if safe and not resume:
+        console.print(f"[yellow]{t('safe_mode_notice')}[/yellow]")
+    with stats.recording("init") as run:
+        run.success = setup_project(recipe, safe, resume=resume, assume_yes=assume_yes)
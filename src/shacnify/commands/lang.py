@@ -0,0 +1,24 @@
+# src/shacnify/commands/lang.py
+import click
+from rich.console import Console
+
+from ..i18n.translator import t, set_language
+
+console = Console()
+
+@click.group(help=t('cmd_lang'))
+def lang():
+    """Quản lý ngôn ngữ của tool."""
+    pass
+
+@lang.command("set", help=t('cmd_lang_set'))
+@click.argument("language_code", type=click.Choice(['en', 'vi']))
+def set_lang_command(language_code):
+    """Đặt ngôn ngữ mặc định (en hoặc vi)."""
+    set_language(language_code)
+    console.print(f"🌍 [green]{t('lang_changed')}[/green]")
+
+@lang.command("get", help=t('cmd_lang_get'))
+def get_lang_command():
+    """Xem ngôn ngữ hiện tại."""
+    console.print(f"🌍 [yellow]{t('lang_current')}[/yellow]")
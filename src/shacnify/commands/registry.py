@@ -0,0 +1,80 @@
+# src/shacnify/commands/registry.py
+import json
+import time
+import click
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..core import registry_index
+from ..core.project_state import component_installed
+
+console = Console()
+
+def _age(seconds):
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h"
+    return f"{int(seconds // 86400)}d"
+
+def _print_items(items, index, title):
+    from rich.table import Table
+
+    table = Table(title=f"[bold cyan]{title}[/bold cyan]")
+    table.add_column(t('registry_column_component'), style="magenta")
+    table.add_column(t('registry_column_installed'), justify="center")
+    table.add_column(t('registry_column_requires'), style="cyan")
+    table.add_column(t('registry_column_description'), style="dim")
+    for item in items:
+        table.add_row(
+            item["name"],
+            "[green]✓[/green]" if component_installed(item["name"]) else "",
+            ", ".join(item["registryDependencies"]),
+            item["description"],
+        )
+    console.print(table)
+
+    source = t('registry_bundled') if index.origin == "bundled" else index.registry
+    console.print(f"[dim]{t('registry_index_source', count=len(index.items), source=source, age=_age(time.time() - index.checked_at))}[/dim]")
+
+def _print_json(items):
+    click.echo(json.dumps([dict(item, installed=component_installed(item["name"])) for item in items], ensure_ascii=False, indent=2))
+
+@click.command("list", help=t('cmd_list'))
+@click.option("--refresh", is_flag=True, help=t('help_list_refresh'))
+@click.option("--json", "as_json", is_flag=True, help=t('help_json'))
+def list_components(refresh, as_json):
+    """Liệt kê các component có trong registry."""
+    index = None
+    if refresh:
+        try:
+            index = registry_index.refresh()
+            console.print(f"[green]✅ {t('registry_refreshed', count=len(index.items))}[/green]")
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]⚠️  {t('registry_refresh_failed', error=e)}[/yellow]")
+    if index is None:
+        index = registry_index.load(auto_refresh=not refresh)
+
+    items = [index.get(name) for name in index.names()]
+    if as_json:
+        _print_json(items)
+        return
+    _print_items(items, index, t('registry_list_title'))
+
+@click.command(help=t('cmd_search'))
+@click.argument("query")
+@click.option("--limit", default=10, show_default=True, help=t('help_search_limit'))
+@click.option("--json", "as_json", is_flag=True, help=t('help_json'))
+def search(query, limit, as_json):
+    """Tìm component trong registry theo tên hoặc mô tả (hỗ trợ gõ gần đúng)."""
+    index = registry_index.load()
+    items = index.search(query, limit=limit)
+    if as_json:
+        _print_json(items)
+        return
+    if not items:
+        console.print(f"[yellow]{t('registry_no_results', query=query)}[/yellow]")
+        return
+    _print_items(items, index, t('registry_search_title', query=query))
+    command = f"shacnify add {items[0]['name']}"
+    console.print(f"[dim]{t('registry_add_hint', command=command)}[/dim]")
@@ -0,0 +1,41 @@
+# src/shacnify/commands/serve.py
+import os
+import click
+from rich.console import Console
+
+from ..i18n.translator import t
+from .. import client
+
+console = Console()
+
+@click.command(help=t('cmd_serve'))
+@click.option(
+    "--socket", "socket_path",
+    type=click.Path(dir_okay=False),
+    default=client.SOCKET_PATH,
+    show_default=True,
+    help=t('help_serve_socket')
+)
+@click.option("--status", is_flag=True, help=t('help_serve_status'))
+@click.option("--stop", is_flag=True, help=t('help_serve_stop'))
+def serve(socket_path, status, stop):
+    """Chạy shacnify như một daemon để các lệnh sau khởi động tức thì."""
+    if not hasattr(os, "fork"):
+        console.print(f"[bold red]❌ {t('serve_unsupported')}[/bold red]")
+        return
+
+    if status or stop:
+        result = client.request({"command": "shutdown" if stop else "ping"}, path=socket_path)
+        if result is None:
+            console.print(f"[yellow]{t('serve_not_running')}[/yellow]")
+        elif stop:
+            console.print(f"[green]{t('serve_stop_requested')}[/green]")
+        else:
+            console.print(f"[green]{t('serve_running', pid=result['data']['pid'], path=socket_path)}[/green]")
+        return
+
+    # Giữ màu cho output gửi về client, kể cả khi daemon được chạy nền không có terminal.
+    # Phải đặt trước khi nạp các module tạo Console.
+    os.environ.setdefault("FORCE_COLOR", "1")
+    from ..core import daemon
+    daemon.serve(socket_path)
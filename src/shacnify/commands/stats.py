@@ -0,0 +1,84 @@
+# src/shacnify/commands/stats.py
+import click
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..core import stats as run_stats
+
+console = Console()
+
+_SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+def _sparkline(values):
+    """Vẽ xu hướng thời lượng của các lần chạy gần nhất."""
+    low, high = min(values), max(values)
+    if high - low < 1e-9:
+        return _SPARK_CHARS[0] * len(values)
+    scale = (len(_SPARK_CHARS) - 1) / (high - low)
+    return "".join(_SPARK_CHARS[round((value - low) * scale)] for value in values)
+
+@click.command(help=t('cmd_stats'))
+@click.option("--framework", type=click.Choice(["vite", "nextjs", "cra"]), help=t('help_stats_framework'))
+@click.option("--recent", default=run_stats.RECENT_RUNS, show_default=True, help=t('help_stats_recent'))
+@click.option("--threshold", default=run_stats.REGRESSION_THRESHOLD, show_default=True, help=t('help_stats_threshold'))
+@click.option("--clear", is_flag=True, help=t('help_stats_clear'))
+def stats(framework, recent, threshold, clear):
+    """Thống kê thời gian chạy của create, init và add."""
+    if clear:
+        run_stats.clear()
+        console.print(f"[green]✅ {t('stats_cleared')}[/green]")
+        return
+
+    from rich.table import Table
+
+    step_rows = run_stats.summarize_steps(framework, recent=recent, threshold=threshold)
+    if not step_rows:
+        console.print(f"[yellow]{t('stats_empty')}[/yellow]")
+        return
+
+    table = Table(title=f"[bold cyan]{t('stats_steps_title')}[/bold cyan]")
+    table.add_column(t('stats_step'), style="magenta")
+    table.add_column("Framework", style="cyan")
+    table.add_column(t('stats_runs'), justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column(t('stats_last'), justify="right")
+    table.add_column(t('stats_trend'))
+    table.add_column(t('stats_status'))
+    for row in step_rows:
+        status = "[green]OK[/green]"
+        if row["regression"]:
+            ratio = f"{row['regression']:.2f}"
+            status = f"[bold red]{t('stats_regression', ratio=ratio)}[/bold red]"
+        table.add_row(
+            t(row["step"]), row["framework"], str(row["runs"]),
+            f"{row['p50']:.2f}s", f"{row['p95']:.2f}s", f"{row['last']:.2f}s",
+            _sparkline(row["trend"]), status,
+        )
+    console.print(table)
+
+    command_rows = run_stats.summarize_commands()
+    if command_rows:
+        table = Table(title=f"[bold cyan]{t('stats_commands_title')}[/bold cyan]")
+        table.add_column(t('stats_command'), style="magenta")
+        table.add_column(t('stats_runs'), justify="right")
+        table.add_column(t('stats_failures'), justify="right")
+        table.add_column("p50", justify="right")
+        table.add_column("p95", justify="right")
+        for row in command_rows:
+            failures = f"[red]{row['failures']}[/red]" if row["failures"] else "0"
+            table.add_row(row["program"], str(row["runs"]), failures, f"{row['p50']:.2f}s", f"{row['p95']:.2f}s")
+        console.print(table)
+
+    cache_rows = run_stats.summarize_caches()
+    if cache_rows:
+        table = Table(title=f"[bold cyan]{t('stats_caches_title')}[/bold cyan]")
+        table.add_column("Cache", style="magenta")
+        table.add_column(t('stats_hits'), justify="right", style="green")
+        table.add_column(t('stats_misses'), justify="right", style="yellow")
+        table.add_column(t('stats_hit_rate'), justify="right")
+        for row in cache_rows:
+            total = row["hits"] + row["misses"]
+            rate = f"{row['hits'] / total:.0%}" if total else "-"
+            table.add_row(row["cache"], str(row["hits"]), str(row["misses"]), rate)
+        console.print(table)
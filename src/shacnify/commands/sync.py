@@ -0,0 +1,19 @@
+# src/shacnify/commands/sync.py
+import click
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..core.installer import sync_components
+from ..core import stats
+from .environment import check_environment
+
+console = Console()
+
+@click.command(help=t('cmd_sync'))
+@click.option("--prune", is_flag=True, help=t('help_sync_prune'))
+@click.option("--dry-run", is_flag=True, help=t('help_sync_dry_run'))
+def sync(prune, dry_run):
+    """Cài các component được import trong mã nguồn nhưng chưa có trong dự án."""
+    if not dry_run and not check_environment(): return
+    with stats.recording("sync") as run:
+        run.success = sync_components(prune=prune, dry_run=dry_run)
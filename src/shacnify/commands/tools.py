@@ -0,0 +1,48 @@
+# src/shacnify/commands/tools.py
+import time
+import click
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..core import tools as managed_tools
+
+console = Console()
+
+@click.group(help=t('cmd_tools'))
+def tools():
+    """Quản lý shadcn CLI được ghim phiên bản."""
+    pass
+
+@tools.command("status", help=t('cmd_tools_status'))
+def tools_status():
+    """Xem phiên bản shadcn CLI đang được dùng và các phiên bản đã cài."""
+    from rich.table import Table
+
+    info = managed_tools.status()
+    none = t('tools_none')
+    resolved_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(info["resolved_at"])) if info["resolved_at"] else none
+
+    table = Table(title=t('tools_title'), show_header=False)
+    table.add_column("Key", style="cyan")
+    table.add_column("Value", style="magenta")
+    table.add_row(t('tools_pinned'), info["pinned"] or none)
+    table.add_row(t('tools_resolved'), info["resolved"] or none)
+    table.add_row(t('tools_resolved_at'), resolved_at)
+    table.add_row(t('tools_ttl'), f"{info['ttl_hours']}h")
+    table.add_row(t('tools_installed'), ", ".join(info["installed"]) or none)
+    table.add_row(t('tools_directory'), info["directory"])
+    console.print(table)
+
+@tools.command("update", help=t('cmd_tools_update'))
+def tools_update():
+    """Phân giải lại phiên bản shadcn mới nhất và cài vào thư mục công cụ."""
+    pinned = managed_tools.status()["pinned"]
+    if pinned:
+        console.print(f"[yellow]{t('tools_pinned_notice', version=pinned)}[/yellow]")
+
+    console.print(f"[cyan]{t('tools_updating')}[/cyan]")
+    version, success = managed_tools.update()
+    if success:
+        console.print(f"[green]✅ {t('tools_updated', version=version)}[/green]")
+    else:
+        console.print(f"[bold red]❌ {t('tools_update_failed')}[/bold red]")
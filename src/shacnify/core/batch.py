@@ -0,0 +1,222 @@
+# src/shacnify/core/batch.py
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from rich.console import Console
+
+from ..i18n.translator import t
+from ..logger import LOG_DIR
+from .. import tracing
+from .config_manager import CONFIG_DIR, get_config_value
+from .recipes import RECIPES
+from .package_manager import detect_package_manager
+from .installer import project_snapshot_key
+from . import snapshots
+from . import steps
+from . import tools
+
+console = Console()
+
+FRAMEWORKS = ("vite", "nextjs", "cra")
+# Số dự án được tạo cùng lúc nếu cả dòng lệnh lẫn manifest không chỉ định
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+# Cache dùng chung của package manager cho mọi dự án trong một lần tạo hàng loạt
+SHARED_CACHE_DIR = CONFIG_DIR / "npm-cache"
+BATCH_LOG_DIR = LOG_DIR / "batch"
+
+class ManifestError(ValueError):
+    """Manifest không đọc được hoặc không hợp lệ."""
+
+def _read_manifest(path):
+    path = Path(path)
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError as e:
+        raise ManifestError(str(e))
+
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            # PyYAML là dependency tùy chọn, manifest JSON luôn dùng được
+            raise ManifestError(t('manifest_yaml_missing'))
+        try:
+            return yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ManifestError(str(e))
+
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ManifestError(str(e))
+
+def _default_components(recipe):
+    """Giống `steps.select_components` khi không tương tác, nhưng không in gì ra."""
+    recipe = recipe or get_config_value("default_recipe")
+    if recipe in RECIPES:
+        return list(RECIPES[recipe])
+    return list(get_config_value("default_components", steps.DEFAULT_COMPONENTS))
+
+def _project_spec(entry, defaults, index):
+    if isinstance(entry, str):
+        entry = {"name": entry}
+    if not isinstance(entry, dict) or not str(entry.get("name", "")).strip():
+        raise ManifestError(t('manifest_project_name_missing', index=index + 1))
+
+    spec = {**defaults, **entry}
+    name = str(spec["name"]).strip()
+    framework = str(spec.get("framework", "vite")).lower()
+    if framework not in FRAMEWORKS:
+        raise ManifestError(t('manifest_bad_framework', name=name, framework=framework, choices=", ".join(FRAMEWORKS)))
+    recipe = spec.get("recipe")
+    if recipe is not None and recipe not in RECIPES:
+        raise ManifestError(t('manifest_bad_recipe', name=name, recipe=recipe, choices=", ".join(RECIPES)))
+
+    components = spec.get("components")
+    if isinstance(components, str):
+        components = [c.strip() for c in components.split(",") if c.strip()]
+    if components is not None and not (isinstance(components, list) and all(isinstance(c, str) for c in components)):
+        raise ManifestError(t('manifest_bad_components', name=name))
+    if not components:
+        components = _default_components(recipe)
+
+    return {"name": name, "framework": framework, "recipe": recipe, "components": components}
+
+def load_manifest(path):
+    """
+    Đọc manifest (JSON, hoặc YAML nếu có PyYAML) và trả về (danh sách dự án, thiết lập chung).
+    Manifest có thể là một danh sách dự án, hoặc một object với `projects`, `defaults`,
+    `concurrency` và `cache_dir`. Mỗi dự án là một tên hoặc một object với
+    `name`, `framework`, `recipe`, `components`.
+    """
+    data = _read_manifest(path)
+    if isinstance(data, list):
+        data = {"projects": data}
+    if not isinstance(data, dict) or not isinstance(data.get("projects"), list) or not data["projects"]:
+        raise ManifestError(t('manifest_no_projects'))
+
+    defaults = data.get("defaults") or {}
+    if not isinstance(defaults, dict):
+        raise ManifestError(t('manifest_bad_defaults'))
+    defaults.pop("name", None)
+
+    projects = [_project_spec(entry, defaults, i) for i, entry in enumerate(data["projects"])]
+    names = [project["name"] for project in projects]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ManifestError(t('manifest_duplicate_names', names=", ".join(duplicates)))
+
+    concurrency = data.get("concurrency")
+    if concurrency is not None and (isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency < 1):
+        raise ManifestError(t('manifest_bad_concurrency'))
+
+    settings = {"concurrency": concurrency, "cache_dir": data.get("cache_dir")}
+    return projects, settings
+
+def _create_one(project, env, use_snapshot):
+    """Tạo một dự án trong tiến trình con `shacnify create`, ghi toàn bộ output vào file log riêng."""
+    command = [
+        sys.executable, "-m", "shacnify.cli", "create", project["name"],
+        "--framework", project["framework"], "--components", ",".join(project["components"]), "--yes",
+    ]
+    if not use_snapshot:
+        command.append("--no-snapshot")
+
+    BATCH_LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = BATCH_LOG_DIR / f"{project['name']}.log"
+    start = time.perf_counter()
+    with tracing.span(project["name"], "project", framework=project["framework"]) as span, \
+            open(log_path, 'w', encoding='utf-8') as log:
+        try:
+            returncode = subprocess.run(
+                command, env=env, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+            ).returncode
+        except OSError as e:
+            log.write(f"{e}\n")
+            returncode = -1
+        span.set(returncode=returncode)
+
+    return {
+        **project,
+        "success": returncode == 0,
+        "returncode": returncode,
+        "duration_s": round(time.perf_counter() - start, 3),
+        "log": str(log_path),
+    }
+
+def _schedule(projects, use_snapshot):
+    """
+    Chia dự án thành các dự án "mở đường" và các dự án chờ chúng.
+    Các dự án có cùng khóa snapshot chỉ cần dựng từ đầu một lần: dự án đầu tiên chạy trước,
+    các dự án còn lại được sao chép từ snapshot của nó khi nó xong.
+    """
+    if not use_snapshot:
+        return list(projects), {}
+    seeds, followers, seed_of_key = [], {}, {}
+    for project in projects:
+        key = project_snapshot_key(project["framework"], project["components"])
+        if snapshots.has_snapshot(key) or key not in seed_of_key:
+            seed_of_key.setdefault(key, project["name"])
+            seeds.append(project)
+        else:
+            followers.setdefault(seed_of_key[key], []).append(project)
+    return seeds, followers
+
+def create_from_manifest(manifest_path, jobs=None, cache_dir=None, use_snapshot=True):
+    """
+    Tạo tất cả dự án trong manifest mà không hỏi gì, tối đa `jobs` dự án cùng lúc,
+    với một thư mục cache dùng chung cho package manager. Trả về báo cáo dạng dict.
+    """
+    projects, settings = load_manifest(manifest_path)
+    jobs = jobs or settings["concurrency"] or DEFAULT_JOBS
+    cache_dir = Path(cache_dir or settings["cache_dir"] or SHARED_CACHE_DIR).expanduser().resolve()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    env = dict(os.environ, **detect_package_manager().cache_env(cache_dir))
+
+    console.print(f"[bold green]🚀 {t('batch_start', count=len(projects), jobs=jobs)}[/bold green]")
+    console.print(f"[dim]{t('batch_shared_cache', path=cache_dir)}[/dim]")
+
+    started_at = time.time()
+    start = time.perf_counter()
+    if any(project["components"] for project in projects):
+        # shadcn CLI được phân giải và cài một lần tại đây; các tiến trình con dùng lại bản đã cài
+        # thay vì cùng lúc cài nó vào thư mục công cụ dùng chung
+        console.print(f"[dim]{t('batch_preparing_shadcn')}[/dim]")
+        tools.shadcn_command()
+    seeds, followers = _schedule(projects, use_snapshot)
+    results = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        running = {pool.submit(_create_one, project, env, use_snapshot): project for project in seeds}
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                project = running.pop(future)
+                result = future.result()
+                results[project["name"]] = result
+                if result["success"]:
+                    console.print(f"[green]✔ {t('batch_project_done', name=project['name'], duration=result['duration_s'])}[/green]")
+                else:
+                    console.print(f"[red]❌ {t('batch_project_failed', name=project['name'], log=result['log'])}[/red]")
+                # Dự án chờ vẫn chạy dù dự án mở đường thất bại, chỉ là không có snapshot để sao chép
+                for follower in followers.pop(project["name"], []):
+                    running[pool.submit(_create_one, follower, env, use_snapshot)] = follower
+
+    ordered = [results[project["name"]] for project in projects]
+    succeeded = sum(1 for result in ordered if result["success"])
+    return {
+        "manifest": str(Path(manifest_path).resolve()),
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started_at)),
+        "duration_s": round(time.perf_counter() - start, 3),
+        "concurrency": jobs,
+        "cache_dir": str(cache_dir),
+        "succeeded": succeeded,
+        "failed": len(ordered) - succeeded,
+        "projects": ordered,
+    }
+
+def write_report(report, path):
+    Path(path).write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
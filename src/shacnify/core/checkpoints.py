@@ -0,0 +1,92 @@
+# src/shacnify/core/checkpoints.py
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from .project_state import STATE_DIR, file_hash
+
+CHECKPOINT_FILE = STATE_DIR / "checkpoint.json"
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+# Bước đã được hoàn tác sau khi lần init thất bại; được làm lại khi tiếp tục
+ROLLED_BACK = "rolled_back"
+
+class Checkpoint:
+    """
+    Tiến độ của lần init đang chạy dở, lưu trong `.shacnify/checkpoint.json`.
+    Mỗi bước xong được ghi lại cùng hash các file đầu ra của nó, để `init --resume`
+    có thể bỏ qua bước đó nếu đầu ra vẫn còn nguyên vẹn.
+    """
+    def __init__(self, data):
+        self.framework = data["framework"]
+        self.safe = data.get("safe", False)
+        self.components = list(data.get("components", []))
+        self.steps = dict(data.get("steps", {}))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls):
+        """Đọc checkpoint của dự án hiện tại, hoặc None nếu không có lần init nào đang dở."""
+        try:
+            return cls(json.loads(CHECKPOINT_FILE.read_text(encoding='utf-8')))
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    @classmethod
+    def start(cls, framework, safe, components, step_names, previous=None):
+        """Tạo checkpoint cho một lần chạy mới, giữ lại các bước đã xong của lần trước (nếu có)."""
+        steps = {name: {"status": PENDING} for name in step_names}
+        if previous:
+            for name, entry in previous.steps.items():
+                if entry["status"] == DONE:
+                    steps[name] = entry
+        checkpoint = cls({"framework": framework, "safe": safe, "components": components, "steps": steps})
+        checkpoint.save()
+        return checkpoint
+
+    def save(self):
+        STATE_DIR.mkdir(exist_ok=True)
+        data = {"framework": self.framework, "safe": self.safe, "components": self.components, "steps": self.steps}
+        fd, tmp_path = tempfile.mkstemp(dir=STATE_DIR, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, CHECKPOINT_FILE)
+
+    def _set(self, name, entry):
+        # Các bước chạy song song trên nhiều luồng
+        with self._lock:
+            self.steps[name] = entry
+            self.save()
+
+    def mark_done(self, name, outputs=()):
+        self._set(name, {"status": DONE, "outputs": {str(path): file_hash(path) for path in outputs}})
+
+    def mark_failed(self, name, leftovers=()):
+        """`leftovers`: những gì bước đã kịp ghi ra và vẫn còn trên đĩa (vd. một phần các component)."""
+        self._set(name, {"status": FAILED, "leftovers": [str(path) for path in leftovers]})
+
+    def mark_rolled_back(self, name, leftovers=()):
+        """`leftovers`: những gì không hoàn tác được và vẫn còn trên đĩa."""
+        self._set(name, {"status": ROLLED_BACK, "leftovers": [str(path) for path in leftovers]})
+
+    def leftovers(self, name):
+        """Các đường dẫn còn sót lại của một bước chưa xong, chỉ tính những đường dẫn vẫn còn tồn tại."""
+        return [path for path in self.steps.get(name, {}).get("leftovers", []) if Path(path).exists()]
+
+    def is_intact(self, name):
+        """Bước đã xong và mọi file đầu ra của nó vẫn giữ nguyên nội dung như lúc đó."""
+        entry = self.steps.get(name, {})
+        if entry.get("status") != DONE:
+            return False
+        return all(file_hash(path) == digest for path, digest in entry.get("outputs", {}).items())
+
+    def first_unfinished(self):
+        return next((name for name, entry in self.steps.items() if entry["status"] != DONE), None)
+
+    @staticmethod
+    def clear():
+        CHECKPOINT_FILE.unlink(missing_ok=True)
@@ -0,0 +1,341 @@
+# src/shacnify/core/component_cache.py
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import urllib.request
+from pathlib import Path
+from rich.console import Console
+
+from .config_manager import CONFIG_DIR, get_config_value
+from .dependencies import DependencyCollector
+from .registry_index import registry_url
+from ..i18n.translator import t
+from .. import tracing
+
+console = Console()
+
+CACHE_DIR = CONFIG_DIR / "cache" / "components"
+OBJECTS_DIR = CACHE_DIR / "objects"
+INDEX_DIR = CACHE_DIR / "index"
+
+DEFAULT_REGISTRY_VERSION = "latest"
+DEFAULT_STYLE = "default"
+
+# --- Registry ---
+
+def registry_version():
+    return get_config_value("registry_version", DEFAULT_REGISTRY_VERSION)
+
+def project_style():
+    """Đọc style từ components.json của dự án hiện tại."""
+    try:
+        return json.loads(Path("components.json").read_text(encoding='utf-8')).get("style", DEFAULT_STYLE)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return DEFAULT_STYLE
+
+def _fetch_registry_item(name, style):
+    """Tải một registry item (JSON) từ registry từ xa hoặc thư mục cục bộ."""
+    source = registry_url()
+    local_dir = Path(source)
+    if local_dir.is_dir():
+        item_path = local_dir / "styles" / style / f"{name}.json"
+        return json.loads(item_path.read_text(encoding='utf-8'))
+
+    url = f"{source.rstrip('/')}/styles/{style}/{name}.json"
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+# --- Content-addressed store ---
+
+def _atomic_write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def _object_path(digest):
+    return OBJECTS_DIR / digest[:2] / digest
+
+def _store_object(content):
+    data = content.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()
+    path = _object_path(digest)
+    if not path.exists():
+        _atomic_write(path, data)
+    return digest
+
+def _index_path(name, style, version):
+    return INDEX_DIR / version / style / f"{name}.json"
+
+# Metadata đã đọc, theo đường dẫn: (mtime, kích thước, metadata). Giúp các tiến trình chạy lâu
+# (`shacnify serve`) không phải đọc lại index khi nó không đổi.
+_ITEM_MEMO = {}
+
+def get_cached_item(name, style=None, version=None):
+    """Trả về metadata đã cache của một component, hoặc None nếu chưa có."""
+    path = _index_path(name, style or project_style(), version or registry_version())
+    try:
+        st = os.stat(path)
+        memo = _ITEM_MEMO.get(path)
+        if memo and memo[:2] == (st.st_mtime_ns, st.st_size):
+            return memo[2]
+        metadata = json.loads(path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    _ITEM_MEMO[path] = (st.st_mtime_ns, st.st_size, metadata)
+    return metadata
+
+def cache_item(item, style, version):
+    """Lưu nội dung file của registry item vào store, và metadata vào index."""
+    files = []
+    for file in item.get("files", []):
+        if isinstance(file, str):
+            # Registry định dạng cũ không kèm nội dung file
+            raise ValueError(t('cache_item_no_content', component=item.get('name')))
+        files.append({
+            "path": file["path"],
+            "type": file.get("type", item.get("type", "registry:ui")),
+            "target": file.get("target") or "",
+            "sha256": _store_object(file.get("content", "")),
+        })
+
+    metadata = {
+        "name": item["name"],
+        "type": item.get("type", "registry:ui"),
+        "dependencies": item.get("dependencies", []),
+        "devDependencies": item.get("devDependencies", []),
+        "registryDependencies": item.get("registryDependencies", []),
+        "files": files,
+    }
+    _atomic_write(_index_path(item["name"], style, version), json.dumps(metadata, indent=2).encode('utf-8'))
+    return metadata
+
+def _registry_name(dependency):
+    """Chuyển registryDependency về tên component; bỏ qua các URL tới registry khác."""
+    if "/" in dependency or ":" in dependency:
+        return None
+    return dependency
+
+def registry_dependencies(metadata):
+    """Tên các component cùng registry mà một component cần."""
+    return [name for name in map(_registry_name, metadata["registryDependencies"]) if name]
+
+def warm(components, style=None, version=None):
+    """
+    Tải trước các component (và các component chúng phụ thuộc) vào cache.
+    Trả về dict {tên: True/False}.
+    """
+    style = style or project_style()
+    version = version or registry_version()
+    results = {}
+    queue = list(components)
+    while queue:
+        name = queue.pop(0)
+        if name in results:
+            continue
+        try:
+            metadata = cache_item(_fetch_registry_item(name, style), style, version)
+        except Exception as e:
+            console.print(f"   [red]❌ {t('cache_warm_failed', component=name, error=e)}[/red]")
+            results[name] = False
+            continue
+        results[name] = True
+        for dep in metadata["registryDependencies"]:
+            dep_name = _registry_name(dep)
+            if dep_name and dep_name not in results:
+                queue.append(dep_name)
+    return results
+
+def clear():
+    """Xóa toàn bộ cache component."""
+    if CACHE_DIR.exists():
+        shutil.rmtree(CACHE_DIR)
+
+# --- Cài đặt từ cache ---
+
+def _resolve_closure(components, style, version):
+    """
+    Tìm tất cả component cần ghi (kể cả các registryDependencies).
+    Trả về (danh sách metadata, True nếu mọi component đều có trong cache).
+    """
+    items = {}
+    queue = list(components)
+    while queue:
+        name = queue.pop(0)
+        if name in items:
+            continue
+        metadata = get_cached_item(name, style, version)
+        if metadata is None:
+            return [], False
+        items[name] = metadata
+        for dep in metadata["registryDependencies"]:
+            dep_name = _registry_name(dep)
+            if dep_name is None:
+                return [], False
+            queue.append(dep_name)
+    return list(items.values()), True
+
+def _load_aliases():
+    try:
+        data = json.loads(Path("components.json").read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        data = {}
+    aliases = dict(data.get("aliases", {}))
+    aliases.setdefault("components", "@/components")
+    aliases.setdefault("utils", "@/lib/utils")
+    aliases.setdefault("ui", f"{aliases['components']}/ui")
+    aliases.setdefault("lib", aliases["utils"].rsplit("/", 1)[0])
+    aliases.setdefault("hooks", "@/hooks")
+    return aliases
+
+# Chuỗi JSON được giữ nguyên; chú thích và dấu phẩy thừa (được phép trong tsconfig) bị bỏ
+_JSONC_TOKEN = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/|,(?=\s*[}\]])', re.S)
+
+# Các file có thể khai báo compilerOptions.paths; template Vite đặt chúng trong tsconfig.app.json
+_PATH_CONFIGS = ("tsconfig.json", "tsconfig.app.json", "jsconfig.json")
+
+def _read_jsonc(path):
+    """Đọc một file tsconfig/jsconfig (JSON có chú thích), hoặc {} nếu không đọc được."""
+    try:
+        data = json.loads(_JSONC_TOKEN.sub(lambda m: m.group(1) or "", Path(path).read_text(encoding='utf-8')))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _load_path_mappings():
+    """
+    compilerOptions.paths của dự án: danh sách (mẫu, đích đầu tiên đã ghép với baseUrl),
+    lấy từ file cấu hình đầu tiên có khai báo paths.
+    """
+    for filename in _PATH_CONFIGS:
+        options = _read_jsonc(filename).get("compilerOptions")
+        paths = options.get("paths") if isinstance(options, dict) else None
+        if isinstance(paths, dict) and paths:
+            base = str(options.get("baseUrl") or ".")
+            return [
+                (pattern, os.path.join(base, targets[0]))
+                for pattern, targets in paths.items()
+                if isinstance(targets, list) and targets and isinstance(targets[0], str)
+            ]
+    return []
+
+def _inside_project(path):
+    """Đường dẫn tương đối đã chuẩn hóa, hoặc None nếu nó trỏ ra ngoài thư mục dự án."""
+    path = Path(os.path.normpath(path))
+    if path.is_absolute() or path.parts[:1] == ("..",):
+        return None
+    return path
+
+def _alias_to_path(alias, mappings):
+    """
+    Đổi alias của components.json (vd. '@/components/ui') thành thư mục thật, theo compilerOptions.paths
+    như TypeScript: mẫu khớp có tiền tố dài nhất thắng. Trả về None nếu không mẫu nào khớp.
+    """
+    best = None
+    for pattern, target in mappings:
+        prefix, star, suffix = pattern.partition("*")
+        if star:
+            if not (alias.startswith(prefix) and alias.endswith(suffix) and len(alias) >= len(prefix) + len(suffix)):
+                continue
+            resolved = target.replace("*", alias[len(prefix):len(alias) - len(suffix)], 1)
+        elif alias == pattern:
+            resolved = target
+        else:
+            continue
+        if best is None or len(prefix) > best[0]:
+            best = (len(prefix), resolved)
+    return _inside_project(best[1]) if best else None
+
+def _target_path(file, aliases, mappings):
+    """Đường dẫn file sẽ được ghi trong dự án, hoặc None nếu không xác định được."""
+    if file["target"]:
+        # Giống shadcn: '~/' là gốc dự án
+        target = file["target"]
+        return _inside_project(target[2:] if target.startswith("~/") else target)
+    directory = {
+        "registry:ui": aliases["ui"],
+        "registry:lib": aliases["lib"],
+        "registry:hook": aliases["hooks"],
+    }.get(file["type"], aliases["components"])
+    directory = _alias_to_path(directory, mappings)
+    return directory / Path(file["path"]).name if directory else None
+
+def _plan_writes(items, aliases, mappings):
+    """Danh sách (file, đích) của các component, hoặc None nếu có file không xác định được đích."""
+    writes = []
+    for metadata in items:
+        for file in metadata["files"]:
+            target = _target_path(file, aliases, mappings)
+            if target is None:
+                return None
+            writes.append((file, target))
+    return writes
+
+def installable(components, style=None, version=None):
+    """
+    Các component có thể ghi thẳng từ cache: đã được cache đủ (kể cả phụ thuộc) và mọi file đều có
+    đích xác định được qua alias và tsconfig/jsconfig của dự án. Các component còn lại cần shadcn.
+    """
+    style = style or project_style()
+    version = version or registry_version()
+    aliases = _load_aliases()
+    mappings = _load_path_mappings()
+    result = []
+    for component in components:
+        items, complete = _resolve_closure([component], style, version)
+        if complete and _plan_writes(items, aliases, mappings) is not None:
+            result.append(component)
+    return result
+
+def _rewrite_imports(content, aliases):
+    """Đổi các import của registry sang alias trong components.json của dự án."""
+    content = re.sub(r"@/registry/[^/\"']+/ui/", f"{aliases['ui']}/", content)
+    content = re.sub(r"@/registry/[^/\"']+/hooks/", f"{aliases['hooks']}/", content)
+    content = re.sub(r"@/registry/[^/\"']+/lib/utils", aliases["utils"], content)
+    content = re.sub(r"@/registry/[^/\"']+/lib/", f"{aliases['lib']}/", content)
+    content = content.replace("@/lib/utils", aliases["utils"])
+    content = content.replace("@/components/ui/", f"{aliases['ui']}/")
+    return content
+
+def install_from_cache(components, style=None, version=None):
+    """
+    Ghi trực tiếp file của các component từ cache vào dự án, không cần chạy Node.
+    Các npm dependency của component được gom lại và cài trong một lần.
+    Trả về False nếu có component chưa được cache hoặc có file không xác định được đích
+    (khi đó không ghi gì cả).
+    """
+    style = style or project_style()
+    version = version or registry_version()
+    items, complete = _resolve_closure(components, style, version)
+    if not complete:
+        return False
+
+    aliases = _load_aliases()
+    writes = _plan_writes(items, aliases, _load_path_mappings())
+    if writes is None:
+        return False
+
+    for file, target in writes:
+        if target.exists():
+            continue
+        with tracing.span(target.as_posix(), "fs"):
+            content = _object_path(file["sha256"]).read_text(encoding='utf-8')
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(_rewrite_imports(content, aliases), encoding='utf-8')
+
+    deps = DependencyCollector()
+    for metadata in items:
+        deps.add(*metadata["dependencies"])
+        deps.add(*metadata["devDependencies"], dev=True)
+
+    deps.discard_satisfied()
+    return deps.install()
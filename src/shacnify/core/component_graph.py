@@ -0,0 +1,60 @@
+# src/shacnify/core/component_graph.py
+from . import component_cache, registry_index
+from .project_state import component_installed
+
+class ComponentGraph:
+    """
+    Đồ thị phụ thuộc giữa các component của registry, lấy từ chỉ mục registry đã lưu (xem `registry_index`).
+    Khi component đã được cache (`shacnify cache warm`), metadata trong cache được ưu tiên vì nó mới hơn.
+    """
+    def __init__(self, index=None, use_cache=True):
+        if index is None:
+            # Không tải lại chỉ mục ở đây: tra cứu phụ thuộc không được chờ mạng
+            index = registry_index.load(auto_refresh=False).dependencies()
+        self._index = dict(index)
+        self._use_cache = use_cache
+        self._style = None
+        self._version = None
+
+    def names(self):
+        """Tất cả component đã biết, theo thứ tự chữ cái."""
+        return sorted(self._index)
+
+    def dependencies(self, name):
+        """Các component mà `name` cần. Component không có trong chỉ mục được coi là không phụ thuộc gì."""
+        if self._use_cache:
+            if self._style is None:
+                self._style, self._version = component_cache.project_style(), component_cache.registry_version()
+            metadata = component_cache.get_cached_item(name, self._style, self._version)
+            if metadata is not None:
+                return component_cache.registry_dependencies(metadata)
+        return self._index.get(name, [])
+
+    def closure(self, components):
+        """Các component được chọn cùng mọi component chúng phụ thuộc (trực tiếp hoặc gián tiếp)."""
+        return set(self.install_order(components, installed=lambda name: False))
+
+    def install_order(self, components, installed=component_installed):
+        """
+        Mở rộng lựa chọn thành bao đóng phụ thuộc, theo thứ tự topo (phụ thuộc đứng trước),
+        mỗi component xuất hiện đúng một lần. Component mà `installed(name)` trả về True bị bỏ ra.
+        """
+        order = []
+        visited = set()
+
+        def visit(name, path):
+            if name in visited or name in path:
+                # Đã xử lý, hoặc gặp chu trình trong registry: bỏ qua cạnh này
+                return
+            path.add(name)
+            for dep in self.dependencies(name):
+                visit(dep, path)
+            path.discard(name)
+            visited.add(name)
+            order.append(name)
+
+        for comp in components:
+            name = comp.strip()
+            if name:
+                visit(name, set())
+        return [name for name in order if not installed(name)]
@@ -0,0 +1,86 @@
+# src/shacnify/core/component_installer.py
+from rich.console import Console
+
+from ..utils import run_command
+from ..i18n.translator import t
+from . import component_cache, tools
+from .component_graph import ComponentGraph
+from .project_state import component_installed
+from .. import tracing
+
+console = Console()
+
+def _dedupe(component_list):
+    """Loại bỏ component trùng lặp nhưng giữ nguyên thứ tự ban đầu."""
+    seen = set()
+    result = []
+    for comp in component_list:
+        name = comp.strip()
+        if name and name not in seen:
+            seen.add(name)
+            result.append(name)
+    return result
+
+def _add_command(components):
+    return [*tools.shadcn_command(), "add", *components, "-y"]
+
+def _install_one_by_one(components):
+    """Chạy lại từng component để xác định component nào bị lỗi."""
+    results = {}
+    for comp in components:
+        console.print(f"   - {t('component_adding', component=f'[bold magenta]{comp}[/bold magenta]')}")
+        results[comp] = run_command(_add_command([comp]), interactive=True, network=True)
+    return results
+
+def _report(results):
+    for comp, success in results.items():
+        if success:
+            console.print(f"   [green]✅ {t('component_added', component=comp)}[/green]")
+        else:
+            console.print(f"   [red]❌ {t('component_failed', component=comp)}[/red]")
+
+def install_components(component_list):
+    """
+    Cài đặt danh sách component (cùng các component chúng phụ thuộc) bằng một lần gọi shadcn duy nhất.
+    Chỉ khi lần gọi gộp thất bại mới chạy lại từng component chưa có file để tìm ra component lỗi.
+    Component đã được cache (xem `shacnify cache warm`) được cài trực tiếp từ cache.
+    """
+    selected = _dedupe(component_list or [])
+    if not selected:
+        console.print(f"[yellow]{t('no_components_selected')}[/yellow]")
+        return True
+
+    # Thêm các component phụ thuộc, bỏ những component dự án đã có, phụ thuộc được cài trước
+    components = ComponentGraph().install_order(selected)
+    if not components:
+        console.print(f"[green]{t('components_already_installed')}[/green]")
+        return True
+    extra = [comp for comp in components if comp not in selected]
+    if extra:
+        console.print(f"   [dim]{t('components_with_dependencies', components=', '.join(extra))}[/dim]")
+
+    console.print(f"\n[cyan]🚀 {t('components_to_install', count=len(components))} [bold magenta]{', '.join(components)}[/bold magenta][/cyan]")
+
+    results = {}
+
+    # Component đã có trong cache cục bộ được ghi thẳng vào dự án, không cần gọi shadcn,
+    # trừ khi alias của dự án không phân giải được thành thư mục (khi đó shadcn tự xử lý)
+    cached = component_cache.installable(components)
+    tracing.mark("component_cache", hits=len(cached), misses=len(components) - len(cached))
+    if cached:
+        console.print(f"   [dim]{t('installing_from_cache', components=', '.join(cached))}[/dim]")
+        success = component_cache.install_from_cache(cached)
+        results.update({comp: success for comp in cached})
+
+    remaining = [comp for comp in components if comp not in results]
+    if remaining:
+        if run_command(_add_command(remaining), interactive=True, network=True):
+            results.update({comp: True for comp in remaining})
+        else:
+            console.print(f"[yellow]⚠️  {t('batch_install_failed')}[/yellow]")
+            # shadcn có thể đã ghi xong một phần trước khi lỗi: chỉ chạy lại những component còn thiếu file
+            retried = _install_one_by_one([comp for comp in remaining if not component_installed(comp)])
+            results.update({comp: retried.get(comp, True) for comp in remaining})
+
+    _report(results)
+    return all(results.values())
@@ -1,30 +1,187 @@
 # src/shacnify/core/config_manager.py
 import json
+import os
+import re
+import tempfile
+import threading
 from pathlib import Path
 
+from .recipes import RECIPES
+
 CONFIG_DIR = Path.home() / ".shacnify"
 CONFIG_PATH = CONFIG_DIR / "config.json"
 
+# Một phiên bản semver chính xác, vd. 2.3.0 hoặc 2.3.0-canary.1
+EXACT_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+(?:[-+][\w.]+)?$")
+
+class ConfigValueError(ValueError):
+    """
+    Giá trị cấu hình không hợp lệ. Mang key i18n của thông báo thay vì chuỗi đã dịch,
+    vì translator đọc ngôn ngữ từ chính file cấu hình đang được kiểm tra.
+    """
+    def __init__(self, message_key, **kwargs):
+        super().__init__(message_key)
+        self.message_key = message_key
+        self.kwargs = kwargs
+
+def _as_str(value):
+    if isinstance(value, list):
+        raise ConfigValueError('config_error_not_str')
+    return str(value).strip()
+
+def _as_list(value):
+    if isinstance(value, str):
+        value = value.split(',')
+    if not isinstance(value, list):
+        raise ConfigValueError('config_error_not_list')
+    return [str(item).strip() for item in value if str(item).strip()]
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ConfigValueError('config_error_not_int')
+
+def _as_language(value):
+    value = _as_str(value)
+    if value not in ("en", "vi"):
+        raise ConfigValueError('config_error_language')
+    return value
+
+def _as_package_manager(value):
+    value = _as_str(value)
+    if value not in ("npm", "pnpm", "yarn", "bun"):
+        raise ConfigValueError('config_error_package_manager')
+    return value
+
+def _as_tool_version(value):
+    # Phiên bản được ghim phải chính xác: 'latest' nghĩa là không ghim (được phân giải lại theo TTL),
+    # còn range như '^2' không thể dùng làm tên thư mục cài đặt
+    value = _as_str(value)
+    if value and value != "latest" and not EXACT_VERSION_RE.match(value):
+        raise ConfigValueError('config_error_tool_version')
+    return value
+
+def _as_recipe(value):
+    value = _as_str(value)
+    if value not in RECIPES:
+        raise ConfigValueError('config_error_recipe', choices=', '.join(RECIPES))
+    return value
+
+# Kiểu dữ liệu của các key đã biết. Key không có trong bảng giữ nguyên hành vi cũ.
+CONFIG_SCHEMA = {
+    "language": _as_language,
+    "default_components": _as_list,
+    "default_recipe": _as_recipe,
+    "registry_url": _as_str,
+    "registry_version": _as_str,
+    "registry_index_ttl_hours": _as_int,
+    "shadcn_version": _as_tool_version,
+    "tool_version_ttl_hours": _as_int,
+    "package_manager": _as_package_manager,
+    "command_timeout_seconds": _as_int,
+    "command_retries": _as_int,
+    "retry_backoff_seconds": _as_int,
+}
+
+def _coerce(key, value):
+    """Chuyển value về đúng kiểu của key, ném ConfigValueError nếu không hợp lệ."""
+    parser = CONFIG_SCHEMA.get(key)
+    if parser:
+        return parser(value)
+    # Nếu value là chuỗi chứa dấu phẩy, chuyển nó thành list
+    if isinstance(value, str) and ',' in value:
+        return _as_list(value)
+    return value
+
+class ConfigStore:
+    """
+    Cache cấu hình trong tiến trình. Chỉ đọc lại file khi mtime hoặc kích thước thay đổi,
+    và ghi file theo kiểu ghi-ra-file-tạm-rồi-đổi-tên để không tiến trình nào đọc phải file ghi dở.
+    """
+    def __init__(self, path):
+        self.path = Path(path)
+        self._data = None
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def _current_stamp(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read(self):
+        try:
+            raw = json.loads(self.path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if not isinstance(raw, dict):
+            return {}
+
+        data = {}
+        for key, value in raw.items():
+            try:
+                data[key] = _coerce(key, value)
+            except ValueError:
+                # Bỏ qua giá trị sai kiểu thay vì làm hỏng toàn bộ cấu hình
+                continue
+        return data
+
+    def load(self):
+        """Trả về dict cấu hình đã cache, đọc lại nếu file đã thay đổi."""
+        stamp = self._current_stamp()
+        if self._data is not None and stamp == self._stamp:
+            return self._data
+        with self._lock:
+            self._data = self._read()
+            self._stamp = stamp
+        return self._data
+
+    def get(self, key, default=None):
+        return self.load().get(key, default)
+
+    def set(self, key, value):
+        """Kiểm tra, chuẩn hóa và lưu một giá trị."""
+        value = _coerce(key, value)
+        with self._lock:
+            data = dict(self._read())
+            data[key] = value
+            self._write(data)
+        return value
+
+    def _write(self, data):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".config-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(data, indent=2, ensure_ascii=False))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._data = data
+        self._stamp = self._current_stamp()
+
+_store = ConfigStore(CONFIG_PATH)
+
 def ensure_config_exists():
     """Đảm bảo file và thư mục config tồn tại."""
-    CONFIG_DIR.mkdir(exist_ok=True)
     if not CONFIG_PATH.exists():
-        CONFIG_PATH.write_text("{}", encoding='utf-8')
+        _store._write({})
 
 def get_config():
-    """Đọc toàn bộ file config."""
-    ensure_config_exists()
-    try:
-        return json.loads(CONFIG_PATH.read_text(encoding='utf-8'))
-    except json.JSONDecodeError:
-        return {}
+    """Đọc toàn bộ cấu hình (từ cache nếu file chưa thay đổi)."""
+    return dict(_store.load())
+
+def get_config_value(key, default=None):
+    """Đọc một giá trị cấu hình đã được chuẩn hóa kiểu."""
+    return _store.get(key, default)
 
 def set_config_value(key, value):
-    """Lưu một cặp key-value vào file config."""
-    config = get_config()
-    # Nếu value là chuỗi chứa dấu phẩy, chuyển nó thành list
-    if isinstance(value, str) and ',' in value:
-        config[key] = [item.strip() for item in value.split(',')]
-    else:
-        config[key] = value
-    CONFIG_PATH.write_text(json.dumps(config, indent=2, ensure_ascii=False), encoding='utf-8')
\ No newline at end of file
+    """Lưu một cặp key-value vào file config. Ném ConfigValueError nếu giá trị không hợp lệ."""
+    return _store.set(key, value)
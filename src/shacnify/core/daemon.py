@@ -0,0 +1,244 @@
+# src/shacnify/core/daemon.py
+import json
+import os
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from rich.console import Console
+
+from ..client import SOCKET_PATH, connect, send
+from ..i18n import translator
+from ..i18n.translator import t
+from ..utils import set_interactive_allowed
+from .config_manager import get_config
+from .component_graph import ComponentGraph
+from .detector import detect_framework
+from .installer import setup_project, add_specific_components
+from .package_manager import detect_package_manager
+from .project_state import STATE_DIR, installed_components
+from . import stats
+from ..commands.environment import check_environment
+
+console = Console()
+
+# Các file quyết định kết quả `detect`; khi chúng không đổi, kết quả cũ được dùng lại
+_PROJECT_MARKERS = (
+    "package.json", "components.json", "next.config.js", "vite.config.js", "vite.config.ts",
+    "package-lock.json", "pnpm-lock.yaml", "yarn.lock", "bun.lock", "bun.lockb",
+    str(STATE_DIR / "state.json"),
+)
+
+class _EventStream:
+    """
+    Thay thế sys.stdout/sys.stderr trong lúc xử lý một yêu cầu:
+    mọi output được gửi về client dưới dạng sự kiện {"event": "output"}.
+    """
+    def __init__(self, sock, name, tty):
+        self._sock = sock
+        self._name = name
+        self._tty = tty
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def write(self, text):
+        if text and not self.closed:
+            with self._lock:
+                try:
+                    send(self._sock, {"event": "output", "stream": self._name, "text": text})
+                except OSError:
+                    # Client đã ngắt kết nối; yêu cầu vẫn chạy tiếp cho đến khi xong
+                    self.closed = True
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return self._tty
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+class _Session:
+    """Chạy một yêu cầu trong thư mục, biến môi trường và output của client."""
+    def __init__(self, sock, message):
+        self.sock = sock
+        self.cwd = message.get("cwd") or os.getcwd()
+        self.env = message.get("env")
+        tty = bool(message.get("tty", True))
+        self.stdout = _EventStream(sock, "stdout", tty)
+        self.stderr = _EventStream(sock, "stderr", tty)
+
+    def __enter__(self):
+        self._saved = (os.getcwd(), dict(os.environ), sys.stdout, sys.stderr)
+        os.chdir(self.cwd)
+        if self.env is not None:
+            os.environ.clear()
+            os.environ.update(self.env)
+        sys.stdout, sys.stderr = self.stdout, self.stderr
+        translator.refresh()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        cwd, env, sys.stdout, sys.stderr = self._saved
+        os.environ.clear()
+        os.environ.update(env)
+        os.chdir(cwd)
+        return False
+
+class Daemon:
+    """Giữ sẵn các module, cấu hình, catalog ngôn ngữ và metadata registry trong bộ nhớ giữa các yêu cầu."""
+    def __init__(self):
+        self._projects = {}
+        self.handlers = {
+            "ping": self.ping,
+            "detect": self.detect,
+            "plan": self.plan,
+            "init": self.init,
+            "add": self.add,
+        }
+
+    def warm_up(self):
+        get_config()
+        t('init_done')
+        graph = ComponentGraph()
+        for name in graph.names():
+            graph.dependencies(name)
+
+    # --- Các yêu cầu ---
+
+    def ping(self, args):
+        return True, {"pid": os.getpid()}
+
+    def _stamp(self):
+        stamps = []
+        for marker in _PROJECT_MARKERS:
+            try:
+                st = os.stat(marker)
+                stamps.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def detect(self, args):
+        """Framework, package manager và component của dự án; được cache tới khi các file liên quan thay đổi."""
+        cwd = os.getcwd()
+        stamp = self._stamp()
+        cached = self._projects.get(cwd)
+        if cached and cached[0] == stamp:
+            return True, cached[1]
+        info = {
+            "framework": detect_framework(),
+            "package_manager": detect_package_manager().name,
+            "initialized": Path("components.json").exists(),
+            "components": sorted(installed_components()),
+        }
+        self._projects[cwd] = (stamp, info)
+        return True, info
+
+    def plan(self, args):
+        return setup_project(args.get("recipe"), bool(args.get("safe")), resume=bool(args.get("resume")),
+                             assume_yes=True, dry_run=True), None
+
+    def init(self, args):
+        if not check_environment():
+            return False, None
+        console.print(f"[bold cyan]{t('init_start')}[/bold cyan]")
+        with stats.recording("init") as run:
+            run.success = setup_project(args.get("recipe"), bool(args.get("safe")),
+                                        resume=bool(args.get("resume")), assume_yes=True)
+        return run.success, None
+
+    def add(self, args):
+        components = [str(name) for name in args.get("components") or []]
+        if not components:
+            raise ValueError(t('serve_add_needs_components'))
+        if not check_environment():
+            return False, None
+        with stats.recording("add") as run:
+            run.success = add_specific_components(tuple(components))
+        return run.success, None
+
+    def handle(self, sock, message):
+        handler = self.handlers.get(message.get("command"))
+        if handler is None:
+            send(sock, {"event": "result", "success": False, "exit_code": 2,
+                        "error": t('serve_unknown_command', command=message.get("command"))})
+            return
+        try:
+            with _Session(sock, message):
+                success, data = handler(message.get("args") or {})
+            result = {"event": "result", "success": bool(success), "exit_code": 0 if success else 1}
+            if data is not None:
+                result["data"] = data
+        except Exception as e:
+            result = {"event": "result", "success": False, "exit_code": 1, "error": f"{type(e).__name__}: {e}"}
+        send(sock, result)
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            send(self.connection, {"event": "result", "success": False, "exit_code": 2, "error": "invalid JSON"})
+            return
+        if message.get("command") == "shutdown":
+            send(self.connection, {"event": "result", "success": True, "exit_code": 0})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+        try:
+            self.server.daemon.handle(self.connection, message)
+        except OSError:
+            # Client đã đóng kết nối trước khi nhận kết quả
+            pass
+
+class _Server(socketserver.UnixStreamServer):
+    # Thư mục làm việc, biến môi trường và sys.stdout là của cả tiến trình,
+    # nên các yêu cầu được xử lý lần lượt, từng yêu cầu một
+    def __init__(self, path, daemon):
+        self.daemon = daemon
+        super().__init__(path, _Handler)
+
+def is_running(path=SOCKET_PATH):
+    sock = connect(path)
+    if sock is None:
+        return False
+    sock.close()
+    return True
+
+def serve(path=SOCKET_PATH):
+    """Chạy daemon ở foreground cho đến khi nhận yêu cầu shutdown hoặc Ctrl+C. Trả về False nếu không khởi động được."""
+    path = Path(path)
+    if is_running(path):
+        console.print(f"[yellow]{t('serve_already_running', path=path)}[/yellow]")
+        return False
+    # Socket còn sót lại từ một daemon đã dừng đột ngột
+    path.unlink(missing_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    daemon = Daemon()
+    daemon.warm_up()
+    set_interactive_allowed(False)
+
+    # Chỉ chủ sở hữu được kết nối: daemon chạy lệnh trong bất kỳ thư mục nào client gửi tới
+    old_umask = os.umask(0o077)
+    try:
+        server = _Server(str(path), daemon)
+    finally:
+        os.umask(old_umask)
+
+    console.print(f"[bold green]🟢 {t('serve_listening', path=path, pid=os.getpid())}[/bold green]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+        console.print(f"[dim]{t('serve_stopped')}[/dim]")
+    return True
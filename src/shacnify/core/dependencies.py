@@ -0,0 +1,85 @@
+# src/shacnify/core/dependencies.py
+import shlex
+from pathlib import Path
+from rich.console import Console
+
+from ..utils import run_command
+from ..i18n.translator import t
+from .package_manager import detect_package_manager
+from .resolver import DependencyResolver, SUPPORTED_LOCKFILES
+
+console = Console()
+
+class DependencyCollector:
+    """
+    Gom các dependency mà các bước cài đặt khai báo,
+    để cả quá trình init chỉ chạy tối đa một lần cài dev và một lần cài prod.
+    """
+    def __init__(self, package_manager=None):
+        self.dev = []
+        self.prod = []
+        self.package_manager = package_manager
+
+    def add(self, *packages, dev=False):
+        """Khai báo một hoặc nhiều package. Package trùng lặp sẽ bị bỏ qua."""
+        target = self.dev if dev else self.prod
+        for package in packages:
+            if package not in self.dev and package not in self.prod:
+                target.append(package)
+
+    def discard(self, packages):
+        """Bỏ các package đã được cài từ trước khỏi danh sách."""
+        self.dev = [p for p in self.dev if p not in packages]
+        self.prod = [p for p in self.prod if p not in packages]
+
+    def discard_satisfied(self, project_dir="."):
+        """
+        Bỏ các package mà dự án đã có với phiên bản phù hợp (theo package.json,
+        file lock và node_modules). Trả về danh sách các package đã bỏ.
+        Nếu dự án dùng file lock mà resolver không đọc được, không package nào bị bỏ.
+        """
+        if not self:
+            return []
+        manager = self._manager()
+        unread = [
+            lockfile for lockfile in manager.lockfiles
+            if lockfile not in SUPPORTED_LOCKFILES and (Path(project_dir) / lockfile).exists()
+        ]
+        if unread:
+            # Không đọc được file lock thì không kiểm chứng được phiên bản đã cài: cài lại tất cả,
+            # để package manager tự đối chiếu với file lock của nó
+            console.print(f"   - [yellow]⚠️  {t('deps_lockfile_unsupported', lockfile=', '.join(unread), manager=manager.name)}[/yellow]")
+            return []
+        satisfied = DependencyResolver(project_dir).satisfied(self.dev + self.prod)
+        self.discard(satisfied)
+        return satisfied
+
+    def __bool__(self):
+        return bool(self.dev or self.prod)
+
+    def _manager(self):
+        return self.package_manager or detect_package_manager()
+
+    def package_manager_name(self):
+        return self._manager().name
+
+    def commands(self):
+        """Trả về danh sách (loại, argv) sẽ được chạy, theo đúng thứ tự thực thi."""
+        manager = self._manager()
+        commands = []
+        if self.dev:
+            commands.append(("dev", manager.install_command(self.dev, dev=True)))
+        if self.prod:
+            commands.append(("prod", manager.install_command(self.prod)))
+        return commands
+
+    def command_lines(self):
+        """Các lệnh dưới dạng chuỗi, để hiển thị trong kế hoạch."""
+        return [(kind, shlex.join(argv)) for kind, argv in self.commands()]
+
+    def install(self):
+        """Chạy các lệnh cài đặt đã được lên kế hoạch."""
+        for _, command in self.commands():
+            if not run_command(command, network=True):
+                return False
+        return True
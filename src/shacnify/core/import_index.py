@@ -0,0 +1,137 @@
+# src/shacnify/core/import_index.py
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .project_state import STATE_DIR
+from .. import tracing
+
+INDEX_FILE = STATE_DIR / "imports.json"
+INDEX_VERSION = 1
+
+SOURCE_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+# Thư mục không chứa mã nguồn của dự án (hoặc quá lớn để quét)
+SKIP_DIRS = {"node_modules", ".git", ".next", ".shacnify", "dist", "build", "out", "coverage", ".turbo", ".vercel"}
+DEFAULT_UI_ALIAS = "@/components/ui"
+
+def ui_alias():
+    """Alias import của thư mục component, theo components.json của dự án."""
+    try:
+        aliases = json.loads(Path("components.json").read_text(encoding='utf-8')).get("aliases", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        return DEFAULT_UI_ALIAS
+    if aliases.get("ui"):
+        return aliases["ui"]
+    return f"{aliases.get('components', '@/components')}/ui"
+
+def _import_pattern(alias):
+    # Bắt mọi chuỗi dạng '<alias>/<tên>' trong import, export ... from, import() và require()
+    return re.compile(r"""["']""" + re.escape(alias.rstrip("/")) + r"""/([A-Za-z0-9_-]+)(?:\.[jt]sx?)?["']""")
+
+def _scan_dir(directory):
+    """Đọc một thư mục: trả về (các file mã nguồn kèm mtime và kích thước, các thư mục con)."""
+    files, subdirs = [], []
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return files, subdirs
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(SOURCE_EXTENSIONS) and entry.is_file():
+                st = entry.stat()
+                files.append((entry.path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            continue
+    return files, subdirs
+
+def _walk(root, pool):
+    """
+    Liệt kê các file mã nguồn: (đường dẫn tương đối, mtime_ns, kích thước).
+    Các thư mục cùng cấp được đọc song song, vì stat() nhả GIL trong lúc chờ hệ thống file.
+    """
+    # Đường dẫn từ scandir luôn bắt đầu bằng root, cắt chuỗi nhanh hơn nhiều so với os.path.relpath
+    prefix = len(os.path.join(root, ""))
+    level = [root]
+    while level:
+        next_level = []
+        for files, subdirs in pool.map(_scan_dir, level):
+            for path, mtime, size in files:
+                yield path[prefix:].replace(os.sep, "/"), mtime, size
+            next_level.extend(subdirs)
+        level = next_level
+
+class ImportIndex:
+    """
+    Chỉ mục các component mà từng file mã nguồn import, lưu trong `.shacnify/imports.json`.
+    Mỗi file được ghi kèm mtime và kích thước, nên lần quét sau chỉ đọc lại các file đã thay đổi.
+    """
+    def __init__(self, alias, files=None):
+        self.alias = alias
+        # đường dẫn -> [mtime_ns, kích thước, [tên component]]
+        self.files = dict(files or {})
+        self.parsed = 0
+
+    @classmethod
+    def load(cls, alias):
+        """Đọc chỉ mục đã lưu. Chỉ mục hỏng, khác phiên bản hoặc khác alias được bỏ đi."""
+        try:
+            data = json.loads(INDEX_FILE.read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(alias)
+        if data.get("version") != INDEX_VERSION or data.get("alias") != alias:
+            return cls(alias)
+        return cls(alias, data.get("files"))
+
+    def save(self):
+        STATE_DIR.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=STATE_DIR, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"version": INDEX_VERSION, "alias": self.alias, "files": self.files}, f, separators=(",", ":"))
+        os.replace(tmp_path, INDEX_FILE)
+
+    def scan(self, root=".", workers=None):
+        """
+        Cập nhật chỉ mục theo cây thư mục hiện tại: file mới hoặc đã đổi được đọc lại song song,
+        file đã bị xóa được bỏ khỏi chỉ mục. Trả về True nếu chỉ mục có thay đổi.
+        """
+        pattern = _import_pattern(self.alias)
+
+        def parse(path):
+            try:
+                with open(os.path.join(root, path), encoding='utf-8', errors='replace') as f:
+                    return sorted(set(pattern.findall(f.read())))
+            except OSError:
+                return []
+
+        with tracing.span("scan imports", "fs") as span, ThreadPoolExecutor(max_workers=workers) as pool:
+            seen = {}
+            changed = []
+            for path, mtime, size in _walk(root, pool):
+                seen[path] = (mtime, size)
+                entry = self.files.get(path)
+                if entry is None or entry[0] != mtime or entry[1] != size:
+                    changed.append(path)
+
+            removed = [path for path in self.files if path not in seen]
+            for path in removed:
+                del self.files[path]
+
+            for path, names in zip(changed, pool.map(parse, changed)):
+                self.files[path] = [*seen[path], names]
+            self.parsed = len(changed)
+            span.set(files=len(seen), parsed=len(changed))
+        return bool(changed or removed)
+
+    def usage(self):
+        """Tên component -> danh sách file import nó."""
+        used = {}
+        for path, (_, _, names) in self.files.items():
+            for name in names:
+                used.setdefault(name, []).append(path)
+        return used
@@ -7,52 +7,99 @@ import time
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 from .planner import Plan
+from .dependencies import DependencyCollector
+from .scheduler import Step, run_steps
+from .journal import WriteJournal
+from .project_state import ProjectState, UI_DIR, component_file, installed_components
+from .import_index import ImportIndex, ui_alias
+from .checkpoints import Checkpoint, FAILED, ROLLED_BACK
 
 from ..i18n.translator import t
 from ..utils import run_command
+from .. import tracing
 from .detector import detect_framework
+from .package_manager import detect_package_manager
 from . import steps
+from .component_installer import install_components
+from .component_graph import ComponentGraph
+from . import snapshots
+from . import stats
 
 console = Console()
 
-def create_new_project(project_name, recipe=None):
-    """Hỏi người dùng template và tạo dự án React mới."""
+# Các thư mục mà `shadcn add` ghi vào. Khi hoàn tác một lần init thất bại, thư mục nào
+# do chính lần init đó tạo ra thì được xóa cùng các file shadcn đã ghi vào
+SHADCN_OUTPUT_DIRS = (UI_DIR.parent, Path("src") / "lib", Path("src") / "hooks")
+
+def project_snapshot_key(framework, components):
+    """Khóa snapshot của một dự án mới với framework và danh sách component cho trước."""
+    deps = DependencyCollector()
+    steps.declare_all_deps(deps, safe=False)
+    return snapshots.snapshot_key(framework, deps, components)
+
+def create_new_project(project_name, recipe=None, use_snapshot=True, framework=None, assume_yes=False, components=None):
+    """
+    Hỏi người dùng template và tạo dự án React mới.
+    Nếu đã có snapshot cho cùng framework, dependency và component, dự án được sao chép từ snapshot.
+    Với `framework` và `assume_yes=True`, dự án được tạo mà không hỏi gì;
+    `components` (nếu có) được dùng thay cho recipe.
+    """
     if Path(project_name).exists():
-        console.print(f"[bold red]❌ {t('folder_exists').format(project_name=project_name)}[/bold red]")
-        return
+        console.print(f"[bold red]❌ {t('folder_exists', project_name=project_name)}[/bold red]")
+        return False
 
-    framework_choice = inquirer.select(
+    framework_choice = framework or inquirer.select(
         message=t('select_template'),
         choices=[
-            Choice("vite", name="Vite (Nhanh, được khuyên dùng)"),
-            Choice("nextjs", name="Next.js (Full-stack, App Router)"),
-            Choice("cra", name="Create React App (Cũ hơn)"),
+            Choice("vite", name=t('template_vite')),
+            Choice("nextjs", name=t('template_nextjs')),
+            Choice("cra", name=t('template_cra')),
         ],
         default="vite",
     ).execute()
+
+    # Chọn component ngay từ đầu, vì chúng là một phần của khóa snapshot
+    if components is None:
+        components = steps.select_components(recipe, interactive=not assume_yes)
+    key = project_snapshot_key(framework_choice, components)
+
+    snapshot_hit = use_snapshot and snapshots.has_snapshot(key)
+    if use_snapshot:
+        tracing.mark("snapshot", hits=int(snapshot_hit), misses=int(not snapshot_hit))
+
+    if snapshot_hit:
+        console.print(f"\n[cyan]{t('snapshot_restoring')}[/cyan]")
+        clone_stats = snapshots.restore_snapshot(key, project_name)
+        if clone_stats is not None:
+            console.print(f"[dim]{t('snapshot_clone_stats', **clone_stats)}[/dim]")
+            console.print(f"\n[bold green]🎉 {t('init_done')}[/bold green]")
+            return True
+        # Snapshot chỉ là cache: không khôi phục được thì tạo dự án như bình thường
+        console.print(f"[yellow]⚠️  {t('snapshot_restore_failed')}[/yellow]")
     
-    if framework_choice == 'vite':
+    if framework_choice == 'vite' and not assume_yes:
         warning_message = (
-            f"[bold]Khi Vite hỏi:[/bold]\n\n"
+            f"[bold]{t('vite_prompt_intro')}[/bold]\n\n"
             f"   [white on magenta] Install with npm and start now? [/]\n\n"
-            f">>> [bold yellow]Vui lòng chọn 'No' (hoặc bấm N)[/bold yellow] <<<\n\n"
+            f">>> [bold yellow]{t('vite_prompt_answer')}[/bold yellow] <<<\n\n"
             f"[dim]{t('shacnify_will_handle_install')}[/dim]"
         )
-        console.print(Panel(warning_message, title="[bold yellow]⚠️ LƯU Ý QUAN TRỌNG[/bold yellow]", border_style="yellow", expand=False))
-        console.print("[dim]Chuẩn bị trong 2 giây...[/dim]")
+        console.print(Panel(warning_message, title=f"[bold yellow]⚠️ {t('important_notice')}[/bold yellow]", border_style="yellow", expand=False))
+        console.print(f"[dim]{t('preparing')}[/dim]")
         time.sleep(2)
     
+    package_manager = detect_package_manager()
     command_map = {
-        "vite": f"npm create vite@latest {project_name} -- --template react-ts",
-        "nextjs": f"npx create-next-app@latest {project_name}",
-        "cra": f"npx create-react-app {project_name}"
+        "vite": package_manager.create_command("vite@latest", project_name, ["--template", "react-ts"]),
+        "nextjs": package_manager.exec_command("create-next-app@latest", [project_name, f"--use-{package_manager.name}"]),
+        "cra": package_manager.exec_command("create-react-app", [project_name]),
     }
     
-    console.print(f"\n[cyan]STEP 1: {t('creating_project').format(framework=framework_choice.upper())}[/cyan]")
+    console.print(f"\n[cyan]STEP 1: {t('creating_project', framework=framework_choice.upper())}[/cyan]")
     
     if not run_command(command_map[framework_choice], interactive=True):
         console.print(f"[bold red]❌ {t('create_project_failed')}[/bold red]")
-        return
+        return False
 
     project_path = Path(project_name).resolve()
     console.print(f"[green]✅ {t('project_created_successfully')}[/green]")
@@ -60,89 +107,253 @@ def create_new_project(project_name, recipe=None):
     os.chdir(project_path)
     
     console.print(f"\n[cyan]STEP 2: {t('installing_dependencies')}[/cyan]")
-    with console.status(t('running_npm_install'), spinner="dots"):
-        if not run_command("npm install"):
-            console.print(f"[bold red]❌ {t('dependency_install_failed')}[/bold red]")
-            return
-            
+    install_command = package_manager.install_all_command()
+    console.print(f"[dim]{t('running_install', command=' '.join(install_command))}[/dim]")
+    if not run_command(install_command, live=True, network=True):
+        console.print(f"[bold red]❌ {t('dependency_install_failed')}[/bold red]")
+        return False
+
     console.print(f"[green]✅ {t('dependencies_installed')}[/green]")
     
     console.print(f"\n[cyan]STEP 3: {t('setting_up_shadcn')}[/cyan]")
     # Chạy init ở chế độ bình thường (không safe) khi tạo mới
-    setup_project(recipe, safe=False)
+    if not setup_project(recipe, safe=False, components=components, assume_yes=assume_yes):
+        return False
 
+    if use_snapshot and snapshots.save_snapshot(key, project_path, framework_choice, components):
+        console.print(f"[dim]{t('snapshot_saved')}[/dim]")
+    return True
 
-def setup_project(recipe=None, safe=False):
-    """Hàm chính điều phối toàn bộ quá trình cài đặt."""
+
+def _announce_step(name, func):
+    """Bọc một bước để in tiêu đề và kết quả của nó."""
+    def _run():
+        console.print(f"\n[cyan]--- {t(name)} ---[/cyan]")
+        success = func()
+        if success:
+            console.print(f"[green]✅ {t(name)} {t('completed')}[/green]")
+        else:
+            console.print(f"[red]❌ {t(name)} {t('failed')}[/red]")
+        return success
+    return _run
+
+def _checkpointed(checkpoint, name, func, outputs=()):
+    """Bọc một bước để ghi checkpoint khi nó kết thúc."""
+    def _run():
+        success = func()
+        if success:
+            checkpoint.mark_done(name, outputs)
+        else:
+            checkpoint.mark_failed(name)
+        return success
+    return _run
+
+def setup_project(recipe=None, safe=False, components=None, resume=False, assume_yes=False, dry_run=False):
+    """
+    Hàm chính điều phối toàn bộ quá trình cài đặt. Trả về True nếu mọi bước thành công.
+    Với `resume=True`, tiếp tục lần init bị lỗi trước đó từ checkpoint đã lưu.
+    Với `assume_yes=True`, không hỏi xác nhận và dùng component mặc định trong config.
+    Với `dry_run=True`, chỉ hiển thị kế hoạch mà không thay đổi gì.
+    """
     framework = detect_framework()
     if not framework:
         console.print(f"[bold red]❌ {t('error_not_react')}[/bold red]")
-        return
+        return False
         
     console.print(f"   - {t('framework_detected')}: [bold green]{framework.upper()}[/bold green]")
 
-    plan = Plan(framework, safe_mode=safe)
+    checkpoint = None
+    if resume:
+        checkpoint = Checkpoint.load()
+        if checkpoint is None or checkpoint.framework != framework:
+            console.print(f"[yellow]{t('resume_no_checkpoint')}[/yellow]")
+            return False
+        safe, components = checkpoint.safe, checkpoint.components
+        console.print(f"[cyan]{t('resume_from_step', step=t(checkpoint.first_unfinished() or 'add_components'))}[/cyan]")
+
+    # Trạng thái của lần init trước: chỉ làm lại những gì đã thay đổi kể từ đó
+    state = ProjectState.load()
+    package_manager = detect_package_manager()
+
+    if components is None:
+        if not recipe and state.components:
+            components = state.components
+            console.print(f"\n[bold cyan]💡 {t('components_from_state', components=', '.join(components))}[/bold cyan]")
+        else:
+            components = steps.select_components(recipe, interactive=not assume_yes)
+    # Bao đóng phụ thuộc theo thứ tự cài đặt, trừ các component dự án đã có
+    # (kể cả khi lần chạy trước chỉ thêm được một phần)
+    pending_components = ComponentGraph().install_order(components)
+
+    deps = DependencyCollector(package_manager)
+    steps.declare_all_deps(deps, safe=safe)
+    declared_deps = {"dev": list(deps.dev), "prod": list(deps.prod)}
+    deps.discard(state.installed_dependencies(package_manager))
+    with tracing.span("resolve dependencies", "plan"):
+        satisfied = deps.discard_satisfied()
+    if satisfied:
+        console.print(f"   - [dim]{t('deps_already_satisfied', packages=', '.join(satisfied))}[/dim]")
+
+    journal = WriteJournal()
+    with tracing.span("stage changes", "plan"):
+        steps.stage_all_changes(journal, framework, safe=safe)
+
+    if checkpoint:
+        # Bỏ qua các bước đã xong mà đầu ra vẫn còn nguyên vẹn. Các bước khác được lên kế hoạch lại
+        # từ cây thư mục hiện tại (journal so với file đang có, component theo file đang có),
+        # nên phần còn sót lại sau một lần hoàn tác không bị coi là đã xong hay bị ghi đè mù quáng
+        for name in ("apply_changes", "dep_install"):
+            if checkpoint.is_intact(name):
+                console.print(f"   - [dim]{t('resume_step_skipped', step=t(name))}[/dim]")
+        for name, entry in checkpoint.steps.items():
+            if entry["status"] == ROLLED_BACK:
+                console.print(f"   - [dim]{t('resume_step_rolled_back', step=t(name))}[/dim]")
+            leftovers = checkpoint.leftovers(name)
+            if leftovers:
+                console.print(f"   - [yellow]{t('resume_leftovers', step=t(name), paths=', '.join(leftovers))}[/yellow]")
+        if checkpoint.is_intact("dep_install"):
+            deps.discard(set(declared_deps["dev"]) | set(declared_deps["prod"]))
+
+    # Các bước ghi file và cài dependency chạy song song, sau đó mới thêm component
+    parallel_steps = [name for name, needed in (("apply_changes", journal), ("dep_install", deps)) if needed]
+    stages = [stage for stage in (parallel_steps, ["add_components"] if pending_components else []) if stage]
+
+    plan = Plan(framework, safe_mode=safe, dependencies=deps, journal=journal,
+                components=pending_components, state=state,
+                estimate=stats.estimate(framework, stages))
     plan.display()
+    if dry_run:
+        return True
 
     # Nếu không có hành động nào, dừng lại
     if not plan.actions:
-        return
-
-    try:
-        # Câu hỏi xác nhận cuối cùng
-        confirmation = inquirer.confirm(
-            message="Bạn có muốn thực hiện các thay đổi trên không?",
-            default=False
-        ).execute()
-
-        if not confirmation:
-            console.print(f"[yellow]{t('init_aborted')}[/yellow]")
-            return
-    except KeyboardInterrupt:
-        console.print(f"\n[yellow]{t('init_aborted')}[/yellow]")
-        return
-    
-    # Xây dựng danh sách các bước dựa trên kế hoạch (có thể cải tiến sau)
-    # Hiện tại vẫn giữ nguyên các bước để đảm bảo tính đúng đắn
-    install_steps = [
-        ("dep_install", steps.install_tailwind_deps),
-        ("tailwind_config", lambda: steps.configure_tailwind(framework, safe=safe)),
-    ]
+        Checkpoint.clear()
+        return True
+
+    # Khi tiếp tục, người dùng đã xác nhận kế hoạch ở lần chạy trước
+    if not resume and not assume_yes:
+        try:
+            # Câu hỏi xác nhận cuối cùng
+            confirmation = inquirer.confirm(
+                message=t('confirm_changes'),
+                default=False
+            ).execute()
+
+            if not confirmation:
+                console.print(f"[yellow]{t('init_aborted')}[/yellow]")
+                return False
+        except KeyboardInterrupt:
+            console.print(f"\n[yellow]{t('init_aborted')}[/yellow]")
+            return False
     
-    if not safe:
-        install_steps.append(("restructure_src", steps.restructure_src_directory))
+    # Các thay đổi file được áp dụng trong một lượt, song song với bước cài đặt dependency.
+    # Bước nào không còn gì để làm thì không được đưa vào đồ thị.
+    package_files = ("package.json", "node_modules", *package_manager.lockfiles)
 
-    install_steps.extend([
-        ("alias_config", lambda: steps.configure_alias(safe=safe)),
-        ("shadcn_init", lambda: steps.initialize_shadcn(framework)),
-        ("add_components", lambda: steps.add_components_during_init(recipe)),
-    ])
+    install_steps = []
+    outputs = {}
+    if journal:
+        install_steps.append(Step("apply_changes", journal.commit, resources=journal.paths))
+        outputs["apply_changes"] = list(journal.files) + journal.deleted
+    if deps:
+        install_steps.append(Step("dep_install", deps.install, resources=package_files))
+        outputs["dep_install"] = [f"node_modules/{package}/package.json" for package in deps.dev + deps.prod]
 
+    # Bước thêm component cần tất cả các bước trước đã hoàn tất
+    if pending_components:
+        install_steps.append(Step(
+            "add_components", lambda: steps.add_components_during_init(components=pending_components),
+            depends_on=[step.name for step in install_steps],
+            resources=package_files + ("components.json", "src/components"),
+        ))
 
-    for name, func in install_steps:
-        console.print(f"\n[cyan]--- {t(name)} ---[/cyan]")
-        success = func()
-        
-        if success:
-            console.print(f"[green]✅ {t(name)} {t('completed')}[/green]")
-        else:
-            console.print(f"[red]❌ {t(name)} {t('failed')}[/red]")
-            console.print(f"[bold red]❌ {t('step_failed')}[/bold red]")
-            return
+    checkpoint = Checkpoint.start(framework, safe, components, [step.name for step in install_steps], previous=checkpoint)
+    for step in install_steps:
+        step.func = _checkpointed(checkpoint, step.name, _announce_step(step.name, step.func), outputs.get(step.name, ()))
+
+    if run_steps(install_steps):
+        console.print(f"[bold red]❌ {t('step_failed')}[/bold red]")
+        # Đưa các file của dự án về trạng thái trước khi init. Việc ghi file rất nhanh nên
+        # được làm lại khi tiếp tục, còn các dependency đã cài thì được giữ nguyên.
+        if journal:
+            journal.rollback(clean=SHADCN_OUTPUT_DIRS)
+            checkpoint.mark_rolled_back("apply_changes", leftovers=journal.kept)
+            if journal.kept:
+                kept = ", ".join(path.as_posix() for path in journal.kept)
+                console.print(f"[yellow]{t('journal_rolled_back_partial', paths=kept)}[/yellow]")
+            else:
+                console.print(f"[yellow]{t('journal_rolled_back')}[/yellow]")
+        if checkpoint.steps.get("add_components", {}).get("status") == FAILED:
+            # Component shadcn đã kịp ghi và không bị xóa khi hoàn tác (thư mục có từ trước)
+            present = [path for path in map(component_file, pending_components) if path]
+            checkpoint.mark_failed("add_components", leftovers=present)
+        console.print(f"[yellow]{t('resume_hint', command='[cyan]shacnify init --resume[/cyan]')}[/yellow]")
+        return False
+
+    state.record(framework, package_manager, journal, declared_deps, components)
+    state.save()
+    Checkpoint.clear()
     
     console.print(f"\n[bold green]🎉 {t('init_done')}[/bold green]")
+    return True
 
 def add_specific_components(components: tuple):
     """Hàm xử lý cho lệnh 'shacnify add'."""
     if not Path("components.json").exists():
-        console.print("[bold red]❌ Lỗi: Shadcn/UI chưa được khởi tạo.[/bold red]")
-        console.print("   Vui lòng chạy [cyan]shacnify init[/cyan] trước.")
-        return
+        console.print(f"[bold red]❌ {t('shadcn_not_initialized')}[/bold red]")
+        console.print(f"   {t('run_init_first', command='[cyan]shacnify init[/cyan]')}")
+        return False
 
     selected_components = list(components)
 
     if not selected_components:
         selected_components = steps._prompt_for_components()
     
-    steps._install_components(selected_components)
-    console.print(f"\n[bold green]✅ Thêm component hoàn tất![/bold green]")
\ No newline at end of file
+    if install_components(selected_components):
+        console.print(f"\n[bold green]✅ {t('add_done')}[/bold green]")
+        return True
+    console.print(f"\n[bold red]❌ {t('add_partial_failure')}[/bold red]")
+    return False
+
+def sync_components(prune=False, dry_run=False):
+    """
+    Hàm xử lý cho lệnh 'shacnify sync': tìm các component được import trong mã nguồn
+    nhưng chưa có trong dự án và cài chúng trong một lần. Trả về True nếu thành công.
+    """
+    if not Path("components.json").exists():
+        console.print(f"[bold red]❌ {t('shadcn_not_initialized')}[/bold red]")
+        console.print(f"   {t('run_init_first', command='[cyan]shacnify init[/cyan]')}")
+        return False
+
+    index = ImportIndex.load(ui_alias())
+    if index.scan():
+        index.save()
+    console.print(f"[dim]{t('sync_scanned', files=len(index.files), parsed=index.parsed)}[/dim]")
+
+    used = index.usage()
+    installed = installed_components()
+    known = set(ComponentGraph().names())
+    missing = sorted(name for name in used if name not in installed and name in known)
+    unknown = sorted(name for name in used if name not in installed and name not in known)
+
+    for name in unknown:
+        console.print(f"   [yellow]⚠️  {t('sync_unknown_component', component=name, file=used[name][0])}[/yellow]")
+
+    success = True
+    if not missing:
+        console.print(f"[green]✅ {t('sync_nothing_missing')}[/green]")
+    elif dry_run:
+        console.print(f"[cyan]{t('sync_would_install', components=', '.join(missing))}[/cyan]")
+    else:
+        success = install_components(missing)
+
+    if prune:
+        unused = sorted(name for name in installed if name not in used)
+        if unused:
+            console.print(f"\n[bold yellow]{t('sync_unused_title', count=len(unused))}[/bold yellow]")
+            for name in unused:
+                console.print(f"   - {installed[name].as_posix()}")
+            console.print(f"[dim]{t('sync_unused_hint')}[/dim]")
+        else:
+            console.print(f"[green]{t('sync_all_used')}[/green]")
+    return success
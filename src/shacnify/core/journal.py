@@ -0,0 +1,253 @@
+# src/shacnify/core/journal.py
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from rich.console import Console
+
+from ..i18n.translator import t
+from .. import tracing
+
+console = Console()
+
+# Các loại thay đổi có thể ghi vào nhật ký
+WRITE = "write"
+PREPEND = "prepend"
+DELETE = "delete"
+MKDIR = "mkdir"
+RMDIR = "rmdir"
+
+class _Entry:
+    """Một thay đổi đang chờ áp dụng cho một đường dẫn."""
+    def __init__(self, kind, path, description, content=None):
+        self.kind = kind
+        self.path = path
+        self.description = description
+        self.content = content
+        # Trạng thái của đường dẫn trước khi có bất kỳ thay đổi nào, dùng để đặt tên hành động
+        self.existed = path.exists()
+
+    @property
+    def action(self):
+        if self.kind in (DELETE, RMDIR):
+            return "DELETE"
+        if not self.existed:
+            return "CREATE"
+        return "PREPEND" if self.kind == PREPEND else "OVERWRITE"
+
+    @property
+    def target(self):
+        name = self.path.as_posix()
+        return f"{name}/" if self.kind in (MKDIR, RMDIR) else name
+
+def _fsync_dir(directory):
+    """Đồng bộ mục thư mục xuống đĩa. Bỏ qua trên các hệ thống không hỗ trợ (vd. Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class WriteJournal:
+    """
+    Nhật ký ghi file: các bước cài đặt ghi thay đổi vào đây thay vì ghi trực tiếp.
+    `commit()` áp dụng tất cả trong một lượt bằng các phép đổi tên nguyên tử,
+    và `rollback()` đưa dự án về trạng thái ban đầu nếu có lỗi.
+    """
+    def __init__(self):
+        self._entries = {}
+        self._undo = []
+        # Thư mục không xóa được khi hoàn tác vì còn file do bước khác ghi vào
+        self.kept = []
+
+    # --- Ghi nhận thay đổi ---
+
+    def _stage(self, kind, path, description, content=None):
+        path = Path(path)
+        previous = self._entries.get(path)
+        entry = _Entry(kind, path, description, content)
+        if previous:
+            # Nhiều thay đổi trên cùng một đường dẫn được gộp lại, thay đổi sau cùng được giữ
+            entry.existed = previous.existed
+            del self._entries[path]
+        self._entries[path] = entry
+
+    def read_text(self, path):
+        """Đọc nội dung của file, tính cả các thay đổi đang chờ. Trả về None nếu file không tồn tại."""
+        entry = self._entries.get(Path(path))
+        if entry:
+            return entry.content if entry.kind in (WRITE, PREPEND) else None
+        try:
+            return Path(path).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+
+    def write(self, path, content, description):
+        """Tạo mới hoặc ghi đè file. Bỏ qua nếu nội dung không đổi so với file hiện có."""
+        path = Path(path)
+        try:
+            unchanged = path.read_text(encoding='utf-8') == content
+        except (FileNotFoundError, IsADirectoryError):
+            unchanged = False
+        if unchanged:
+            # Các thay đổi đang chờ trước đó (vd. xóa rồi ghi lại cùng nội dung) triệt tiêu nhau
+            self._entries.pop(path, None)
+            return
+        self._stage(WRITE, path, description, content)
+
+    def prepend(self, path, text, description):
+        """Chèn `text` vào đầu file (vd. các directive của Tailwind trong file CSS)."""
+        current = self.read_text(path)
+        content = text if current is None else text + "\n" + current
+        self._stage(PREPEND, path, description, content)
+
+    def delete(self, path, description):
+        path = Path(path)
+        if path.is_file() or path in self._entries:
+            self._stage(DELETE, path, description)
+
+    def mkdir(self, path, description):
+        if not Path(path).is_dir():
+            self._stage(MKDIR, path, description)
+
+    def rmdir_if_empty(self, path, description):
+        """Xóa thư mục nếu sau khi áp dụng các thay đổi, nó không còn chứa gì."""
+        path = Path(path)
+        if not path.is_dir():
+            return
+        deleted = {p for p, e in self._entries.items() if e.kind == DELETE}
+        if all(child in deleted for child in path.iterdir()):
+            self._stage(RMDIR, path, description)
+
+    @property
+    def entries(self):
+        """Danh sách (hành động, đường dẫn, mô tả) theo thứ tự sẽ được áp dụng."""
+        return [(e.action, e.target, e.description) for e in self._entries.values()]
+
+    @property
+    def files(self):
+        """Nội dung cuối cùng của các file sẽ được ghi, theo đường dẫn."""
+        return {str(p): e.content for p, e in self._entries.items() if e.kind in (WRITE, PREPEND)}
+
+    @property
+    def deleted(self):
+        return [str(p) for p, e in self._entries.items() if e.kind == DELETE]
+
+    @property
+    def paths(self):
+        return [str(path) for path in self._entries]
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    # --- Áp dụng ---
+
+    def _makedirs(self, directory, touched):
+        """Tạo thư mục (và các thư mục cha còn thiếu), ghi lại để có thể hoàn tác."""
+        missing = []
+        while not directory.exists():
+            missing.append(directory)
+            directory = directory.parent
+        for d in reversed(missing):
+            d.mkdir()
+            self._undo.append((RMDIR, d, None))
+            touched.add(d.parent)
+
+    def _prepare(self, entry, touched):
+        """Giai đoạn 1: ghi nội dung mới ra file tạm cạnh file đích. Dự án chưa bị thay đổi."""
+        self._makedirs(entry.path.parent, touched)
+        fd, tmp_path = tempfile.mkstemp(dir=entry.path.parent, prefix=f".{entry.path.name}.", suffix=".tmp")
+        self._undo.append((DELETE, Path(tmp_path), None))
+        with tracing.span(entry.path.as_posix(), "fs"), os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(entry.content)
+            f.flush()
+            os.fsync(f.fileno())
+        if entry.path.exists():
+            shutil.copymode(entry.path, tmp_path)
+        return tmp_path
+
+    def _backup(self, path):
+        """Giữ lại nội dung gốc của file trong bộ nhớ trước khi nó bị thay thế."""
+        if path.is_file():
+            self._undo.append((WRITE, path, (path.read_bytes(), path.stat().st_mode)))
+        else:
+            self._undo.append((DELETE, path, None))
+
+    def commit(self):
+        """Áp dụng tất cả thay đổi. Nếu có lỗi, hoàn tác những gì đã làm và trả về False."""
+        self._undo = []
+        touched = set()
+        try:
+            staged = {}
+            for entry in self._entries.values():
+                if entry.kind in (WRITE, PREPEND):
+                    staged[entry.path] = self._prepare(entry, touched)
+                elif entry.kind == MKDIR:
+                    self._makedirs(entry.path, touched)
+
+            # Giai đoạn 2: đổi tên file tạm vào vị trí và thực hiện các thao tác xóa
+            for entry in self._entries.values():
+                if entry.path in staged:
+                    self._backup(entry.path)
+                    os.replace(staged[entry.path], entry.path)
+                elif entry.kind == DELETE and entry.path.is_file():
+                    self._backup(entry.path)
+                    entry.path.unlink()
+                elif entry.kind == RMDIR and entry.path.is_dir() and not any(entry.path.iterdir()):
+                    entry.path.rmdir()
+                    self._undo.append((MKDIR, entry.path, None))
+                touched.add(entry.path.parent)
+
+            with tracing.span("fsync directories", "fs", count=len(touched)):
+                for directory in touched:
+                    _fsync_dir(directory)
+        except OSError as e:
+            console.print(f"[bold red]❌ {t('journal_commit_failed', error=e)}[/bold red]")
+            self.rollback()
+            return False
+        return True
+
+    def _remove_created_dir(self, path, clean):
+        """
+        Xóa một thư mục mà `commit()` đã tạo. Thư mục nằm trong `clean` được xóa cả nội dung:
+        nó chưa tồn tại trước lần commit, nên mọi file trong đó đều do lần chạy này ghi ra (vd. shadcn add).
+        Các thư mục khác còn file thì được giữ lại, đó là trạng thái dở dang có chủ đích chứ không phải lỗi.
+        """
+        if any(path == root or root in path.parents for root in clean):
+            shutil.rmtree(path)
+        elif any(path.iterdir()):
+            self.kept.append(path)
+            console.print(f"[dim]   {t('journal_rollback_kept_dir', path=path.as_posix())}[/dim]")
+        else:
+            path.rmdir()
+
+    def rollback(self, clean=()):
+        """
+        Hoàn tác các thay đổi đã áp dụng, theo thứ tự ngược lại.
+        `clean` là các thư mục mà bước chạy sau commit ghi file vào (xem `_remove_created_dir`).
+        """
+        clean = [Path(root) for root in clean]
+        self.kept = []
+        while self._undo:
+            kind, path, data = self._undo.pop()
+            try:
+                if kind == WRITE:
+                    content, mode = data
+                    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(content)
+                    os.chmod(tmp_path, mode)
+                    os.replace(tmp_path, path)
+                elif kind == DELETE:
+                    path.unlink(missing_ok=True)
+                elif kind == RMDIR:
+                    self._remove_created_dir(path, clean)
+                elif kind == MKDIR:
+                    path.mkdir(exist_ok=True)
+            except OSError as e:
+                console.print(f"[yellow]⚠️  {t('journal_rollback_failed', path=path, error=e)}[/yellow]")
@@ -0,0 +1,114 @@
+# src/shacnify/core/package_manager.py
+import json
+import shutil
+from pathlib import Path
+
+from .config_manager import get_config_value
+
+class PackageManager:
+    """Dịch các thao tác install / exec / create sang lệnh của một package manager cụ thể."""
+    def __init__(self, name, lockfiles, add, dev_flag, exec_prefix, create_prefix, create_separator, cache_env):
+        self.name = name
+        self.lockfiles = lockfiles
+        self._add = add
+        self._dev_flag = dev_flag
+        self._exec_prefix = exec_prefix
+        self._create_prefix = create_prefix
+        # npm cần '--' để chuyển tham số cho template, các package manager khác thì không
+        self._create_separator = create_separator
+        # Biến môi trường chỉ định thư mục cache/store của package manager
+        self._cache_env = cache_env
+
+    @property
+    def executable(self):
+        return self.name
+
+    def is_available(self):
+        return shutil.which(self.executable) is not None
+
+    def install_all_command(self):
+        """Cài toàn bộ dependency trong package.json."""
+        return [self.name, "install"]
+
+    def install_command(self, packages, dev=False):
+        """Thêm các package vào dự án."""
+        command = [self.name, *self._add]
+        if dev:
+            command.append(self._dev_flag)
+        return command + list(packages)
+
+    def exec_command(self, package, args=()):
+        """Chạy một package mà không cài vào dự án (npx, pnpm dlx, bunx...)."""
+        return [*self._exec_prefix, package, *args]
+
+    def create_command(self, template, target, args=()):
+        """Tạo dự án bằng `<pm> create <template>`, vd. template 'vite@latest'."""
+        command = [*self._create_prefix, template, target]
+        if args:
+            if self._create_separator:
+                command.append("--")
+            command.extend(args)
+        return command
+
+    def cache_env(self, directory):
+        """
+        Biến môi trường để dùng chung một thư mục cache giữa nhiều lần cài đặt.
+        Cache của npm luôn được đặt kèm vì npx (mà Yarn cũng dùng) đọc nó.
+        """
+        directory = str(directory)
+        return {"npm_config_cache": directory, self._cache_env: directory}
+
+    def __repr__(self):
+        return f"PackageManager({self.name!r})"
+
+PACKAGE_MANAGERS = {
+    "npm": PackageManager(
+        "npm", ["package-lock.json"], add=["install"], dev_flag="-D",
+        exec_prefix=["npx"], create_prefix=["npm", "create"], create_separator=True, cache_env="npm_config_cache",
+    ),
+    "pnpm": PackageManager(
+        "pnpm", ["pnpm-lock.yaml"], add=["add"], dev_flag="-D",
+        exec_prefix=["pnpm", "dlx"], create_prefix=["pnpm", "create"], create_separator=False, cache_env="npm_config_store_dir",
+    ),
+    "yarn": PackageManager(
+        # Yarn 1 không có `yarn dlx`, nên dùng npx để chạy package
+        "yarn", ["yarn.lock"], add=["add"], dev_flag="-D",
+        exec_prefix=["npx"], create_prefix=["yarn", "create"], create_separator=False, cache_env="YARN_CACHE_FOLDER",
+    ),
+    "bun": PackageManager(
+        "bun", ["bun.lock", "bun.lockb"], add=["add"], dev_flag="-d",
+        exec_prefix=["bunx"], create_prefix=["bun", "create"], create_separator=False, cache_env="BUN_INSTALL_CACHE_DIR",
+    ),
+}
+
+DEFAULT_PACKAGE_MANAGER = "npm"
+
+def _from_package_json(project_dir):
+    """Đọc trường "packageManager" (vd. "pnpm@9.1.0") trong package.json."""
+    try:
+        data = json.loads((project_dir / "package.json").read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    field = data.get("packageManager")
+    if isinstance(field, str):
+        return field.split("@", 1)[0]
+    return None
+
+def detect_package_manager(project_dir="."):
+    """
+    Xác định package manager của dự án theo thứ tự:
+    config `package_manager`, file lock, trường packageManager trong package.json, mặc định npm.
+    """
+    override = get_config_value("package_manager")
+    if override in PACKAGE_MANAGERS:
+        return PACKAGE_MANAGERS[override]
+
+    project_dir = Path(project_dir)
+    for manager in PACKAGE_MANAGERS.values():
+        if any((project_dir / lockfile).exists() for lockfile in manager.lockfiles):
+            return manager
+
+    name = _from_package_json(project_dir)
+    if name in PACKAGE_MANAGERS:
+        return PACKAGE_MANAGERS[name]
+    return PACKAGE_MANAGERS[DEFAULT_PACKAGE_MANAGER]
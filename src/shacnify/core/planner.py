@@ -1,62 +1,88 @@
 # src/shacnify/core/planner.py
-from pathlib import Path
 from rich.table import Table
 from rich.console import Console
 
+from ..i18n.translator import t
+
 console = Console()
 
+def _format_duration(seconds):
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    return f"{int(seconds // 60)}m {int(seconds % 60):02d}s"
+
 class Plan:
-    def __init__(self, framework, safe_mode=False):
+    """
+    Kế hoạch hiển thị cho người dùng trước khi cài đặt. Các thay đổi file được lấy
+    trực tiếp từ nhật ký ghi, nên bản xem trước luôn khớp với những gì sẽ được ghi.
+    """
+    def __init__(self, framework, safe_mode=False, dependencies=None, journal=None, components=None, state=None,
+                 estimate=None):
         self.framework = framework
         self.safe_mode = safe_mode
+        self.dependencies = dependencies
+        self.journal = journal
+        self.components = components or []
+        self.state = state
+        # (số giây, số lần chạy làm mẫu) ước lượng từ lịch sử `shacnify stats`
+        self.estimate = estimate
         self.actions = []
         self._generate()
 
     def _generate(self):
-        """Phân tích dự án và xây dựng danh sách các hành động."""
-        # Kế hoạch cho các file cấu hình
-        self._plan_config_files()
-        
-        # Kế hoạch cho việc tái cấu trúc 'src'
-        if not self.safe_mode:
-            self._plan_src_restructure()
-
-    def _plan_config_files(self):
-        tailwind_config = Path("tailwind.config.js")
-        if not tailwind_config.exists() or not self.safe_mode:
-            action = "OVERWRITE" if tailwind_config.exists() else "CREATE"
-            self.actions.append((action, "tailwind.config.js", "File cấu hình Tailwind"))
-
-        # Tương tự cho các file khác nếu cần...
-
-    def _plan_src_restructure(self):
-        # Liệt kê các file sẽ bị ảnh hưởng
-        if Path("src/App.tsx").exists():
-            self.actions.append(("DELETE", "src/App.tsx", "File App component mặc định"))
-        if Path("src/App.css").exists():
-            self.actions.append(("DELETE", "src/App.css", "File CSS của App mặc định"))
-        
-        self.actions.append(("CREATE", "src/layouts/", "Thư mục Layouts"))
-        self.actions.append(("CREATE", "src/pages/", "Thư mục Pages"))
-        self.actions.append(("OVERWRITE", "src/main.tsx", "File khởi động ứng dụng"))
+        """Xây dựng danh sách các hành động."""
+        # Các thay đổi file đã được ghi vào nhật ký
+        if self.journal:
+            self._plan_file_changes()
+
+        # Kế hoạch cho các lệnh cài đặt dependency
+        if self.dependencies:
+            self._plan_dependency_installs()
+
+        if self.components:
+            self.actions.append(("ADD", ", ".join(self.components), t('plan_add_components')))
+
+    def _plan_file_changes(self):
+        for action, target, description in self.journal.entries:
+            # Cảnh báo khi sắp ghi đè một file mà người dùng đã sửa sau lần init trước
+            if action != "CREATE" and self.state and self.state.is_modified(target.rstrip("/")):
+                description = f"{description} {t('plan_modified_since_init')}"
+            self.actions.append((action, target, description))
+
+    def _plan_dependency_installs(self):
+        descriptions = {
+            "dev": t('plan_dev_install'),
+            "prod": t('plan_prod_install'),
+        }
+        for kind, command in self.dependencies.command_lines():
+            self.actions.append(("RUN", command, descriptions[kind]))
 
     def display(self):
         """Hiển thị kế hoạch cho người dùng xem."""
         if not self.actions:
-            console.print("[green]🔍 Dự án đã được cấu hình. Không có thay đổi nào cần thực hiện.[/green]")
+            console.print(f"[green]🔍 {t('plan_nothing_to_do')}[/green]")
             return
 
-        table = Table(title="[bold cyan]Kế hoạch thực thi của Shacnify[/bold cyan]")
-        table.add_column("Hành động", style="yellow")
-        table.add_column("Đối tượng", style="magenta")
-        table.add_column("Mô tả", style="white")
+        table = Table(title=f"[bold cyan]{t('plan_title')}[/bold cyan]")
+        table.add_column(t('plan_action'), style="yellow")
+        table.add_column(t('plan_target'), style="magenta")
+        table.add_column(t('plan_description'), style="white")
 
         for action, target, description in self.actions:
             style = "green"
             if action == "OVERWRITE":
                 style = "yellow"
+            elif action == "PREPEND":
+                style = "blue"
             elif action == "DELETE":
                 style = "bold red"
+            elif action == "RUN":
+                style = "cyan"
+            elif action == "ADD":
+                style = "magenta"
             table.add_row(f"[{style}]{action}[/]", target, description)
         
-        console.print(table)
\ No newline at end of file
+        console.print(table)
+        if self.estimate:
+            seconds, samples = self.estimate
+            console.print(f"[dim]⏱  {t('plan_estimate', duration=_format_duration(seconds), runs=samples)}[/dim]")
\ No newline at end of file
@@ -0,0 +1,136 @@
+# src/shacnify/core/project_state.py
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+STATE_DIR = Path(".shacnify")
+STATE_FILE = STATE_DIR / "state.json"
+STATE_VERSION = 1
+
+# Thư mục mà shadcn ghi component vào, theo alias '@/*' -> './src/*' mà shacnify thiết lập
+UI_DIR = Path("src") / "components" / "ui"
+
+def file_hash(path):
+    """sha256 của nội dung file, hoặc None nếu file không tồn tại."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+# Đuôi file của component do shadcn sinh ra (.tsx/.ts, hoặc .jsx/.js khi components.json có "tsx": false)
+COMPONENT_EXTENSIONS = (".tsx", ".ts", ".jsx", ".js")
+
+def component_file(name):
+    """File của component trong dự án, hoặc None nếu chưa có."""
+    for extension in COMPONENT_EXTENSIONS:
+        path = UI_DIR / f"{name}{extension}"
+        if path.is_file():
+            return path
+    return None
+
+def component_installed(name):
+    """Component đã có file trong dự án hay chưa."""
+    return component_file(name) is not None
+
+def installed_components():
+    """Tất cả component đã có trong dự án: tên -> file. Cùng quy tắc với `component_installed`."""
+    if not UI_DIR.is_dir():
+        return {}
+    return {
+        path.stem: path for path in sorted(UI_DIR.iterdir())
+        if path.suffix in COMPONENT_EXTENSIONS and path.is_file()
+    }
+
+def content_hash(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+class ProjectState:
+    """
+    Trạng thái của dự án sau lần init gần nhất, lưu trong `.shacnify/state.json`:
+    hash của các file đã sinh ra, các dependency đã cài và các component đã thêm.
+    Dùng để lần init sau chỉ làm lại những bước có đầu vào hoặc đầu ra đã thay đổi.
+    """
+    def __init__(self, data=None):
+        data = data or {}
+        self.framework = data.get("framework")
+        self.package_manager = data.get("package_manager")
+        self.files = dict(data.get("files", {}))
+        self.dependencies = {
+            "dev": list(data.get("dependencies", {}).get("dev", [])),
+            "prod": list(data.get("dependencies", {}).get("prod", [])),
+        }
+        self.package_files = dict(data.get("package_files", {}))
+        self.components = list(data.get("components", []))
+
+    @classmethod
+    def load(cls):
+        """Đọc trạng thái của dự án hiện tại. File hỏng hoặc khác phiên bản được coi như chưa có."""
+        try:
+            data = json.loads(STATE_FILE.read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls()
+        if data.get("version") != STATE_VERSION:
+            return cls()
+        return cls(data)
+
+    def to_dict(self):
+        return {
+            "version": STATE_VERSION,
+            "framework": self.framework,
+            "package_manager": self.package_manager,
+            "files": self.files,
+            "dependencies": self.dependencies,
+            "package_files": self.package_files,
+            "components": self.components,
+        }
+
+    def save(self):
+        STATE_DIR.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=STATE_DIR, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self.to_dict(), indent=2, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, STATE_FILE)
+
+    # --- So sánh với dự án hiện tại ---
+
+    def is_modified(self, path):
+        """File do shacnify sinh ra đã bị sửa kể từ lần init trước."""
+        recorded = self.files.get(Path(path).as_posix())
+        return recorded is not None and recorded != file_hash(path)
+
+    def installed_dependencies(self, package_manager):
+        """
+        Các dependency đã được cài ở lần init trước và vẫn còn hiệu lực:
+        package manager không đổi, package.json và file lock không bị sửa, node_modules còn tồn tại.
+        """
+        if package_manager.name != self.package_manager or not Path("node_modules").is_dir():
+            return set()
+        if not self.package_files or any(file_hash(path) != digest for path, digest in self.package_files.items()):
+            return set()
+        return set(self.dependencies["dev"]) | set(self.dependencies["prod"])
+
+    # --- Cập nhật sau một lần init thành công ---
+
+    def record(self, framework, package_manager, journal, dependencies, components):
+        """`dependencies` là dict {"dev": [...], "prod": [...]} của các dependency đã khai báo."""
+        self.framework = framework
+        self.package_manager = package_manager.name
+        for path, content in journal.files.items():
+            self.files[Path(path).as_posix()] = content_hash(content)
+        for path in journal.deleted:
+            self.files.pop(Path(path).as_posix(), None)
+        for kind in ("dev", "prod"):
+            for package in dependencies[kind]:
+                if package not in self.dependencies[kind]:
+                    self.dependencies[kind].append(package)
+        for name in components:
+            if name not in self.components:
+                self.components.append(name)
+        # Hash được tính sau khi cài đặt, vì cả bước thêm component cũng có thể sửa package.json
+        self.package_files = {
+            path: file_hash(path)
+            for path in ("package.json", *package_manager.lockfiles)
+            if Path(path).exists()
+        }
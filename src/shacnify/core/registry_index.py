@@ -0,0 +1,270 @@
+# src/shacnify/core/registry_index.py
+import difflib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from .config_manager import CONFIG_DIR, get_config_value
+
+# Module này được dùng bởi `shacnify list` / `search`, nên chỉ import những gì nhẹ;
+# urllib chỉ được import khi thực sự phải tải chỉ mục từ registry.
+INDEX_PATH = CONFIG_DIR / "cache" / "registry-index.json"
+INDEX_VERSION = 1
+
+DEFAULT_REGISTRY_URL = "https://ui.shadcn.com/r"
+# Chỉ mục được tải lại sau khoảng thời gian này (có thể đổi qua config registry_index_ttl_hours)
+DEFAULT_TTL_HOURS = 24
+FETCH_TIMEOUT_SECONDS = 10
+
+# Chỉ mục registry đi kèm shacnify: component -> các component của registry mà nó cần (registryDependencies).
+# Được dùng khi chưa từng tải được chỉ mục từ registry (vd. lần đầu chạy mà không có mạng).
+BUNDLED_INDEX = {
+    "accordion": [],
+    "alert": [],
+    "alert-dialog": ["button"],
+    "aspect-ratio": [],
+    "avatar": [],
+    "badge": [],
+    "breadcrumb": [],
+    "button": [],
+    "calendar": ["button"],
+    "card": [],
+    "carousel": ["button"],
+    "chart": ["card"],
+    "checkbox": [],
+    "collapsible": [],
+    "command": ["dialog"],
+    "context-menu": [],
+    "dialog": [],
+    "drawer": [],
+    "dropdown-menu": [],
+    "form": ["button", "label"],
+    "hover-card": [],
+    "input": [],
+    "input-otp": [],
+    "label": [],
+    "menubar": [],
+    "navigation-menu": [],
+    "pagination": ["button"],
+    "popover": [],
+    "progress": [],
+    "radio-group": [],
+    "resizable": [],
+    "scroll-area": [],
+    "select": [],
+    "separator": [],
+    "sheet": [],
+    "sidebar": ["button", "separator", "sheet", "tooltip", "input", "skeleton"],
+    "skeleton": [],
+    "slider": [],
+    "sonner": [],
+    "switch": [],
+    "table": [],
+    "tabs": [],
+    "textarea": [],
+    "toast": [],
+    "toggle": [],
+    "toggle-group": ["toggle"],
+    "tooltip": [],
+}
+
+# Độ giống tối thiểu để coi truy vấn là tên component bị gõ sai
+_TYPO_RATIO = 0.75
+
+# Loại item của registry được coi là component (khối giao diện, hook, lib... bị bỏ qua)
+_COMPONENT_TYPES = ("registry:ui", None)
+
+def registry_url():
+    """URL của registry, hoặc đường dẫn tới một thư mục registry cục bộ (dùng cho test)."""
+    return get_config_value("registry_url", DEFAULT_REGISTRY_URL)
+
+def _dependency_name(dependency):
+    """registryDependencies có thể là tên hoặc URL: 'https://.../styles/default/button.json' -> 'button'."""
+    name = dependency.rstrip("/").rsplit("/", 1)[-1]
+    return name[:-5] if name.endswith(".json") else name
+
+def _normalize(raw_item):
+    """Chỉ giữ các trường cần cho list/search và đồ thị phụ thuộc."""
+    return {
+        "name": raw_item["name"],
+        "description": raw_item.get("description") or "",
+        "dependencies": list(raw_item.get("dependencies") or []),
+        "registryDependencies": [_dependency_name(dep) for dep in raw_item.get("registryDependencies") or []],
+    }
+
+def _parse_items(data):
+    """Đọc danh sách component từ index.json của registry (danh sách item, hoặc registry.json có 'items')."""
+    if isinstance(data, dict):
+        data = data.get("items")
+    if not isinstance(data, list):
+        raise ValueError("registry index must be a list of items")
+    return [
+        _normalize(item) for item in data
+        if isinstance(item, dict) and item.get("name") and item.get("type") in _COMPONENT_TYPES
+    ]
+
+class RegistryIndex:
+    """
+    Danh sách component của registry, giữ trong bộ nhớ để liệt kê và tìm kiếm tức thì.
+    Được lưu trong `~/.shacnify/cache/registry-index.json` kèm thời điểm kiểm tra gần nhất.
+    """
+    def __init__(self, items, registry=None, origin="registry", checked_at=0.0):
+        self.items = {item["name"]: item for item in items}
+        self.registry = registry
+        # "registry": tải từ registry; "bundled": danh sách đi kèm shacnify
+        self.origin = origin
+        self.checked_at = checked_at
+        self._keys = None
+
+    @classmethod
+    def bundled(cls, registry=None, checked_at=0.0):
+        items = [{"name": name, "description": "", "dependencies": [], "registryDependencies": list(deps)}
+                 for name, deps in BUNDLED_INDEX.items()]
+        return cls(items, registry=registry, origin="bundled", checked_at=checked_at)
+
+    @classmethod
+    def from_file(cls, path):
+        """Đọc chỉ mục đã lưu, hoặc trực tiếp index.json của một registry (vd. fixture dùng cho test)."""
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION and "checked_at" in data:
+            return cls(data["items"], registry=data.get("registry"), origin=data.get("origin", "registry"),
+                       checked_at=data["checked_at"])
+        return cls(_parse_items(data), registry=str(path), checked_at=time.time())
+
+    def save(self, path=INDEX_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "registry": self.registry,
+                "origin": self.origin,
+                "checked_at": self.checked_at,
+                "items": list(self.items.values()),
+            }, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def is_stale(self, registry, ttl_seconds):
+        return self.registry != registry or time.time() - self.checked_at >= ttl_seconds
+
+    def names(self):
+        """Tất cả component, theo thứ tự chữ cái."""
+        return sorted(self.items)
+
+    def get(self, name):
+        return self.items.get(name)
+
+    def dependencies(self):
+        """Component -> các component của registry mà nó cần."""
+        return {name: item["registryDependencies"] for name, item in self.items.items()}
+
+    def _rank(self, query, name, words, description):
+        """Thứ hạng của một component với truy vấn (nhỏ hơn là khớp hơn), hoặc None nếu không khớp."""
+        if name == query:
+            return 0
+        if name.startswith(query):
+            return 1
+        if any(word.startswith(query) for word in words):
+            return 2
+        if query in name:
+            return 3
+        if query in description:
+            return 4
+        # Các ký tự của truy vấn xuất hiện theo đúng thứ tự trong tên, vd. 'ddm' -> 'dropdown-menu'
+        position = 0
+        for ch in query:
+            position = name.find(ch, position) + 1
+            if not position:
+                break
+        else:
+            return 5
+        # Gõ sai vài ký tự, vd. 'dailog' -> 'dialog'. Hai cận trên rẻ được thử trước ratio()
+        matcher = difflib.SequenceMatcher(None, query, name)
+        if matcher.real_quick_ratio() >= _TYPO_RATIO and matcher.quick_ratio() >= _TYPO_RATIO \
+                and matcher.ratio() >= _TYPO_RATIO:
+            return 6
+        return None
+
+    def search(self, query, limit=None):
+        """Tìm component theo tiền tố, từ, chuỗi con, mô tả hoặc khớp mờ. Kết quả xếp theo độ khớp."""
+        query = query.strip().lower()
+        if not query:
+            return []
+        if self._keys is None:
+            self._keys = [
+                (name, name.lower(), name.lower().split("-"), item["description"].lower())
+                for name, item in self.items.items()
+            ]
+        ranked = []
+        for name, lowered, words, description in self._keys:
+            rank = self._rank(query, lowered, words, description)
+            if rank is not None:
+                ranked.append((rank, len(name), name))
+        ranked.sort()
+        return [self.items[name] for _, _, name in ranked[:limit]]
+
+def _fetch(registry):
+    """Tải index.json của registry từ xa, hoặc đọc từ thư mục/file cục bộ."""
+    local = Path(registry)
+    if local.is_file():
+        return _parse_items(json.loads(local.read_text(encoding='utf-8')))
+    if local.is_dir():
+        return _parse_items(json.loads((local / "index.json").read_text(encoding='utf-8')))
+
+    import urllib.request
+    with urllib.request.urlopen(f"{registry.rstrip('/')}/index.json", timeout=FETCH_TIMEOUT_SECONDS) as response:
+        return _parse_items(json.loads(response.read().decode('utf-8')))
+
+def refresh():
+    """Tải lại chỉ mục từ registry và lưu lại. Ném OSError/ValueError nếu không tải được."""
+    registry = registry_url()
+    index = RegistryIndex(_fetch(registry), registry=registry, checked_at=time.time())
+    index.save()
+    _MEMO.clear()
+    return index
+
+# Chỉ mục đã đọc, theo (mtime, kích thước) của file, để daemon không phải đọc lại mỗi yêu cầu
+_MEMO = {}
+
+def _stored():
+    try:
+        st = os.stat(INDEX_PATH)
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _MEMO.get("stamp") != stamp:
+        try:
+            index = RegistryIndex.from_file(INDEX_PATH)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        _MEMO.update(stamp=stamp, index=index)
+    return _MEMO["index"]
+
+def load(auto_refresh=True):
+    """
+    Trả về chỉ mục registry. Với auto_refresh=True, chỉ mục được tải lại khi đã quá TTL hoặc registry_url đổi;
+    nếu không tải được (mất mạng), chỉ mục cũ hoặc danh sách đi kèm được dùng và lần thử tiếp theo
+    được hoãn tới hết TTL, để các lệnh sau vẫn trả kết quả ngay.
+    """
+    stored = _stored()
+    if not auto_refresh:
+        return stored or RegistryIndex.bundled()
+
+    registry = registry_url()
+    ttl_seconds = get_config_value("registry_index_ttl_hours", DEFAULT_TTL_HOURS) * 3600
+    if stored is not None and not stored.is_stale(registry, ttl_seconds):
+        return stored
+    try:
+        return refresh()
+    except (OSError, ValueError):
+        fallback = stored if stored is not None and stored.registry == registry else RegistryIndex.bundled(registry)
+        fallback.checked_at = time.time()
+        try:
+            fallback.save()
+        except OSError:
+            pass
+        _MEMO.clear()
+        return fallback
@@ -0,0 +1,196 @@
+# src/shacnify/core/resolver.py
+import json
+import re
+from pathlib import Path
+
+# Một so sánh trong range của npm, vd. ">=1.2.0", "^3", "~0.4.x", "2.1.0-beta.1"
+_COMPARATOR = re.compile(r"(<=|>=|<|>|=|\^|~)?\s*v?([0-9xX*]+(?:\.[0-9xX*]+){0,2})(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?")
+_VERSION = re.compile(r"^v?(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?$")
+_ANY = ("", "*", "x", "X", "latest")
+
+# File lock mà resolver đọc được. Dự án dùng file lock của package manager khác (pnpm-lock.yaml,
+# yarn.lock, bun.lock/bun.lockb) không được kiểm tra, mọi dependency đều được giao cho package manager
+SUPPORTED_LOCKFILES = ("package-lock.json",)
+
+def split_spec(spec):
+    """'@scope/name@^1.2' -> ('@scope/name', '^1.2'); 'name' -> ('name', '')."""
+    scoped = spec.startswith("@")
+    head, _, version_range = spec[1:].partition("@") if scoped else spec.partition("@")
+    return ("@" + head) if scoped else head, version_range
+
+def _key(major, minor, patch, prerelease=None):
+    # Bản prerelease đứng trước bản chính thức cùng số hiệu
+    if not prerelease:
+        return (major, minor, patch, 1, ())
+    parts = tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in prerelease.split("."))
+    return (major, minor, patch, 0, parts)
+
+def parse_version(version):
+    """Trả về khóa so sánh của một phiên bản semver đầy đủ, hoặc None nếu không hợp lệ."""
+    match = _VERSION.match(str(version).strip())
+    if not match:
+        return None
+    major, minor, patch, prerelease = match.groups()
+    return _key(int(major), int(minor), int(patch), prerelease)
+
+def _partial(text):
+    """'1.2' -> [1, 2, None]; 'x' hoặc '*' là None."""
+    parts = [None if p in ("x", "X", "*") else int(p) for p in text.split(".")]
+    parts += [None] * (3 - len(parts))
+    # Sau một phần là wildcard, các phần tiếp theo cũng là wildcard
+    for i, part in enumerate(parts):
+        if part is None:
+            return parts[:i] + [None] * (3 - i)
+    return parts
+
+def _lower(parts, prerelease=None):
+    return _key(*(p or 0 for p in parts), prerelease)
+
+def _bump(parts):
+    """Cận trên (không bao gồm) của một phiên bản thiếu phần, vd. 1.2 -> 1.3.0, 1 -> 2.0.0."""
+    major, minor, _ = parts
+    if minor is None:
+        return _key(major + 1, 0, 0, "0")
+    return _key(major, minor + 1, 0, "0")
+
+def _comparators(operator, text, prerelease):
+    """Đổi một so sánh thành danh sách (toán tử, khóa) đơn giản."""
+    parts = _partial(text)
+    major, minor, patch = parts
+    if major is None:
+        return [] if operator in ("", "=", "^", "~", ">=", "<=") else None
+    complete = patch is not None
+
+    if operator in ("", "="):
+        if complete:
+            return [("==", _key(major, minor, patch, prerelease))]
+        return [(">=", _lower(parts)), ("<", _bump(parts))]
+    if operator == "^":
+        if major > 0 or minor is None:
+            upper = _key(major + 1, 0, 0, "0")
+        elif minor > 0 or patch is None:
+            upper = _key(0, minor + 1, 0, "0")
+        else:
+            upper = _key(0, 0, patch + 1, "0")
+        return [(">=", _lower(parts, prerelease)), ("<", upper)]
+    if operator == "~":
+        upper = _key(major + 1, 0, 0, "0") if minor is None else _key(major, minor + 1, 0, "0")
+        return [(">=", _lower(parts, prerelease)), ("<", upper)]
+    if operator == ">":
+        return [(">", _key(major, minor, patch, prerelease))] if complete else [(">=", _bump(parts))]
+    if operator == ">=":
+        return [(">=", _lower(parts, prerelease))]
+    if operator == "<":
+        return [("<", _lower(parts, prerelease or ("0" if not complete else None)))]
+    if operator == "<=":
+        return [("<=", _key(major, minor, patch, prerelease))] if complete else [("<", _bump(parts))]
+    return None
+
+def _parse_set(text):
+    """Một nhóm so sánh cùng phải thỏa mãn (các phần ngăn cách bởi khoảng trắng, hoặc dạng 'a - b')."""
+    if " - " in text:
+        low, _, high = text.partition(" - ")
+        low_match, high_match = _COMPARATOR.fullmatch(low.strip()), _COMPARATOR.fullmatch(high.strip())
+        if not low_match or not high_match or low_match.group(1) or high_match.group(1):
+            return None
+        return _comparators(">=", low_match.group(2), low_match.group(3)) + \
+            _comparators("<=", high_match.group(2), high_match.group(3))
+
+    comparators = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _COMPARATOR.match(text, position)
+        if not match:
+            return None
+        expanded = _comparators(match.group(1) or "", match.group(2), match.group(3))
+        if expanded is None:
+            return None
+        comparators.extend(expanded)
+        position = match.end()
+        while position < len(text) and text[position] == " ":
+            position += 1
+    return comparators
+
+_TESTS = {
+    "==": lambda a, b: a == b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+}
+
+def satisfies(version, version_range):
+    """
+    Phiên bản có nằm trong range của npm không. Hỗ trợ phần thường dùng của semver:
+    ^, ~, so sánh, x-range, 'a - b' và '||'. Range không hiểu được (tag, git, file:...) coi như không thỏa.
+    """
+    version_range = (version_range or "").strip()
+    if version_range in _ANY:
+        return parse_version(version) is not None
+    key = parse_version(version)
+    if key is None:
+        return False
+    for alternative in version_range.split("||"):
+        comparators = _parse_set(alternative)
+        if comparators is not None and all(_TESTS[op](key, target) for op, target in comparators):
+            return True
+    return False
+
+def _read_json(path):
+    try:
+        return json.loads(Path(path).read_text(encoding='utf-8'))
+    except (FileNotFoundError, NotADirectoryError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+class DependencyResolver:
+    """
+    Xác định package nào trong danh sách yêu cầu thực sự cần cài, dựa trên package.json,
+    package-lock.json và node_modules/<tên>/package.json của dự án.
+    Mỗi file chỉ được đọc một lần.
+    """
+    def __init__(self, project_dir="."):
+        self.project_dir = Path(project_dir)
+        manifest = _read_json(self.project_dir / "package.json") or {}
+        self.declared = {
+            **manifest.get("devDependencies", {}),
+            **manifest.get("dependencies", {}),
+        }
+        self._lock = None
+        self._installed = {}
+
+    def _lock_version(self, name):
+        """Phiên bản được ghi trong package-lock.json (lockfile v1 đến v3), hoặc None."""
+        if self._lock is None:
+            self._lock = _read_json(self.project_dir / "package-lock.json") or {}
+        entry = self._lock.get("packages", {}).get(f"node_modules/{name}")
+        if entry is None:
+            entry = self._lock.get("dependencies", {}).get(name)
+        return entry.get("version") if isinstance(entry, dict) else None
+
+    def installed_version(self, name):
+        """Phiên bản đang có trong node_modules, hoặc None nếu package chưa được cài."""
+        if name not in self._installed:
+            data = _read_json(self.project_dir / "node_modules" / name / "package.json")
+            self._installed[name] = data.get("version") if isinstance(data, dict) else None
+        return self._installed[name]
+
+    def is_satisfied(self, spec):
+        """
+        Package đã đủ điều kiện nếu: được khai báo trong package.json, đã có trong node_modules
+        với phiên bản nằm trong range yêu cầu, và khớp với package-lock.json (nếu file lock có ghi).
+        """
+        name, version_range = split_spec(spec)
+        if name not in self.declared:
+            return False
+        installed = self.installed_version(name)
+        if installed is None or not satisfies(installed, version_range):
+            return False
+        locked = self._lock_version(name)
+        return locked is None or locked == installed
+
+    def missing(self, specs):
+        return [spec for spec in specs if not self.is_satisfied(spec)]
+
+    def satisfied(self, specs):
+        return [spec for spec in specs if self.is_satisfied(spec)]
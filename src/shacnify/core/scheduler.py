@@ -0,0 +1,164 @@
+# src/shacnify/core/scheduler.py
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from ..i18n.translator import t
+from .. import tracing
+
+class Step:
+    """Một bước trong đồ thị cài đặt, kèm các bước phụ thuộc và tài nguyên nó sử dụng."""
+    def __init__(self, name, func, depends_on=(), resources=()):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.resources = frozenset(resources)
+
+class _OrderedOutput:
+    """
+    Thay thế sys.stdout trong lúc chạy song song.
+    Output của bước đứng đầu (theo thứ tự khai báo) được in ngay,
+    output của các bước khác được giữ lại và in khi đến lượt.
+    """
+    def __init__(self, stream, names):
+        self._stream = stream
+        self._order = list(names)
+        self._buffers = {name: [] for name in names}
+        self._finished = set()
+        self._head = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def bind(self, name):
+        self._local.name = name
+
+    def _head_name(self):
+        return self._order[self._head] if self._head < len(self._order) else None
+
+    def write(self, text):
+        name = getattr(self._local, "name", None)
+        with self._lock:
+            if name is None or name == self._head_name():
+                return self._stream.write(text)
+            self._buffers[name].append(text)
+            return len(text)
+
+    def flush(self):
+        with self._lock:
+            self._stream.flush()
+
+    def isatty(self):
+        return self._stream.isatty()
+
+    @property
+    def encoding(self):
+        return getattr(self._stream, "encoding", "utf-8")
+
+    def _flush_buffer(self, name):
+        chunks = self._buffers[name]
+        if chunks:
+            self._stream.write("".join(chunks))
+            chunks.clear()
+
+    def finish(self, name):
+        """Đánh dấu một bước đã xong và in output của các bước đã đến lượt."""
+        with self._lock:
+            self._finished.add(name)
+            while self._head_name() in self._finished:
+                self._flush_buffer(self._head_name())
+                self._head += 1
+            if self._head_name() is not None:
+                self._flush_buffer(self._head_name())
+            self._stream.flush()
+
+    def close(self):
+        """In nốt phần output còn lại (ví dụ khi dừng sớm vì lỗi)."""
+        with self._lock:
+            for name in self._order[self._head:]:
+                self._flush_buffer(name)
+            self._head = len(self._order)
+            self._stream.flush()
+
+def _validate(steps):
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise ValueError(t('scheduler_duplicate_steps'))
+    for step in steps:
+        for dep in step.depends_on:
+            if dep not in names:
+                raise ValueError(t('scheduler_unknown_dependency', step=step.name, dependency=dep))
+
+    # Kiểm tra chu trình bằng cách duyệt theo thứ tự topo
+    remaining = {step.name: set(step.depends_on) for step in steps}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(t('scheduler_cycle', steps=', '.join(remaining)))
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+def run_steps(steps, max_workers=4):
+    """
+    Chạy các bước song song khi các bước phụ thuộc đã xong và không tranh chấp tài nguyên.
+    Dừng lên lịch bước mới ngay khi có bước thất bại (fail-fast).
+    Trả về tên bước thất bại đầu tiên, hoặc None nếu tất cả thành công.
+    """
+    _validate(steps)
+
+    output = _OrderedOutput(sys.stdout, [step.name for step in steps])
+
+    def _run(step):
+        output.bind(step.name)
+        try:
+            with tracing.span(step.name, "step") as span:
+                success = step.func()
+                span.set(success=bool(success))
+                return success
+        finally:
+            output.bind(None)
+
+    pending = list(steps)
+    running = {}
+    done = set()
+    held = set()
+    failed = None
+    error = None
+
+    original_stdout = sys.stdout
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while pending or running:
+                if failed is None:
+                    for step in list(pending):
+                        if all(dep in done for dep in step.depends_on) and not (step.resources & held):
+                            pending.remove(step)
+                            held |= step.resources
+                            running[pool.submit(_run, step)] = step
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    held -= step.resources
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        success = False
+                        error = error or e
+                    output.finish(step.name)
+                    if success:
+                        done.add(step.name)
+                    elif failed is None:
+                        failed = step.name
+    finally:
+        output.close()
+        sys.stdout = original_stdout
+
+    if error is not None:
+        raise error
+    return failed
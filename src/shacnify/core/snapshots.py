@@ -0,0 +1,196 @@
+# src/shacnify/core/snapshots.py
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .config_manager import CONFIG_DIR
+from .. import tracing
+
+SNAPSHOTS_DIR = CONFIG_DIR / "cache" / "snapshots"
+META_FILE = "meta.json"
+PROJECT_DIR = "project"
+
+# Mặc định `cache prune` xóa các snapshot không được dùng trong số ngày này
+DEFAULT_PRUNE_DAYS = 30
+
+# ioctl FICLONE của Linux: tạo bản sao reflink (copy-on-write) trên btrfs/xfs
+_FICLONE = 0x40049409
+
+def shacnify_version():
+    try:
+        from importlib.metadata import version
+        return version("shacnify")
+    except Exception:
+        return "dev"
+
+def snapshot_key(framework, deps, components):
+    """Khóa của snapshot: (framework, package manager, tập dependency, danh sách component, phiên bản shacnify)."""
+    material = json.dumps({
+        "framework": framework,
+        "package_manager": deps.package_manager_name(),
+        "dev": sorted(deps.dev),
+        "prod": sorted(deps.prod),
+        "components": sorted(components),
+        "shacnify": shacnify_version(),
+    }, sort_keys=True)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()[:24]
+
+def _snapshot_dir(key):
+    return SNAPSHOTS_DIR / key
+
+def has_snapshot(key):
+    return (_snapshot_dir(key) / META_FILE).exists()
+
+# --- Sao chép cây thư mục ---
+
+def _reflink(src, dst):
+    import fcntl
+    with open(src, 'rb') as f_src, open(dst, 'wb') as f_dst:
+        fcntl.ioctl(f_dst.fileno(), _FICLONE, f_src.fileno())
+    shutil.copystat(src, dst)
+
+class _Cloner:
+    """
+    Sao chép file bằng reflink nếu hệ thống file hỗ trợ, nếu không thì copy.
+    Reflink không được hỗ trợ sẽ bị tắt ngay sau lần thử đầu tiên.
+    Không dùng hardlink: một lần sửa file tại chỗ trong node_modules (vd. patch-package)
+    sẽ sửa luôn file trong snapshot và trong mọi dự án khác được tạo từ nó.
+    """
+    def __init__(self):
+        self.reflink = sys.platform.startswith("linux")
+        self.stats = {"reflink": 0, "copy": 0}
+
+    def __call__(self, src, dst):
+        if self.reflink:
+            try:
+                _reflink(src, dst)
+                self.stats["reflink"] += 1
+                return dst
+            except (OSError, ImportError):
+                self.reflink = False
+                if os.path.exists(dst):
+                    os.unlink(dst)
+
+        shutil.copy2(src, dst)
+        self.stats["copy"] += 1
+        return dst
+
+def _copy_tree(src, dst):
+    cloner = _Cloner()
+    shutil.copytree(src, dst, symlinks=True, copy_function=cloner)
+    return cloner.stats
+
+# --- Lưu và khôi phục ---
+
+def _read_meta(key):
+    return json.loads((_snapshot_dir(key) / META_FILE).read_text(encoding='utf-8'))
+
+def _write_json(path, data):
+    """Ghi qua file tạm rồi đổi tên, nên không bao giờ ghi đè lên inode dùng chung với snapshot."""
+    fd, tmp_path = tempfile.mkstemp(dir=Path(path).parent, suffix=".tmp")
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, path)
+
+def save_snapshot(key, project_path, framework, components):
+    """Lưu dự án đã cài đặt xong (kể cả node_modules) làm snapshot."""
+    SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=SNAPSHOTS_DIR, prefix=f".{key}-"))
+    try:
+        with tracing.span("snapshot save", "fs"):
+            _copy_tree(project_path, staging / PROJECT_DIR)
+        now = time.time()
+        _write_json(staging / META_FILE, {
+            "framework": framework,
+            "components": sorted(components),
+            "project_name": Path(project_path).name,
+            "shacnify": shacnify_version(),
+            "created_at": now,
+            "last_used": now,
+        })
+        os.replace(staging, _snapshot_dir(key))
+    except OSError:
+        # Một tiến trình khác đã lưu cùng snapshot, hoặc ổ đĩa đầy: snapshot chỉ là cache
+        shutil.rmtree(staging, ignore_errors=True)
+        return False
+    return True
+
+def _patch_project_name(project_path, project_name):
+    """Thay tên dự án gốc của snapshot bằng tên người dùng chọn."""
+    package_json = project_path / "package.json"
+    if package_json.exists():
+        data = json.loads(package_json.read_text(encoding='utf-8'))
+        data["name"] = project_name
+        _write_json(package_json, data)
+
+    lock_file = project_path / "package-lock.json"
+    if lock_file.exists():
+        data = json.loads(lock_file.read_text(encoding='utf-8'))
+        data["name"] = project_name
+        if "" in data.get("packages", {}):
+            data["packages"][""]["name"] = project_name
+        _write_json(lock_file, data)
+
+def restore_snapshot(key, project_name):
+    """
+    Tạo dự án mới từ snapshot. Trả về thống kê cách các file được sao chép, hoặc None nếu không
+    khôi phục được (ổ đĩa đầy, thư mục dự án đã tồn tại...). Dự án được dựng trong một thư mục tạm
+    bên cạnh rồi mới đổi tên, nên một lần khôi phục dở không để lại gì trên đĩa.
+    """
+    project_path = Path(project_name).resolve()
+    staging = None
+    try:
+        staging = Path(tempfile.mkdtemp(dir=project_path.parent, prefix=f".{project_path.name}-"))
+        with tracing.span("snapshot restore", "fs") as span:
+            stats = _copy_tree(_snapshot_dir(key) / PROJECT_DIR, staging / PROJECT_DIR)
+            span.set(**stats)
+        _patch_project_name(staging / PROJECT_DIR, project_path.name)
+        os.rename(staging / PROJECT_DIR, project_path)
+    except (OSError, ValueError):
+        return None
+    finally:
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    # Dự án đã được khôi phục; thời điểm dùng gần nhất chỉ phục vụ `cache prune`,
+    # nên snapshot chỉ-đọc hoặc vừa bị prune không được làm hỏng lệnh create
+    try:
+        meta = _read_meta(key)
+        meta["last_used"] = time.time()
+        _write_json(_snapshot_dir(key) / META_FILE, meta)
+    except (OSError, ValueError):
+        pass
+    return stats
+
+def list_snapshots():
+    """Trả về danh sách (key, meta) của các snapshot hiện có."""
+    if not SNAPSHOTS_DIR.exists():
+        return []
+    result = []
+    for path in SNAPSHOTS_DIR.iterdir():
+        if path.name.startswith(".") or not (path / META_FILE).exists():
+            continue
+        result.append((path.name, _read_meta(path.name)))
+    return result
+
+def prune(older_than_days=DEFAULT_PRUNE_DAYS, remove_all=False):
+    """Xóa các snapshot không được dùng trong `older_than_days` ngày (hoặc tất cả). Trả về số snapshot đã xóa."""
+    cutoff = time.time() - older_than_days * 86400
+    removed = 0
+    for key, meta in list_snapshots():
+        if remove_all or meta.get("last_used", 0) < cutoff:
+            shutil.rmtree(_snapshot_dir(key), ignore_errors=True)
+            removed += 1
+
+    # Dọn các thư mục tạm còn sót lại từ những lần lưu bị gián đoạn
+    if SNAPSHOTS_DIR.exists():
+        stale = time.time() - 86400
+        for path in SNAPSHOTS_DIR.glob(".*"):
+            if path.stat().st_mtime < stale:
+                shutil.rmtree(path, ignore_errors=True)
+    return removed
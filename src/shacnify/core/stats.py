@@ -0,0 +1,254 @@
+# src/shacnify/core/stats.py
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+from .config_manager import CONFIG_DIR
+from .. import tracing
+
+STATS_DB = CONFIG_DIR / "stats.db"
+
+# Số lần chạy gần nhất được so sánh với phần lịch sử còn lại để phát hiện hồi quy
+RECENT_RUNS = 5
+# Trung vị của các lần gần đây chậm hơn baseline quá tỉ lệ này thì bị coi là hồi quy
+REGRESSION_THRESHOLD = 1.25
+# Cần ít nhất chừng này mẫu mới đưa ra ước lượng thời gian
+MIN_SAMPLES = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    command TEXT NOT NULL,
+    framework TEXT,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    success INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    duration REAL NOT NULL,
+    success INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS commands (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    program TEXT NOT NULL,
+    exit_code INTEGER,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cache_events (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    cache TEXT NOT NULL,
+    hits INTEGER NOT NULL,
+    misses INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS steps_by_name ON steps(name);
+"""
+
+def _connect():
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    # Nhiều tiến trình shacnify có thể ghi cùng lúc (vd. tạo nhiều dự án song song)
+    conn = sqlite3.connect(STATS_DB, timeout=10)
+    try:
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.executescript(_SCHEMA)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+def _program(command):
+    """Rút gọn một lệnh để gom nhóm: 'npm install -D tailwindcss ...' -> 'npm install'."""
+    parts = command.split()
+    if not parts:
+        return command
+    words = [Path(parts[0]).name]
+    if len(parts) > 1 and not parts[1].startswith("-"):
+        words.append(parts[1])
+    return " ".join(words)
+
+# --- Ghi lại một lần chạy ---
+
+class _Run:
+    def __init__(self, command):
+        self.command = command
+        self.framework = None
+        self.success = False
+
+def record_run(run, started_at, duration, spans):
+    """Lưu một lần chạy cùng các bước, lệnh và sự kiện cache đã được trace."""
+    try:
+        # `with conn` chỉ commit/rollback, không đóng kết nối; closing() đóng cả khi có lỗi,
+        # để daemon `shacnify serve` không rò kết nối
+        with closing(_connect()) as conn, conn:
+            run_id = conn.execute(
+                "INSERT INTO runs (command, framework, started_at, duration, success) VALUES (?, ?, ?, ?, ?)",
+                (run.command, run.framework, started_at, duration, int(bool(run.success))),
+            ).lastrowid
+            for record in spans:
+                if record["cat"] == "step":
+                    conn.execute(
+                        "INSERT INTO steps (run_id, name, duration, success) VALUES (?, ?, ?, ?)",
+                        (run_id, record["name"], record["duration"], int(record["args"].get("success", False))),
+                    )
+                elif record["cat"] == "subprocess":
+                    conn.execute(
+                        "INSERT INTO commands (run_id, program, exit_code, duration) VALUES (?, ?, ?, ?)",
+                        (run_id, _program(record["name"]), record["args"].get("returncode"), record["duration"]),
+                    )
+                elif record["cat"] == "cache":
+                    conn.execute(
+                        "INSERT INTO cache_events (run_id, cache, hits, misses) VALUES (?, ?, ?, ?)",
+                        (run_id, record["name"], record["args"].get("hits", 0), record["args"].get("misses", 0)),
+                    )
+    except sqlite3.Error:
+        # Thống kê chỉ mang tính tham khảo, không bao giờ làm hỏng lệnh chính
+        pass
+
+@contextmanager
+def recording(command):
+    """
+    Ghi lại một lần chạy create/init/add vào cơ sở dữ liệu thống kê.
+    Dùng với `with stats.recording("init") as run: run.success = ...`.
+    Tracing chỉ được bật trong lúc ghi: khi kết thúc, trạng thái cũ được khôi phục và các span
+    của lần chạy được bỏ khỏi bộ nhớ, trừ khi `--trace` cần chúng để xuất file trace.
+    """
+    was_enabled = tracing.is_enabled()
+    tracing.enable()
+    first_span = tracing.span_count()
+    run = _Run(command)
+    started_at = time.time()
+    start = time.perf_counter()
+    try:
+        yield run
+    finally:
+        duration = time.perf_counter() - start
+        if run.framework is None:
+            from .detector import detect_framework
+            try:
+                run.framework = detect_framework()
+            except (ValueError, OSError):
+                pass
+        if was_enabled:
+            collected = tracing.spans_since(first_span)
+        else:
+            collected = tracing.take_spans(first_span)
+            tracing.disable()
+        record_run(run, started_at, duration, collected)
+
+# --- Phân tích ---
+
+def percentile(values, pct):
+    """Phân vị theo nội suy tuyến tính. `values` không được rỗng."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def _query(sql, params=()):
+    if not STATS_DB.exists():
+        return []
+    try:
+        conn = _connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return []
+
+def step_durations(framework=None, successful_only=True):
+    """{(bước, framework): [thời lượng theo thứ tự thời gian]}."""
+    sql = (
+        "SELECT steps.name, runs.framework, steps.duration FROM steps JOIN runs ON runs.id = steps.run_id"
+        " WHERE (? IS NULL OR runs.framework = ?)"
+    )
+    if successful_only:
+        sql += " AND steps.success = 1"
+    sql += " ORDER BY runs.started_at"
+    series = {}
+    for name, fw, duration in _query(sql, (framework, framework)):
+        series.setdefault((name, fw or "-"), []).append(duration)
+    return series
+
+def summarize_steps(framework=None, recent=RECENT_RUNS, threshold=REGRESSION_THRESHOLD):
+    """
+    Thống kê p50/p95 cho từng (bước, framework), kèm chuỗi thời lượng gần nhất để vẽ xu hướng.
+    Một bước bị đánh dấu hồi quy khi trung vị của `recent` lần gần nhất chậm hơn
+    trung vị của các lần trước đó (baseline) quá `threshold` lần.
+    """
+    rows = []
+    for (name, fw), durations in sorted(step_durations(framework).items()):
+        baseline = durations[:-recent]
+        latest = durations[-recent:]
+        regression = None
+        if len(baseline) >= MIN_SAMPLES:
+            ratio = percentile(latest, 50) / max(percentile(baseline, 50), 1e-6)
+            if ratio > threshold:
+                regression = ratio
+        rows.append({
+            "step": name,
+            "framework": fw,
+            "runs": len(durations),
+            "p50": percentile(durations, 50),
+            "p95": percentile(durations, 95),
+            "last": durations[-1],
+            "trend": durations[-10:],
+            "regression": regression,
+        })
+    return rows
+
+def summarize_commands():
+    """Số lần chạy, số lần lỗi và p50/p95 của từng chương trình con (npm install, shadcn add...)."""
+    series = {}
+    for program, exit_code, duration in _query("SELECT program, exit_code, duration FROM commands"):
+        entry = series.setdefault(program, {"durations": [], "failures": 0})
+        entry["durations"].append(duration)
+        if exit_code not in (0, None):
+            entry["failures"] += 1
+    return [
+        {
+            "program": program,
+            "runs": len(entry["durations"]),
+            "failures": entry["failures"],
+            "p50": percentile(entry["durations"], 50),
+            "p95": percentile(entry["durations"], 95),
+        }
+        for program, entry in sorted(series.items(), key=lambda item: -percentile(item[1]["durations"], 95))
+    ]
+
+def summarize_caches():
+    """Tỉ lệ trúng cache theo từng loại cache."""
+    return [
+        {"cache": cache, "hits": hits, "misses": misses}
+        for cache, hits, misses in _query(
+            "SELECT cache, SUM(hits), SUM(misses) FROM cache_events GROUP BY cache ORDER BY cache"
+        )
+    ]
+
+def estimate(framework, stages):
+    """
+    Ước lượng thời gian chạy từ lịch sử. `stages` là danh sách các nhóm bước:
+    các bước trong một nhóm chạy song song, các nhóm chạy nối tiếp.
+    Trả về (số giây, số mẫu ít nhất), hoặc None nếu chưa đủ dữ liệu.
+    """
+    series = step_durations(framework)
+    total = 0.0
+    samples = None
+    for stage in stages:
+        longest = 0.0
+        for name in stage:
+            durations = series.get((name, framework), [])
+            if len(durations) < MIN_SAMPLES:
+                return None
+            longest = max(longest, percentile(durations, 50))
+            samples = len(durations) if samples is None else min(samples, len(durations))
+        total += longest
+    if samples is None:
+        return None
+    return total, samples
+
+def clear():
+    STATS_DB.unlink(missing_ok=True)
@@ -0,0 +1,164 @@
+# src/shacnify/core/tools.py
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from .config_manager import CONFIG_DIR, EXACT_VERSION_RE, get_config_value
+from .package_manager import detect_package_manager
+from ..utils import run_command, get_command_output
+
+# Thư mục công cụ luôn được quản lý bằng npm, vì npm luôn đi kèm Node.js
+TOOLS_DIR = CONFIG_DIR / "tools"
+STATE_PATH = TOOLS_DIR / "state.json"
+
+SHADCN_PACKAGE = "shadcn"
+# Phiên bản "latest" được phân giải lại sau khoảng thời gian này (có thể đổi qua config tool_version_ttl_hours)
+DEFAULT_TTL_HOURS = 24
+
+_resolved_command = None
+
+def _read_state():
+    try:
+        return json.loads(STATE_PATH.read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _write_state(state):
+    TOOLS_DIR.mkdir(parents=True, exist_ok=True)
+    # File tạm riêng cho mỗi lần ghi: nhiều tiến trình shacnify có thể ghi cùng lúc
+    fd, tmp_path = tempfile.mkstemp(dir=TOOLS_DIR, prefix=".state-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(state, indent=2))
+        os.replace(tmp_path, STATE_PATH)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def tool_dir(version):
+    return TOOLS_DIR / SHADCN_PACKAGE / version
+
+def shadcn_binary(version):
+    name = "shadcn.cmd" if os.name == "nt" else "shadcn"
+    return tool_dir(version) / "node_modules" / ".bin" / name
+
+def installed_versions():
+    base = TOOLS_DIR / SHADCN_PACKAGE
+    if not base.exists():
+        return []
+    return sorted(p.name for p in base.iterdir() if not p.name.startswith(".") and shadcn_binary(p.name).exists())
+
+def pinned_version():
+    """Phiên bản được ghim trong config, hoặc None nếu không ghim ('latest' nghĩa là theo TTL)."""
+    pinned = get_config_value("shadcn_version")
+    return pinned if pinned and pinned != "latest" else None
+
+def resolve_shadcn_version(force=False):
+    """
+    Trả về phiên bản shadcn CLI cần dùng: phiên bản được ghim trong config,
+    hoặc "latest" đã phân giải (chỉ hỏi lại registry khi hết TTL hoặc force=True).
+    Trả về None nếu không phân giải được và chưa từng phân giải trước đó.
+    Một lần phân giải thất bại cũng được ghi lại, để khi mất mạng các lệnh sau không phải
+    chờ hết thời gian chờ của `npm view` trước khi hết TTL.
+    """
+    pinned = pinned_version()
+    if pinned:
+        return pinned
+
+    state = _read_state().get(SHADCN_PACKAGE, {})
+    ttl_seconds = get_config_value("tool_version_ttl_hours", DEFAULT_TTL_HOURS) * 3600
+    checked_at = max(state.get("resolved_at", 0), state.get("failed_at", 0))
+    if not force and time.time() - checked_at < ttl_seconds:
+        return state.get("version")
+
+    version = get_command_output(["npm", "view", SHADCN_PACKAGE, "version"])
+    if not version or not EXACT_VERSION_RE.match(version):
+        # Mất mạng: dùng tạm phiên bản đã phân giải lần trước nếu có, và hoãn lần thử tiếp theo tới hết TTL
+        full_state = _read_state()
+        full_state[SHADCN_PACKAGE] = {**full_state.get(SHADCN_PACKAGE, {}), "failed_at": time.time()}
+        try:
+            _write_state(full_state)
+        except OSError:
+            pass
+        return state.get("version")
+
+    full_state = _read_state()
+    full_state[SHADCN_PACKAGE] = {"version": version, "resolved_at": time.time()}
+    _write_state(full_state)
+    return version
+
+def ensure_shadcn(version):
+    """Cài shadcn CLI vào thư mục công cụ của shacnify nếu chưa có. Trả về đường dẫn binary hoặc None."""
+    binary = shadcn_binary(version)
+    if binary.exists():
+        return binary
+
+    # Cài vào một thư mục tạm riêng của tiến trình này rồi đổi tên thành thư mục đích,
+    # để tiến trình khác (vd. `create --manifest`) không bao giờ thấy hoặc xóa một bản cài dở
+    target = tool_dir(version)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{version}-"))
+        staging.chmod(0o755)
+    except OSError:
+        return None
+    try:
+        if not run_command(["npm", "install", "--prefix", str(staging), "--no-audit", "--no-fund", f"{SHADCN_PACKAGE}@{version}"], network=True):
+            return None
+        if not (staging / binary.relative_to(target)).exists():
+            return None
+        try:
+            os.rename(staging, target)
+        except OSError:
+            # Thư mục đích đã có: hoặc tiến trình khác vừa cài xong phiên bản này,
+            # hoặc là bản cài dở còn sót lại (không có binary) thì được thay thế
+            if not binary.exists():
+                shutil.rmtree(target, ignore_errors=True)
+                try:
+                    os.rename(staging, target)
+                except OSError:
+                    # Tiến trình khác vẫn đang giữ hoặc tạo lại thư mục đích: để người gọi quay về npx
+                    pass
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return binary if binary.exists() else None
+
+def shadcn_command():
+    """
+    Trả về argv để gọi shadcn CLI. Ưu tiên binary cục bộ đã ghim phiên bản;
+    nếu không chuẩn bị được thì quay về `npx shadcn@latest` (hoặc lệnh tương đương của package manager).
+    """
+    global _resolved_command
+    if _resolved_command is None:
+        version = resolve_shadcn_version()
+        binary = ensure_shadcn(version) if version else None
+        if binary:
+            _resolved_command = [str(binary)]
+        else:
+            _resolved_command = detect_package_manager().exec_command(f"{SHADCN_PACKAGE}@latest")
+    return list(_resolved_command)
+
+def update():
+    """Phân giải lại phiên bản mới nhất (bỏ qua TTL) và cài nó. Trả về (phiên bản, thành công)."""
+    global _resolved_command
+    _resolved_command = None
+    version = resolve_shadcn_version(force=True)
+    if not version:
+        return None, False
+    return version, ensure_shadcn(version) is not None
+
+def status():
+    """Thông tin hiện trạng của shadcn CLI do shacnify quản lý."""
+    state = _read_state().get(SHADCN_PACKAGE, {})
+    return {
+        "pinned": pinned_version(),
+        "resolved": state.get("version"),
+        "resolved_at": state.get("resolved_at"),
+        "ttl_hours": get_config_value("tool_version_ttl_hours", DEFAULT_TTL_HOURS),
+        "installed": installed_versions(),
+        "directory": str(TOOLS_DIR / SHADCN_PACKAGE),
+    }
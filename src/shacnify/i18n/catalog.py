@@ -0,0 +1,31 @@
+# src/shacnify/i18n/catalog.py
+import json
+import sys
+from pathlib import Path
+
+LOCALES_DIR = Path(__file__).parent / "locales"
+CATALOGS_DIR = Path(__file__).parent / "catalogs"
+
+def compile_catalogs(locales_dir=LOCALES_DIR, out_dir=CATALOGS_DIR):
+    """
+    Biên dịch mỗi file locales/<lang>.json thành module catalogs/<lang>.py chứa dict MESSAGES.
+    Module được Python cache dưới dạng .pyc, nên lúc chạy chỉ cần một lần import thay vì đọc và parse JSON.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for locale_file in sorted(Path(locales_dir).glob("*.json")):
+        messages = json.loads(locale_file.read_text(encoding='utf-8'))
+        target = out_dir / f"{locale_file.stem}.py"
+        target.write_text(
+            f"# Tự động sinh từ locales/{locale_file.name}, không sửa trực tiếp.\n"
+            f"MESSAGES = {messages!r}\n",
+            encoding='utf-8',
+        )
+        written.append(target)
+    return written
+
+if __name__ == "__main__":
+    out = sys.argv[1] if len(sys.argv) > 1 else CATALOGS_DIR
+    for path in compile_catalogs(out_dir=out):
+        print(path)
@@ -0,0 +1,2 @@
+# src/shacnify/i18n/catalogs/__init__.py
+# Các catalog được biên dịch từ locales/*.json lúc build package (xem i18n/catalog.py).
@@ -1,49 +1,61 @@
 # src/shacnify/i18n/translator.py
+import importlib
 import json
-from pathlib import Path
-from ..core.config_manager import get_config, set_config_value
+
+from ..core.config_manager import get_config_value, set_config_value
+from .catalog import LOCALES_DIR
+
+DEFAULT_LANG = "en"
 
 # --- State cache ---
-_MESSAGES_CACHE = {}
+_MESSAGES = None
 _CURRENT_LANG = None
 
-def _load_language_messages():
-    """Tải file ngôn ngữ vào cache nếu cần."""
-    global _CURRENT_LANG, _MESSAGES_CACHE
-    
-    lang_from_config = get_config().get("language", "en")
-    
-    # Chỉ tải lại file nếu ngôn ngữ đã thay đổi
-    if _CURRENT_LANG == lang_from_config:
-        return
-
-    _CURRENT_LANG = lang_from_config
-    
+def _load_catalog(lang):
+    """Nạp catalog đã biên dịch, hoặc đọc file JSON khi chạy từ source chưa build."""
     try:
-        # Dành cho khi chạy tool đã được cài đặt
-        from importlib.resources import files
-        pkg_path = files('shacnify')
+        return importlib.import_module(f"{__package__}.catalogs.{lang}").MESSAGES
     except ImportError:
-        # Dành cho khi đang phát triển (chạy trực tiếp)
-        pkg_path = Path(__file__).parent.parent
+        pass
 
-    locale_file = pkg_path / "i18n" / "locales" / f"{_CURRENT_LANG}.json"
-    
+    locale_file = LOCALES_DIR / f"{lang}.json"
     if not locale_file.exists():
+        return None
+    return json.loads(locale_file.read_text(encoding='utf-8'))
+
+def _activate(lang=None):
+    """Chọn ngôn ngữ đang dùng và nạp catalog của nó. Chỉ chạy một lần cho mỗi lần đổi ngôn ngữ."""
+    global _CURRENT_LANG, _MESSAGES
+
+    lang = lang or get_config_value("language", DEFAULT_LANG)
+    messages = _load_catalog(lang)
+    if messages is None:
         # Fallback to English if the selected language file doesn't exist
-        _CURRENT_LANG = "en"
-        locale_file = pkg_path / "i18n" / "locales" / "en.json"
+        lang = DEFAULT_LANG
+        messages = _load_catalog(lang)
+
+    _CURRENT_LANG = lang
+    _MESSAGES = messages
+    return messages
+
+def t(key: str, **kwargs) -> str:
+    """Hàm dịch chính. Sau lần gọi đầu tiên chỉ còn là một lần tra dict."""
+    messages = _MESSAGES if _MESSAGES is not None else _activate()
+    message = messages.get(key, key)
+    return message.format(**kwargs) if kwargs else message
 
-    _MESSAGES_CACHE = json.loads(locale_file.read_text(encoding='utf-8'))
+def refresh():
+    """Nạp lại catalog nếu ngôn ngữ trong config đã đổi (cho tiến trình chạy lâu như `shacnify serve`)."""
+    if _CURRENT_LANG is not None and get_config_value("language", DEFAULT_LANG) != _CURRENT_LANG:
+        _activate()
 
-def t(key: str) -> str:
-    """Hàm dịch chính, luôn đảm bảo ngôn ngữ được cập nhật."""
-    _load_language_messages()
-    return _MESSAGES_CACHE.get(key, key)
+def get_language() -> str:
+    """Trả về mã ngôn ngữ đang dùng."""
+    if _CURRENT_LANG is None:
+        _activate()
+    return _CURRENT_LANG
 
 def set_language(lang_code: str):
-    """Đặt ngôn ngữ mới."""
-    global _CURRENT_LANG
+    """Đặt ngôn ngữ mới và nạp ngay catalog tương ứng."""
     set_config_value("language", lang_code)
-    # Reset cache để lần gọi 't' tiếp theo sẽ tải lại đúng file
-    _CURRENT_LANG = None
\ No newline at end of file
+    _activate(lang_code)
@@ -1,35 +1,144 @@
 # src/shacnify/logger.py
+import atexit
+import gzip
 import logging
+import os
+import queue
+import shutil
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 LOG_DIR = Path.home() / ".shacnify" / "logs"
-LOG_DIR.mkdir(parents=True, exist_ok=True)
 
-# Xóa tất cả các handler cũ để tránh ghi log trùng lặp
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)
+# Mỗi file log của một dự án được xoay vòng khi vượt quá kích thước này,
+# các phân đoạn cũ được nén gzip và chỉ giữ lại BACKUP_COUNT bản.
+MAX_LOG_BYTES = 1024 * 1024
+BACKUP_COUNT = 5
+# Giới hạn tổng dung lượng các phân đoạn đã nén trong LOG_DIR
+MAX_TOTAL_ARCHIVE_BYTES = 100 * 1024 * 1024
+
+# Hàng đợi có giới hạn: khi luồng ghi file không theo kịp, bên ghi log sẽ chờ
+# thay vì để hàng đợi phình to trong bộ nhớ (vd. khi npm in ra hàng trăm nghìn dòng).
+QUEUE_MAX_RECORDS = 10_000
+
+LOG_FORMAT = '%(asctime)s [%(levelname)s] - %(message)s'
+
+_LOGGERS = {}
+_lock = threading.Lock()
+_queue = None
+_router = None
+_listener = None
 
 def get_log_file_path(project_name: str) -> Path:
     """Trả về đường dẫn đầy đủ đến file log cho một dự án cụ thể."""
     return LOG_DIR / f"{project_name}.log"
 
+def _gzip_namer(name):
+    return name + ".gz"
+
+def _gzip_rotator(source, dest):
+    """Nén phân đoạn log vừa xoay vòng rồi dọn bớt các phân đoạn cũ nhất nếu cần."""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+    _prune_archives()
+
+def _prune_archives():
+    """Xóa các phân đoạn nén cũ nhất cho đến khi tổng dung lượng dưới giới hạn."""
+    archives = sorted(LOG_DIR.glob("*.log.*.gz"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in archives)
+    for archive in archives:
+        if total <= MAX_TOTAL_ARCHIVE_BYTES:
+            break
+        total -= archive.stat().st_size
+        archive.unlink(missing_ok=True)
+
+class _BlockingQueueHandler(QueueHandler):
+    """Chờ khi hàng đợi đầy thay vì bỏ bản ghi."""
+    def enqueue(self, record):
+        self.queue.put(record)
+
+class _ProjectRouter(logging.Handler):
+    """Chạy trên luồng của QueueListener, chuyển mỗi bản ghi tới file log của đúng dự án."""
+    def __init__(self):
+        super().__init__()
+        self._handlers = {}
+
+    def add_project(self, logger_name, project_name):
+        handler = RotatingFileHandler(
+            get_log_file_path(project_name), mode='a', maxBytes=MAX_LOG_BYTES,
+            backupCount=BACKUP_COUNT, encoding='utf-8', delay=True,
+        )
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self._handlers[logger_name] = handler
+
+    def emit(self, record):
+        handler = self._handlers.get(record.name)
+        if handler:
+            handler.handle(record)
+
+    def close(self):
+        for handler in self._handlers.values():
+            handler.close()
+        super().close()
+
+def _start_listener():
+    """Khởi động luồng ghi log nền ở lần dùng đầu tiên."""
+    global _queue, _router, _listener
+    _queue = queue.Queue(maxsize=QUEUE_MAX_RECORDS)
+    _router = _ProjectRouter()
+    _listener = QueueListener(_queue, _router)
+    _listener.start()
+    atexit.register(shutdown)
+
+def shutdown():
+    """Ghi nốt các bản ghi còn trong hàng đợi và đóng các file log."""
+    global _listener
+    if _listener:
+        _listener.stop()
+        _router.close()
+        _listener = None
+
 def setup_logger(project_name: str):
-    """Thiết lập logger để ghi vào file log riêng cho từng dự án."""
-    log_file = get_log_file_path(project_name)
-    
-    # Cấu hình logger
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s [%(levelname)s] - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, mode='a', encoding='utf-8'),
-        ]
-    )
-    return logging.getLogger(project_name)
+    """
+    Trả về logger riêng của một dự án. Mỗi dự án chỉ có một logger được cache,
+    việc ghi file diễn ra trên một luồng nền để không chặn luồng chính.
+    """
+    logger = _LOGGERS.get(project_name)
+    if logger:
+        return logger
+
+    with _lock:
+        if project_name in _LOGGERS:
+            return _LOGGERS[project_name]
+
+        # Thư mục log chỉ được tạo ở lần ghi log đầu tiên, không phải lúc import
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        if _listener is None:
+            _start_listener()
+
+        logger = logging.getLogger(f"shacnify.project.{project_name}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        _router.add_project(logger.name, project_name)
+        logger.addHandler(_BlockingQueueHandler(_queue))
+
+        _LOGGERS[project_name] = logger
+        return logger
 
 def get_active_project_name():
     """Lấy tên dự án từ thư mục làm việc hiện tại."""
     return Path.cwd().name
 
-# Tạo một logger mặc định khi module được import
-logger = setup_logger(get_active_project_name())
\ No newline at end of file
+def get_logger():
+    """Trả về logger của dự án hiện tại, tạo nó ở lần gọi đầu tiên."""
+    return setup_logger(get_active_project_name())
+
+def __getattr__(name):
+    # Giữ tương thích với `from shacnify.logger import logger`
+    if name == "logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
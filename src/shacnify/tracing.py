@@ -0,0 +1,227 @@
+# src/shacnify/tracing.py
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    # Windows không có module resource: span chỉ ghi thời gian thực
+    resource = None
+
+# Tracing được bật bởi --trace hoặc khi một lần chạy được ghi vào thống kê;
+# khi tắt, span() gần như không tốn gì
+_enabled = False
+_spans = []
+_lock = threading.Lock()
+_origin = time.perf_counter()
+
+# Số dòng tối đa trong bảng tóm tắt
+SUMMARY_ROWS = 15
+
+def _rss_to_kb(value):
+    # ru_maxrss tính bằng KB trên Linux, nhưng bằng byte trên macOS
+    return value // 1024 if sys.platform == "darwin" else value
+
+def _usage():
+    """(CPU của các tiến trình con, CPU của chính shacnify, max RSS của tiến trình con tính bằng KB)."""
+    if resource is None:
+        return 0.0, 0.0, 0
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    return children.ru_utime + children.ru_stime, own.ru_utime + own.ru_stime, _rss_to_kb(children.ru_maxrss)
+
+class _Span:
+    """
+    Một khoảng thời gian được đo: thời gian thực, CPU của tiến trình con và max RSS.
+    CPU của tiến trình con là chênh lệch rusage trong suốt span, nên khi nhiều lệnh
+    chạy song song, nó bao gồm cả các tiến trình con khác kết thúc trong cùng khoảng đó.
+    """
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self._child_cpu, self._own_cpu, _ = _usage()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        child_cpu, own_cpu, max_rss = _usage()
+        thread = threading.current_thread()
+        record = {
+            "name": self.name,
+            "cat": self.category,
+            "start": self._start - _origin,
+            "duration": end - self._start,
+            "tid": thread.ident,
+            "thread": thread.name,
+            "child_cpu": child_cpu - self._child_cpu,
+            "own_cpu": own_cpu - self._own_cpu,
+            "child_max_rss_kb": max_rss,
+            "args": dict(self.args, error=exc_type.__name__) if exc_type else self.args,
+        }
+        with _lock:
+            _spans.append(record)
+        return False
+
+    def set(self, **args):
+        """Gắn thêm thông tin vào span (vd. mã thoát của lệnh)."""
+        self.args.update(args)
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+_NOOP = _NoopSpan()
+
+def enable():
+    global _enabled
+    _enabled = True
+
+def is_enabled():
+    return _enabled
+
+def span(name, category="step", **args):
+    """Dùng với `with tracing.span(...)`: ghi lại một span nếu tracing đang bật."""
+    if not _enabled:
+        return _NOOP
+    return _Span(name, category, args)
+
+def mark(name, category="cache", **args):
+    """Ghi một sự kiện tức thời (không có thời lượng), vd. cache hit/miss."""
+    if not _enabled:
+        return
+    thread = threading.current_thread()
+    with _lock:
+        _spans.append({
+            "name": name, "cat": category, "start": time.perf_counter() - _origin, "duration": None,
+            "tid": thread.ident, "thread": thread.name, "args": args,
+        })
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def spans():
+    with _lock:
+        return list(_spans)
+
+def spans_since(start):
+    """Các span được ghi từ vị trí `start` (xem `span_count`), không chép lại phần trước đó."""
+    with _lock:
+        return _spans[start:]
+
+def take_spans(start=0):
+    """
+    Lấy ra các span từ vị trí `start` và bỏ chúng khỏi bộ nhớ,
+    để một tiến trình sống lâu (`shacnify serve`) không giữ span của mọi yêu cầu.
+    """
+    global _spans
+    with _lock:
+        if start == 0:
+            taken, _spans = _spans, []
+        else:
+            taken = _spans[start:]
+            del _spans[start:]
+    return taken
+
+def span_count():
+    with _lock:
+        return len(_spans)
+
+def export_chrome_trace(path):
+    """Ghi các span ra file JSON theo định dạng trace-event của Chrome (mở bằng chrome://tracing hoặc Perfetto)."""
+    pid = os.getpid()
+    events = []
+    threads = {}
+    for record in spans():
+        threads.setdefault(record["tid"], record["thread"])
+        if record["duration"] is None:
+            events.append({
+                "name": record["name"], "cat": record["cat"], "ph": "i", "s": "t",
+                "ts": round(record["start"] * 1_000_000), "pid": pid, "tid": record["tid"], "args": record["args"],
+            })
+            continue
+        events.append({
+            "name": record["name"],
+            "cat": record["cat"],
+            "ph": "X",
+            "ts": round(record["start"] * 1_000_000),
+            "dur": round(record["duration"] * 1_000_000),
+            "pid": pid,
+            "tid": record["tid"],
+            "args": {
+                **record["args"],
+                "child_cpu_s": round(record["child_cpu"], 4),
+                "own_cpu_s": round(record["own_cpu"], 4),
+                "child_max_rss_kb": record["child_max_rss_kb"],
+            },
+        })
+    for tid, name in threads.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+def summarize():
+    """Gộp các span theo (loại, tên). Trả về danh sách dict, span tốn thời gian nhất trước."""
+    groups = {}
+    for record in spans():
+        if record["duration"] is None:
+            continue
+        key = (record["cat"], record["name"])
+        group = groups.setdefault(key, {
+            "cat": record["cat"], "name": record["name"], "count": 0,
+            "duration": 0.0, "child_cpu": 0.0, "child_max_rss_kb": 0,
+        })
+        group["count"] += 1
+        group["duration"] += record["duration"]
+        group["child_cpu"] += record["child_cpu"]
+        group["child_max_rss_kb"] = max(group["child_max_rss_kb"], record["child_max_rss_kb"])
+    return sorted(groups.values(), key=lambda g: g["duration"], reverse=True)
+
+def print_summary():
+    """In bảng tóm tắt các span tốn thời gian nhất."""
+    from rich.console import Console
+    from rich.table import Table
+    from .i18n.translator import t
+
+    rows = summarize()
+    if not rows:
+        return
+    table = Table(title=f"[bold cyan]{t('trace_summary_title')}[/bold cyan]")
+    table.add_column(t('trace_span'), style="magenta", overflow="fold")
+    table.add_column(t('trace_category'), style="dim")
+    table.add_column(t('trace_count'), justify="right")
+    table.add_column(t('trace_wall_time'), justify="right", style="yellow")
+    table.add_column(t('trace_child_cpu'), justify="right")
+    table.add_column(t('trace_max_rss'), justify="right")
+    for row in rows[:SUMMARY_ROWS]:
+        table.add_row(
+            row["name"], row["cat"], str(row["count"]),
+            f"{row['duration']:.3f}s", f"{row['child_cpu']:.3f}s",
+            f"{row['child_max_rss_kb'] / 1024:.1f} MB" if row["child_max_rss_kb"] else "-",
+        )
+    Console().print(table)
+
+def finish(path=None):
+    """Kết thúc một lần chạy có tracing: in bảng tóm tắt và xuất file trace nếu cần."""
+    if not _enabled:
+        return
+    print_summary()
+    if path:
+        export_chrome_trace(path)
+        from .i18n.translator import t
+        from rich.console import Console
+        Console().print(f"[dim]{t('trace_written', path=path)}[/dim]")
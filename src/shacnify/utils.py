@@ -1,57 +1,287 @@
 # src/shacnify/utils.py
+import os
+import random
+import shlex
+import shutil
+import signal
 import subprocess
+import sys
+import threading
+import time
+from collections import deque
 from pathlib import Path
 from rich.console import Console
-from .logger import setup_logger, get_log_file_path 
+from .logger import setup_logger, get_log_file_path
+from .i18n.translator import t
+from .core.config_manager import get_config_value
+from . import tracing
 
 console = Console()
 
-def run_command(command, cwd=None, interactive=False):
-    """Chạy một lệnh shell và ghi lại lỗi nếu có."""
+# Số dòng output cuối cùng được giữ lại để đưa vào báo cáo lỗi
+ERROR_TAIL_LINES = 50
+
+# Chính sách mặc định khi chạy lệnh, có thể đổi qua config:
+# command_timeout_seconds (0 = không giới hạn), command_retries, retry_backoff_seconds
+DEFAULT_COMMAND_TIMEOUT = 900
+DEFAULT_COMMAND_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 2
+# Thời gian chờ giữa SIGTERM và SIGKILL khi dừng một nhóm tiến trình
+KILL_GRACE_SECONDS = 5
+# Mã thoát khi lệnh bị ngắt bằng Ctrl+C: không thử lại
+_CANCELLED_CODES = (130, -signal.SIGINT)
+
+# Nếu lệnh dạng chuỗi chứa các ký tự này thì vẫn cần shell để chạy đúng
+_SHELL_METACHARS = set("|&;<>()$`*?[]{}~!")
+
+# Trong daemon (`shacnify serve`), tiến trình con không được gắn thẳng vào terminal của daemon:
+# output phải đi qua sys.stdout để được chuyển về client
+_interactive_allowed = True
+
+def set_interactive_allowed(allowed):
+    global _interactive_allowed
+    _interactive_allowed = allowed
+
+def _prepare_command(command):
+    """
+    Chuyển lệnh thành argv để chạy không qua shell khi có thể.
+    Trả về (args, use_shell, chuỗi hiển thị).
+    """
+    if isinstance(command, (list, tuple)):
+        args = [str(part) for part in command]
+        display = shlex.join(args)
+    elif any(ch in _SHELL_METACHARS for ch in command):
+        return command, True, command
+    else:
+        args = shlex.split(command, posix=os.name != "nt")
+        display = command
+
+    # Tìm đường dẫn đầy đủ (vd. npm.cmd trên Windows) vì không có shell để làm việc đó
+    executable = shutil.which(args[0])
+    if executable:
+        args[0] = executable
+    return args, False, display
+
+def _pump(stream, label, current_logger, tail, status):
+    """Đọc từng dòng của một pipe, ghi vào log và chỉ giữ lại phần đuôi."""
+    for line in iter(stream.readline, ''):
+        line = line.rstrip()
+        if not line:
+            continue
+        current_logger.info(f"[{label}] {line}")
+        tail.append(f"[{label}] {line}")
+        if status is not None:
+            status.update(f"[dim]{line[:120]}[/dim]")
+    stream.close()
+
+def _group_options(detach):
+    """Tùy chọn Popen để tiến trình con (và mọi tiến trình nó sinh ra) nằm trong một nhóm riêng."""
+    if not detach:
+        return {}
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+def _terminate(process, detached):
+    """Dừng tiến trình cùng các tiến trình con của nó: SIGTERM cho cả nhóm, sau thời gian chờ thì SIGKILL."""
+    if os.name == "nt":
+        if detached:
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            process.kill()
+        process.wait()
+        return
+
+    def signal_all(sig):
+        try:
+            if detached:
+                os.killpg(process.pid, sig)
+            else:
+                process.send_signal(sig)
+        except ProcessLookupError:
+            pass
+
+    signal_all(signal.SIGTERM)
+    try:
+        process.wait(timeout=KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        pass
+    # Tiến trình chính có thể đã thoát nhưng các tiến trình con của nó (vd. npm -> node) vẫn còn
+    signal_all(signal.SIGKILL)
+    process.wait()
+
+def _wait(process, timeout, detached):
+    """Chờ tiến trình kết thúc. Trả về (mã thoát, có bị quá thời gian không)."""
+    try:
+        return process.wait(timeout=timeout), False
+    except subprocess.TimeoutExpired:
+        _terminate(process, detached)
+        return process.returncode, True
+    except KeyboardInterrupt:
+        # Ctrl+C: không để lại tiến trình npm mồ côi
+        _terminate(process, detached)
+        raise
+
+def _stream_process(args, use_shell, cwd, current_logger, status, timeout):
+    """Chạy tiến trình và stream stdout/stderr vào log. Trả về (mã thoát, các dòng cuối, có bị quá thời gian không)."""
+    tail = deque(maxlen=ERROR_TAIL_LINES)
+    process = subprocess.Popen(
+        args, shell=use_shell, cwd=cwd,
+        stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, encoding='utf-8', errors='replace', bufsize=1,
+        **_group_options(True),
+    )
+    readers = [
+        threading.Thread(target=_pump, args=(process.stdout, "stdout", current_logger, tail, status), daemon=True),
+        threading.Thread(target=_pump, args=(process.stderr, "stderr", current_logger, tail, status), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    returncode, timed_out = _wait(process, timeout, True)
+    for reader in readers:
+        # Một tiến trình tự tách khỏi nhóm vẫn có thể giữ pipe: không chờ nó mãi
+        reader.join(KILL_GRACE_SECONDS if timed_out else None)
+    return returncode, list(tail), timed_out
+
+def _run_attached(args, use_shell, cwd, timeout, detach):
+    """Chạy tiến trình dùng chung stdin/stdout với shacnify. Trả về (mã thoát, có bị quá thời gian không)."""
+    process = subprocess.Popen(args, shell=use_shell, cwd=cwd, **_group_options(detach))
+    return _wait(process, timeout, detach)
+
+def command_policy(network=False):
+    """
+    Chính sách chạy lệnh theo cấu hình: (timeout tính bằng giây hoặc None, số lần thử lại, backoff tính bằng giây).
+    Chỉ lệnh cần mạng (cài package, shadcn add) mới được thử lại.
+    """
+    timeout = get_config_value("command_timeout_seconds", DEFAULT_COMMAND_TIMEOUT)
+    retries = get_config_value("command_retries", DEFAULT_COMMAND_RETRIES) if network else 0
+    backoff = get_config_value("retry_backoff_seconds", DEFAULT_RETRY_BACKOFF)
+    return (timeout if timeout > 0 else None), max(retries, 0), max(backoff, 0)
+
+def _backoff_delay(backoff, attempt):
+    """Exponential backoff có jitter, để nhiều tiến trình cùng lỗi không thử lại cùng một lúc."""
+    return backoff * 2 ** (attempt - 2) * random.uniform(0.5, 1.5)
+
+def run_command(command, cwd=None, interactive=False, live=False, network=False, timeout=None, retries=None):
+    """
+    Chạy một lệnh và ghi lại lỗi nếu có.
+    Ở chế độ không tương tác, output được stream từng dòng vào file log thay vì giữ toàn bộ trong bộ nhớ;
+    với live=True, dòng output mới nhất được hiển thị trực tiếp trên console.
+    Lệnh bị dừng (cùng mọi tiến trình con) khi quá `timeout` giây hoặc khi người dùng nhấn Ctrl+C.
+    Với network=True, lệnh thất bại được thử lại sau một khoảng backoff có jitter.
+    Mặc định của timeout và số lần thử lại lấy từ cấu hình (xem `command_policy`).
+    """
+    if interactive and not _interactive_allowed:
+        interactive, live = False, True
     project_name = Path(cwd).name if cwd else Path.cwd().name
     current_logger = setup_logger(project_name)
+    args, use_shell, display = _prepare_command(command)
+
+    default_timeout, default_retries, backoff = command_policy(network)
+    timeout = default_timeout if timeout is None else (timeout or None)
+    retries = default_retries if retries is None else retries
+    # Lệnh tương tác gắn với terminal phải ở trong nhóm tiến trình của terminal để nhận phím bấm,
+    # và có thể đang chờ người dùng trả lời nên không bị giới hạn thời gian.
+    # Khi không có terminal (CI), không ai trả lời được câu hỏi nên timeout vẫn được áp dụng.
+    attached_to_terminal = interactive and sys.stdin is not None and sys.stdin.isatty()
+    if attached_to_terminal:
+        timeout = None
+    attempts = retries + 1
     
     current_logger.info(f"--- Running Command ---")
-    current_logger.info(f"Command: {command}")
+    current_logger.info(f"Command: {display}")
     current_logger.info(f"Directory: {cwd or Path.cwd()}")
-    
-    try:
-        if interactive:
-            subprocess.run(command, shell=True, cwd=cwd, check=True)
-        else:
-            process = subprocess.run(
-                command, shell=True, cwd=cwd, check=True,
-                capture_output=True, text=True, encoding='utf-8'
-            )
-    except subprocess.CalledProcessError as e:
-        stderr_output = e.stderr if hasattr(e, 'stderr') and e.stderr else "Không có output lỗi chi tiết."
+    current_logger.info(f"Policy: timeout={f'{timeout}s' if timeout else 'none'}, retries={retries}, backoff={backoff}s")
+
+    for attempt in range(1, attempts + 1):
+        if attempt > 1:
+            delay = _backoff_delay(backoff, attempt)
+            current_logger.warning(f"Retrying in {delay:.1f}s (attempt {attempt}/{attempts})")
+            console.print(f"[yellow]   {t('command_retrying', attempt=attempt, attempts=attempts, delay=f'{delay:.1f}')}[/yellow]")
+            time.sleep(delay)
+
+        try:
+            with tracing.span(display, "subprocess", attempt=attempt) as span:
+                if interactive:
+                    returncode, timed_out = _run_attached(args, use_shell, cwd, timeout, detach=not attached_to_terminal)
+                    tail = []
+                elif live:
+                    with console.status(f"[dim]{display}[/dim]", spinner="dots") as status:
+                        returncode, tail, timed_out = _stream_process(args, use_shell, cwd, current_logger, status, timeout)
+                else:
+                    returncode, tail, timed_out = _stream_process(args, use_shell, cwd, current_logger, None, timeout)
+                span.set(returncode=returncode, timed_out=timed_out)
+        except FileNotFoundError:
+            current_logger.error(f"Command not found: {display.split()[0]}")
+            return False
+        except KeyboardInterrupt:
+            current_logger.warning(f"Cancelled by user (attempt {attempt}/{attempts}); process group terminated")
+            raise
+
+        if returncode == 0 and not timed_out:
+            current_logger.info(f"--- Command Succeeded (attempt {attempt}/{attempts}) ---")
+            return True
+
+        tail_output = "\n".join(tail) if tail else t('command_no_output')
         error_message = (
-            f"--- Command Failed ---\n"
-            f"Command: {command}\n"
-            f"Return Code: {e.returncode}\n"
-            f"Stderr:\n{stderr_output.strip()}"
+            f"--- Command {'Timed Out' if timed_out else 'Failed'} (attempt {attempt}/{attempts}) ---\n"
+            f"Command: {display}\n"
+            f"{f'Timeout: {timeout}s, process group terminated' if timed_out else f'Return Code: {returncode}'}\n"
+            f"Output (last {ERROR_TAIL_LINES} lines):\n{tail_output}"
         )
         current_logger.error(error_message)
-        
-        # 🔽 Sử dụng hàm mới để lấy đường dẫn file log
-        log_path = get_log_file_path(project_name)
-        console.print(f"[red]   Lỗi! Chi tiết đã được ghi vào file log:[/red]")
-        console.print(f"[dim]{log_path}[/dim]")
-        return False
+        if timed_out:
+            console.print(f"[red]   {t('command_timed_out', seconds=timeout)}[/red]")
+        if returncode in _CANCELLED_CODES:
+            break
+
+    # 🔽 Sử dụng hàm mới để lấy đường dẫn file log
+    log_path = get_log_file_path(project_name)
+    console.print(f"[red]   {t('command_failed_see_log')}[/red]")
+    console.print(f"[dim]{log_path}[/dim]")
+    return False
+
+def get_command_output(command, cwd=None):
+    """Chạy một lệnh ngắn và trả về stdout (đã strip), hoặc None nếu lệnh thất bại hoặc quá thời gian."""
+    args, use_shell, display = _prepare_command(command)
+    current_logger = setup_logger(Path(cwd).name if cwd else Path.cwd().name)
+    current_logger.info(f"Command (capture): {display}")
+    timeout, _, _ = command_policy()
+    try:
+        with tracing.span(display, "subprocess") as span:
+            process = subprocess.Popen(
+                args, shell=use_shell, cwd=cwd, stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8', errors='replace',
+                **_group_options(True),
+            )
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                _terminate(process, True)
+                span.set(timed_out=True)
+                current_logger.error(f"Command timed out after {timeout}s: {display}")
+                return None
+            except KeyboardInterrupt:
+                _terminate(process, True)
+                raise
+            span.set(returncode=process.returncode)
     except FileNotFoundError:
-        current_logger.error(f"Command not found: {command.split()[0]}")
-        return False
-        
-    current_logger.info("--- Command Succeeded ---")
-    return True
+        current_logger.error(f"Command not found: {display.split()[0]}")
+        return None
+    if process.returncode != 0:
+        current_logger.error(f"Command failed ({process.returncode}): {display}\n{stderr.strip()}")
+        return None
+    return stdout.strip()
 
 def write_file(path, content):
     """Ghi nội dung vào một file."""
     try:
         p = Path(path)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(content, encoding='utf-8')
+        with tracing.span(str(p), "fs"):
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text(content, encoding='utf-8')
         return True
     except Exception as e:
-        console.print(f"[bold red]❌ Không thể ghi file {path}: {e}[/bold red]")
-        return False
\ No newline at end of file
+        console.print(f"[bold red]❌ {t('write_file_failed', path=path, error=e)}[/bold red]")
+        return False